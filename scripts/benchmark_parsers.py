@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos backends de parsing HTML usados pelo scraper.
+
+Mede, para cada página salva, o tempo de parse com cada backend disponível
+(html.parser, lxml, html5lib e, como referência, selectolax) e o tempo da
+extração de metadados (parse_article_metadata) com o backend configurado.
+
+Uso:
+    python benchmark_parsers.py pagina.html dir/ # arquivos e/ou diretórios (*.html, *.htm)
+    NEWS_HTML_PARSER=html.parser python benchmark_parsers.py dir/
+
+Não há páginas versionadas (conteúdo de terceiros): salve algumas páginas de artigos
+das fontes (ex.: curl -o pagina.html <url>) e passe os caminhos.
+"""
+
+import os
+import sys
+import glob
+import time
+import statistics
+from typing import Callable, Dict, List
+
+from bs4 import BeautifulSoup
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(script_dir)
+
+REPEAT = int(os.getenv('BENCH_REPEAT', '5'))
+
+
+def collect_pages(paths: List[str]) -> List[str]:
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            for ext in ('*.html', '*.htm'):
+                files.extend(glob.glob(os.path.join(path, '**', ext), recursive=True))
+        elif os.path.isfile(path):
+            files.append(path)
+    return sorted(set(files))
+
+
+def available_backends() -> Dict[str, Callable[[bytes], object]]:
+    backends: Dict[str, Callable[[bytes], object]] = {
+        'html.parser': lambda data: BeautifulSoup(data, 'html.parser'),
+    }
+    for name in ('lxml', 'html5lib'):
+        try:
+            __import__(name)
+            backends[name] = lambda data, name=name: BeautifulSoup(data, name)
+        except ImportError:
+            pass
+    try:
+        from selectolax.parser import HTMLParser  # type: ignore
+        # Apenas referência: não expõe a API do BeautifulSoup usada pelos scrapers
+        backends['selectolax (ref)'] = lambda data: HTMLParser(data)
+    except ImportError:
+        pass
+    return backends
+
+
+def timed(fn: Callable[[], object]) -> float:
+    samples = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    paths = sys.argv[1:]
+    if not paths:
+        print("Informe as páginas a medir: não há páginas de exemplo versionadas (conteúdo de terceiros).")
+        print("Uso: python benchmark_parsers.py [arquivos ou diretórios com páginas .html salvas]")
+        print("Ex.: curl -o /tmp/paginas/artigo.html <url de um artigo> && python benchmark_parsers.py /tmp/paginas")
+        sys.exit(2)
+    pages = collect_pages(paths)
+    if not pages:
+        print(f"Nenhuma página HTML encontrada em: {', '.join(paths)}")
+        print("Uso: python benchmark_parsers.py [arquivos ou diretórios com páginas .html salvas]")
+        sys.exit(1)
+
+    from news_scraper import ChristianNewsScraper, HTML_PARSER, make_soup
+
+    scraper = ChristianNewsScraper.__new__(ChristianNewsScraper)  # sem sessão/Supabase: só os métodos de parsing
+    backends = available_backends()
+    names = list(backends) + [f'metadata ({HTML_PARSER})']
+    totals = {name: 0.0 for name in names}
+
+    print(f"{len(pages)} página(s), mediana de {REPEAT} repetições, tempos em ms\n")
+    header = f"{'página':<40} {'KB':>7} " + ' '.join(f"{n:>18}" for n in names)
+    print(header)
+    print('-' * len(header))
+    for page in pages:
+        with open(page, 'rb') as f:
+            data = f.read()
+        row = []
+        for name, parse in backends.items():
+            elapsed = timed(lambda: parse(data))
+            totals[name] += elapsed
+            row.append(elapsed)
+        meta_name = names[-1]
+        elapsed = timed(lambda: scraper.parse_article_metadata(make_soup(data), 'https://example.com/'))
+        totals[meta_name] += elapsed
+        row.append(elapsed)
+        label = os.path.relpath(page)[-40:]
+        print(f"{label:<40} {len(data) / 1024:>7.1f} " + ' '.join(f"{t * 1000:>18.2f}" for t in row))
+
+    print('-' * len(header))
+    print(f"{'média por página':<40} {'':>7} " + ' '.join(f"{totals[n] / len(pages) * 1000:>18.2f}" for n in names))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Benchmark offline do scraper com respostas HTTP gravadas.
+
+Grava uma vez (rede real) os feeds e páginas de artigos de todas as fontes de
+scrape_all_sources e depois repete a coleta contra essas gravações, sem rede,
+através de um adapter de transporte do requests montado na sessão do scraper.
+Para a execução completa e para cada etapa do pipeline, mede tempo de relógio,
+tempo de CPU, pico de memória (tracemalloc) e número de requisições.
+
+Uso:
+    python benchmark_scraper.py --record                  # grava em scripts/fixtures/http/
+    python benchmark_scraper.py                           # repete a partir das gravações
+    python benchmark_scraper.py --repeat 3 --sources "Gospel Prime,Guiame"
+    python benchmark_scraper.py --json resultado.json     # também salva os números em JSON
+
+As gravações contêm conteúdo de terceiros e não são versionadas (.gitignore).
+No modo de repetição, URLs não gravadas respondem 404 e são listadas no final.
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+import statistics
+import tracemalloc
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(script_dir)
+
+DEFAULT_FIXTURES_DIR = os.path.join(script_dir, 'fixtures', 'http')
+# Cabeçalhos que valem ser gravados (o corpo é salvo já descomprimido)
+KEPT_HEADERS = ('Content-Type', 'Location', 'ETag', 'Last-Modified', 'Retry-After')
+
+
+def fixture_key(url: str) -> str:
+    from news_scraper import canonicalize_url
+    return canonicalize_url(url)
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Adapter real que guarda cada resposta (status, cabeçalhos e corpo completo) no diretório de fixtures."""
+
+    def __init__(self, fixtures_dir: str, **kwargs):
+        super().__init__(**kwargs)
+        self.fixtures_dir = fixtures_dir
+        self.index: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(fixtures_dir, 'bodies'), exist_ok=True)
+
+    def send(self, request, stream=False, **kwargs):
+        response = super().send(request, stream=stream, **kwargs)
+        # Lê o corpo inteiro mesmo em streaming: a repetição decide quanto consumir
+        body = response.content or b''
+        key = fixture_key(request.url)
+        body_name = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        with open(os.path.join(self.fixtures_dir, 'bodies', body_name), 'wb') as f:
+            f.write(body)
+        with self._lock:
+            self.index[key] = {
+                'status': response.status_code,
+                'headers': {h: response.headers[h] for h in KEPT_HEADERS if h in response.headers},
+                'body': body_name,
+            }
+        return response
+
+    def save(self) -> str:
+        path = os.path.join(self.fixtures_dir, 'index.json')
+        with self._lock:
+            payload = json.dumps(self.index, ensure_ascii=False, indent=1, sort_keys=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        return path
+
+
+class ReplayAdapter(BaseAdapter):
+    """Responde a partir das gravações, sem rede; URLs não gravadas viram 404."""
+
+    def __init__(self, fixtures_dir: str):
+        super().__init__()
+        self.fixtures_dir = fixtures_dir
+        with open(os.path.join(fixtures_dir, 'index.json'), 'r', encoding='utf-8') as f:
+            self.index: Dict[str, Dict] = json.load(f)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.missing: List[str] = []
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        key = fixture_key(request.url)
+        entry = self.index.get(key)
+        with self._lock:
+            self.requests += 1
+            if entry is None:
+                self.missing.append(request.url)
+        body = b''
+        if entry is not None:
+            with open(os.path.join(self.fixtures_dir, 'bodies', entry['body']), 'rb') as f:
+                body = f.read()
+        response = requests.Response()
+        response.status_code = entry['status'] if entry else 404
+        response.headers = CaseInsensitiveDict(entry['headers'] if entry else {})
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = io.BytesIO(body)
+        response._content = body
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        pass
+
+
+class StageProbe:
+    """Fatia relógio, CPU, pico de memória e requisições entre registros consecutivos de etapa
+    (ChristianNewsScraper._record_stage): cada etapa recebe o que aconteceu desde a anterior."""
+
+    def __init__(self, request_counter, trace_memory: bool):
+        self.request_counter = request_counter
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._last = self._snapshot()
+
+    def _snapshot(self):
+        return time.perf_counter(), time.process_time(), self.request_counter()
+
+    def mark(self, stage: str) -> None:
+        now = self._snapshot()
+        st = self.stages.setdefault(stage, {'wall': 0.0, 'cpu': 0.0, 'requests': 0, 'peak_mb': 0.0})
+        st['wall'] += now[0] - self._last[0]
+        st['cpu'] += now[1] - self._last[1]
+        st['requests'] += now[2] - self._last[2]
+        if self.trace_memory:
+            st['peak_mb'] = max(st['peak_mb'], tracemalloc.get_traced_memory()[1] / 1024 / 1024)
+            tracemalloc.reset_peak()
+        self._last = now
+
+
+def run_once(adapter, trace_memory: bool) -> Dict:
+    from news_scraper import ChristianNewsScraper
+
+    scraper = ChristianNewsScraper()
+    scraper.session.mount('https://', adapter)
+    scraper.session.mount('http://', adapter)
+    counter = (lambda: adapter.requests) if isinstance(adapter, ReplayAdapter) else (
+        lambda: sum(int(st['requests']) for st in scraper.session.stats().values()))
+
+    if trace_memory:
+        tracemalloc.start()
+    probe = StageProbe(counter, trace_memory)
+    record_stage = scraper._record_stage
+
+    def _record_and_probe(stage, count_in, count_out, seconds=None, **counters):
+        record_stage(stage, count_in, count_out, seconds, **counters)
+        probe.mark(stage)
+
+    scraper._record_stage = _record_and_probe
+    wall_started, cpu_started = time.perf_counter(), time.process_time()
+    try:
+        articles = scraper.scrape_all_sources()
+    finally:
+        wall = time.perf_counter() - wall_started
+        cpu = time.process_time() - cpu_started
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024 if trace_memory else 0.0
+        if trace_memory:
+            tracemalloc.stop()
+
+    stages = {}
+    for stage, st in scraper.pipeline_stats.items():
+        stages[stage] = {'in': st['in'], 'out': st['out'], **probe.stages.get(stage, {})}
+    return {
+        'wall': wall, 'cpu': cpu, 'peak_mb': max([peak_mb] + [s['peak_mb'] for s in probe.stages.values()]),
+        'requests': counter(), 'articles': len(articles), 'stages': stages,
+        'sources': scraper.source_reports,
+    }
+
+
+def print_run(result: Dict) -> None:
+    header = f"{'etapa':<12} {'in':>6} {'out':>6} {'relógio s':>10} {'CPU s':>8} {'pico MB':>8} {'req':>6}"
+    print(header)
+    print('-' * len(header))
+    for stage, st in result['stages'].items():
+        print(f"{stage:<12} {st['in']:>6} {st['out']:>6} {st.get('wall', 0):>10.3f} {st.get('cpu', 0):>8.3f} "
+              f"{st.get('peak_mb', 0):>8.1f} {st.get('requests', 0):>6}")
+    print('-' * len(header))
+    print(f"{'total':<12} {'':>6} {result['articles']:>6} {result['wall']:>10.3f} {result['cpu']:>8.3f} "
+          f"{result['peak_mb']:>8.1f} {result['requests']:>6}")
+
+    slowest = sorted(result['sources'].items(), key=lambda kv: kv[1].get('seconds', 0), reverse=True)[:10]
+    if slowest:
+        print("\nFontes mais lentas:")
+        for name, st in slowest:
+            print(f"  • {name}: {st.get('seconds', 0):.2f}s, {st.get('requests', 0)} req, "
+                  f"{st.get('articles', 0)} artigos ({st.get('status')})")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Benchmark offline do scrape_all_sources com respostas gravadas.')
+    parser.add_argument('--record', action='store_true', help='grava as respostas da rede real em --fixtures')
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES_DIR, help='diretório das gravações')
+    parser.add_argument('--sources', help='limita as fontes (mesmo formato de NEWS_SOURCES_ALLOWLIST)')
+    parser.add_argument('--repeat', type=int, default=1, help='repetições no modo de repetição (padrão 1)')
+    parser.add_argument('--max-age-hours', type=int, default=24 * 365,
+                        help='janela de recência ao gravar e repetir: as gravações envelhecem (padrão 1 ano)')
+    parser.add_argument('--no-tracemalloc', action='store_true',
+                        help='não mede memória (tracemalloc deixa a execução bem mais lenta)')
+    parser.add_argument('--json', help='salva os resultados em JSON')
+    args = parser.parse_args(argv)
+
+    # Execução reproduzível: sem caches/estado entre execuções nem relatório (só scrape_all_sources roda:
+    # nada vai para JSON, Supabase ou Discord)
+    os.environ.update({
+        'NEWS_HTTP_CACHE': 'false', 'NEWS_SEEN_INDEX': 'false', 'NEWS_GOOGLE_NEWS_CACHE_TTL_MIN': '0',
+        'NEWS_SOURCE_BREAKER': 'false', 'NEWS_ADAPTIVE_CADENCE': 'false', 'NEWS_RUN_REPORT': 'false',
+        'NEWS_DISCORD_NOTIFY': 'false',
+    })
+    if args.sources:
+        os.environ['NEWS_SOURCES_ALLOWLIST'] = args.sources
+    # Mesma janela ao gravar e ao repetir: senão a repetição busca páginas de itens que a gravação descartou
+    os.environ['NEWS_MAX_AGE_HOURS'] = str(args.max_age_hours)
+
+    if args.record:
+        adapter = RecordingAdapter(args.fixtures, pool_connections=64, pool_maxsize=16)
+        result = run_once(adapter, trace_memory=not args.no_tracemalloc)
+        path = adapter.save()
+        print(f"{len(adapter.index)} respostas gravadas em {path}\n")
+        print_run(result)
+        results = [result]
+    else:
+        if not os.path.exists(os.path.join(args.fixtures, 'index.json')):
+            print(f"Nenhuma gravação em {args.fixtures}. Rode antes: python benchmark_scraper.py --record")
+            sys.exit(1)
+        # Sem rede não há host a poupar: o limite de taxa só mediria sleeps
+        os.environ.setdefault('NEWS_HOST_MIN_INTERVAL', '0')
+        results = []
+        for i in range(max(1, args.repeat)):
+            adapter = ReplayAdapter(args.fixtures)
+            result = run_once(adapter, trace_memory=not args.no_tracemalloc)
+            result['missing'] = sorted(set(adapter.missing))
+            results.append(result)
+            print(f"Execução {i + 1}: {result['wall']:.2f}s relógio, {result['cpu']:.2f}s CPU, "
+                  f"{result['peak_mb']:.1f} MB pico, {result['requests']} requisições, {result['articles']} artigos")
+        print()
+        print_run(results[-1])
+        if len(results) > 1:
+            print(f"\nMediana de {len(results)} execuções: "
+                  f"{statistics.median(r['wall'] for r in results):.2f}s relógio, "
+                  f"{statistics.median(r['cpu'] for r in results):.2f}s CPU")
+        missing = results[-1]['missing']
+        if missing:
+            print(f"\n⚠️ {len(missing)} URLs sem gravação (responderam 404); regrave com --record:")
+            for url in missing[:20]:
+                print(f"  • {url}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2, default=str)
+        print(f"\nResultados salvos em {args.json}")
+
+
+if __name__ == "__main__":
+    main()
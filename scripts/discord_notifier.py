@@ -53,6 +53,17 @@ def _chunk(items: List[Dict], size: int) -> List[List[Dict]]:
     return [items[i : i + size] for i in range(0, len(items), size)]
 
 
+def _post(webhook: str, payload: Dict, rate_limiter=None) -> requests.Response:
+    if rate_limiter is not None:
+        rate_limiter.acquire(webhook)
+    return requests.post(
+        webhook,
+        data=json.dumps(payload),
+        headers={"Content-Type": "application/json"},
+        timeout=15,
+    )
+
+
 def _format_embed(item: Dict) -> Dict:
     title = item.get("title") or "Notícia"
     url = item.get("url")
@@ -94,6 +105,7 @@ def send_news_to_discord(
     chunk_size: int = 5,
     sleep_between_batches: float = 1.0,
     dry_run: bool = False,
+    rate_limiter=None,
 ) -> Dict:
     """
     Envia uma lista de notícias em embeds para um canal do Discord via Webhook.
@@ -103,6 +115,9 @@ def send_news_to_discord(
     - chunk_size: quantidade de embeds por mensagem (máx. 10 pelo Discord, usamos 5 por segurança)
     - sleep_between_batches: tempo (s) entre envios para evitar rate limit
     - dry_run: se True, não envia; apenas retorna payloads formatados
+    - rate_limiter: opcional; limitador por host do scraper (HostRateLimiter, ou qualquer objeto com
+      acquire(url) e penalize(url, retry_after)). Substitui o sleep fixo: espera só o necessário e,
+      em caso de 429, aguarda o Retry-After e reenvia o lote uma vez
     """
 
     webhook = webhook_url or os.getenv("DISCORD_WEBHOOK_URL")
@@ -125,12 +140,10 @@ def send_news_to_discord(
             continue
 
         try:
-            resp = requests.post(
-                webhook,
-                data=json.dumps(payload),
-                headers={"Content-Type": "application/json"},
-                timeout=15,
-            )
+            resp = _post(webhook, payload, rate_limiter)
+            if resp.status_code == 429 and rate_limiter is not None:
+                rate_limiter.penalize(webhook, resp.headers.get("Retry-After"))
+                resp = _post(webhook, payload, rate_limiter)
             ok = 200 <= resp.status_code < 300
             results["responses"].append({
                 "status": resp.status_code,
@@ -145,8 +158,8 @@ def send_news_to_discord(
             results["responses"].append({"error": str(e)})
             results["failed"] += 1
 
-        # intervalo entre lotes para evitar rate limits
-        if i < len(batches) - 1 and sleep_between_batches > 0:
+        # intervalo entre lotes para evitar rate limits (com limitador, a espera fica a cargo dele)
+        if rate_limiter is None and i < len(batches) - 1 and sleep_between_batches > 0:
             time.sleep(sleep_between_batches)
 
     return results
@@ -2,6 +2,9 @@
 """
 News Scheduler - Automatic News Refresh System
 Runs the news scraper at regular intervals to keep content fresh
+
+By default runs are executed in-process, reusing one scraper instance across runs;
+set NEWS_SCHEDULER_MODE=subprocess to spawn `python news_scraper.py` for each run instead.
 """
 
 import os
@@ -9,10 +12,10 @@ import sys
 import time
 import schedule
 import subprocess
+import traceback
 from datetime import datetime
 import json
 import logging
-import shutil
 
 # Add the scripts directory to Python path
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -35,10 +38,60 @@ class NewsScheduler:
         self.script_path = os.path.join(script_dir, 'news_scraper.py')
         self.project_root = os.path.dirname(script_dir)
         self.news_file = os.path.join(self.project_root, 'src', 'data', 'christian_news.json')
-        self.public_news_file = os.path.join(self.project_root, 'public', 'data', 'christian_news.json')
+        # inprocess (default): one ChristianNewsScraper kept alive across runs (HTTP session, caches
+        # and Supabase client are reused); subprocess: a fresh `python news_scraper.py` per run
+        self.mode = os.getenv('NEWS_SCHEDULER_MODE', 'inprocess').strip().lower()
+        self._scraper = None
+        # Scheduled runs due within this window of the last started run are coalesced into it
+        try:
+            self.coalesce_window = float(os.getenv('NEWS_SCHEDULER_COALESCE_MIN', '15')) * 60
+        except Exception:
+            self.coalesce_window = 15 * 60
+        # When another process holds the run lock: skip the run, or queue it and retry every minute
+        self.on_busy = os.getenv('NEWS_SCHEDULER_ON_BUSY', 'skip').strip().lower()
+        self._last_scrape_started = None
+        self._queued = False
+
+    def _get_scraper(self):
+        """Shared scraper instance, created on first use (and again after a failed run)"""
+        if self._scraper is None:
+            from news_scraper import ChristianNewsScraper
+            self._scraper = ChristianNewsScraper()
+        return self._scraper
+
+    def _run_in_process(self, job, description):
+        """Run job(scraper) in this process, isolated so a crash cannot kill the daemon.
+        A failure is logged and drops the instance, so the next run starts from a clean state.
+        Returns None when the scraper cannot be imported (the caller falls back to a subprocess)."""
+        try:
+            scraper = self._get_scraper()
+        except ImportError as e:
+            logger.warning(f"⚠️ Scraper cannot run in-process ({e}); falling back to subprocess mode")
+            self.mode = 'subprocess'
+            return None
+        except Exception as e:
+            logger.error(f"❌ Failed to initialize the scraper for {description}: {e}")
+            return False
+        try:
+            return job(scraper)
+        except Exception as e:
+            logger.error(f"❌ {description} crashed in-process: {e}")
+            logger.debug(traceback.format_exc())
+            self._scraper = None
+            return False
 
     def cleanup_supabase(self):
-        """Run cleanup job to delete stale records (>24h) from Supabase"""
+        """Run cleanup job to delete stale records (older than NEWS_MAX_AGE_HOURS) from Supabase"""
+        if self.mode == 'inprocess':
+            logger.info("🧹 Starting Supabase cleanup (in-process)...")
+
+            def _cleanup(scraper):
+                scraper.cleanup_old_supabase_records(max_age_hours=scraper.max_age_hours)
+                logger.info(f"✅ Supabase cleanup completed: removed records older than {scraper.max_age_hours}h")
+                return True
+
+            if self._run_in_process(_cleanup, 'Supabase cleanup') is not None:
+                return
         try:
             logger.info("🧹 Starting Supabase cleanup (older than 24h)...")
             result = subprocess.run([
@@ -55,42 +108,97 @@ class NewsScheduler:
         except Exception as e:
             logger.error(f"❌ Error running Supabase cleanup: {e}")
         
+    def scheduled_scrape(self, reason='hourly'):
+        """Scheduled entry point: coalesces runs due in the same window (e.g. the hourly and
+        the 06:00/18:00 jobs) into a single scrape"""
+        if self._last_scrape_started is not None:
+            elapsed = time.time() - self._last_scrape_started
+            if elapsed < self.coalesce_window:
+                logger.info(f"⏭️ {reason} run coalesced with the run started {elapsed / 60:.0f} min ago")
+                return
+        self.run_news_scraper()
+
+    def _scraper_busy(self, holder):
+        if self.on_busy == 'queue':
+            if not self._queued:
+                logger.info(f"⏳ Another scrape is in progress ({holder}); run queued")
+            self._queued = True
+        else:
+            logger.info(f"⏭️ Another scrape is in progress ({holder}); skipping this run")
+
+    def _run_lock(self):
+        from news_scraper import RunLock, default_run_lock_path
+        return RunLock(default_run_lock_path())
+
     def run_news_scraper(self):
-        """Run the news scraper script"""
+        """Run the news scraper (in-process by default, or as a subprocess), one run at a time
+        across processes (shared lock file with news_scraper.py). The lock is held for the whole
+        run; a subprocess is told so through NEWS_RUN_LOCK_HELD and does not take it again."""
+        try:
+            lock = self._run_lock()
+        except ImportError as e:
+            logger.warning(f"⚠️ Run lock unavailable ({e}); running without overlap protection")
+            lock = None
+        if lock is not None and not lock.acquire():
+            self._scraper_busy(lock.holder())
+            return
+        self._queued = False
+        self._last_scrape_started = time.time()
+        try:
+            self._run_news_scraper(lock_held=lock is not None)
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def _run_news_scraper(self, lock_held=False):
+        if self.mode == 'inprocess':
+            logger.info("🔄 Starting scheduled news refresh (in-process)...")
+
+            def _scrape(scraper):
+                from news_scraper import run_scraper
+                return run_scraper(scraper) is not None
+
+            ok = self._run_in_process(_scrape, 'News scraper')
+            if ok is not None:
+                if ok:
+                    logger.info("✅ News scraper completed successfully")
+                    self._after_scrape()
+                else:
+                    logger.error("❌ News scraper run did not save any news data")
+                return
         try:
             logger.info("🔄 Starting scheduled news refresh...")
             
-            # Run the news scraper
+            # Run the news scraper (under our lock: the child must not try to take it)
+            env = dict(os.environ, NEWS_RUN_LOCK_HELD='1') if lock_held else None
             result = subprocess.run([
                 sys.executable, self.script_path
-            ], capture_output=True, text=True, cwd=script_dir)
+            ], capture_output=True, text=True, cwd=script_dir, env=env)
             
             if result.returncode == 0:
                 logger.info("✅ News scraper completed successfully")
-                
-                # Check if news file was updated
-                if os.path.exists(self.news_file):
-                    with open(self.news_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        article_count = data.get('total_articles', 0)
-                        sources = data.get('sources', [])
-                        logger.info(f"📰 Updated with {article_count} articles from {len(sources)} sources")
-                    
-                    # Sync to public directory for frontend consumption
-                    try:
-                        shutil.copy2(self.news_file, self.public_news_file)
-                        logger.info("🔄 Synced news data to public directory")
-                    except Exception as sync_error:
-                        logger.error(f"❌ Failed to sync to public directory: {sync_error}")
-                else:
-                    logger.warning("⚠️ News file not found after scraping")
-                    
+                self._after_scrape()
             else:
                 logger.error(f"❌ News scraper failed with return code {result.returncode}")
                 logger.error(f"Error output: {result.stderr}")
                 
         except Exception as e:
             logger.error(f"❌ Error running news scraper: {e}")
+
+    def _after_scrape(self):
+        """Log the refreshed data (the scraper writes both src/data and public/data itself)"""
+        try:
+            # Check if news file was updated
+            if os.path.exists(self.news_file):
+                with open(self.news_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    article_count = data.get('total_articles', 0)
+                    sources = data.get('sources', [])
+                    logger.info(f"📰 Updated with {article_count} articles from {len(sources)} sources")
+            else:
+                logger.warning("⚠️ News file not found after scraping")
+        except Exception as e:
+            logger.error(f"❌ Error reading news data after scraping: {e}")
     
     def check_news_freshness(self):
         """Check if news data is fresh enough"""
@@ -117,28 +225,35 @@ class NewsScheduler:
         except Exception as e:
             logger.error(f"❌ Error checking news freshness: {e}")
     
+    def register_jobs(self, scheduler):
+        """Register the scrape and cleanup jobs on a schedule.Scheduler"""
+        # Regular updates at the top of every hour (aligned to :00, not to the daemon's start time)
+        scheduler.every().hour.at(':00').do(self.scheduled_scrape, 'hourly')
+
+        # Also schedule a daily check at 6 AM and 6 PM: due at the same minute as the hourly run,
+        # so it is coalesced into it and only refreshes if the hourly run was skipped
+        scheduler.every().day.at("06:00").do(self.scheduled_scrape, '06:00')
+        scheduler.every().day.at("18:00").do(self.scheduled_scrape, '18:00')
+
+        # Schedule daily cleanup at 02:00 (server time)
+        scheduler.every().day.at("02:00").do(self.cleanup_supabase)
+
     def start_scheduler(self):
         """Start the news refresh scheduler"""
-        logger.info("📅 Schedule: Every 1 hour (scraper) + daily cleanup at 02:00")
+        logger.info("📅 Schedule: Every hour at :00 (scraper) + daily cleanup at 02:00")
         
         # Run initial check
         self.check_news_freshness()
         
-        # Schedule regular updates every 1 hour
-        schedule.every().hour.do(self.run_news_scraper)
-
-        # Also schedule a daily check at 6 AM and 6 PM
-        schedule.every().day.at("06:00").do(self.run_news_scraper)
-        schedule.every().day.at("18:00").do(self.run_news_scraper)
-
-        # Schedule daily cleanup at 02:00 (server time)
-        schedule.every().day.at("02:00").do(self.cleanup_supabase)
+        self.register_jobs(schedule.default_scheduler)
         
         logger.info("⏰ Scheduler started. Press Ctrl+C to stop.")
         
         try:
             while True:
                 schedule.run_pending()
+                if self._queued:
+                    self.run_news_scraper()
                 time.sleep(60)  # Check every minute
                 
         except KeyboardInterrupt:
@@ -6,16 +6,34 @@ Scrapes real news from reliable Christian sources in Brazil
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import json
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone, tzinfo, date as date_type
+from email.utils import parsedate_to_datetime
+import functools
 import re
-from urllib.parse import urljoin, urlparse, quote, parse_qs, unquote
+from urllib.parse import urljoin, urlparse, urlunparse, urlencode, quote, parse_qs, parse_qsl, unquote
 import logging
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 import os
 import sys
+import html
+import gzip
+import hashlib
+import random
+import unicodedata
+import sqlite3
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, wait
+try:
+    import fcntl
+except ImportError:  # Windows: RunLock usa criação exclusiva do arquivo
+    fcntl = None
+from dataclasses import dataclass, field
 
 # Add parent directory to path to import supabase config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -40,9 +58,1406 @@ except Exception as _e:
     send_news_to_discord = None  # fallback quando módulo não está disponível
     logger.warning(f"Discord notifier não pôde ser importado: {_e}")
 
+# Negocia brotli apenas quando o urllib3 consegue decodificá-lo (e só gera .br com ele disponível)
+try:
+    import brotli as _brotli
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi as _brotli
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        _brotli = None
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+
+# Backend de parsing HTML: NEWS_HTML_PARSER=lxml (padrão, rápido) | html5lib | html.parser (fallback puro Python)
+def _select_html_parser() -> str:
+    requested = os.getenv('NEWS_HTML_PARSER', 'lxml').strip().lower()
+    if requested in ('lxml', 'html5lib'):
+        try:
+            __import__(requested)
+            return requested
+        except ImportError:
+            logger.warning(f"Parser HTML '{requested}' não instalado; usando html.parser")
+    elif requested != 'html.parser':
+        logger.warning(f"NEWS_HTML_PARSER desconhecido '{requested}'; usando html.parser")
+    return 'html.parser'
+
+
+HTML_PARSER = _select_html_parser()
+
+_TAG_RE = re.compile(r'<[^>]*>')
+
+
+def make_soup(markup) -> BeautifulSoup:
+    """Cria o documento com o backend HTML configurado (ver NEWS_HTML_PARSER)."""
+    return BeautifulSoup(markup, HTML_PARSER)
+
+
+def strip_html(fragment: str) -> str:
+    """Texto de um fragmento HTML (ex.: description de RSS) sem montar uma árvore BeautifulSoup."""
+    if not fragment:
+        return ''
+    return html.unescape(_TAG_RE.sub('', fragment))
+
+
+# Contexto por thread da fonte em execução (prazo da fonte atual)
+_source_context = threading.local()
+
+
+class SourceDeadlineExceeded(requests.exceptions.Timeout):
+    """Levantada quando uma fonte estoura o prazo configurado (NEWS_SOURCE_TIMEOUT)."""
+
+
+class SourceRunStats:
+    """Contadores de rede da fonte em execução, compartilhados com as threads auxiliares da fonte.
+    Também é o token da fonte nesta execução: o resultado é registrado uma única vez (settle)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._settled = False
+        self.requests = 0
+        self.http_errors = 0
+        self.cache_hits = 0
+        self.bytes = 0
+        self.network_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    def add_request(self, error: bool, elapsed: float = 0.0, nbytes: int = 0, cached: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.http_errors += int(error)
+            self.cache_hits += int(cached)
+            self.bytes += nbytes
+            self.network_seconds += elapsed
+
+    def add_bytes(self, nbytes: int) -> None:
+        with self._lock:
+            self.bytes += nbytes
+
+    def add_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_seconds += seconds
+
+    def settle(self) -> bool:
+        """True só para o primeiro a registrar o resultado: a thread da fonte ou o pool que desistiu dela."""
+        with self._lock:
+            settled, self._settled = self._settled, True
+            return not settled
+
+    def as_dict(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                'requests': self.requests, 'http_errors': self.http_errors, 'cache_hits': self.cache_hits,
+                'bytes': self.bytes, 'network_seconds': round(self.network_seconds, 3),
+                'rate_limit_wait_seconds': round(self.wait_seconds, 3),
+            }
+
+
+def count_source_request(error: bool, elapsed: float = 0.0, nbytes: int = 0, cached: bool = False) -> None:
+    """Credita a requisição à fonte da thread atual (se houver uma em execução)."""
+    stats = getattr(_source_context, 'stats', None)
+    if stats is not None:
+        stats.add_request(error, elapsed, nbytes, cached)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Segundos indicados por um cabeçalho Retry-After (número de segundos ou data HTTP)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except Exception:
+        return None
+
+
+def parse_host_rate_limits(spec: str) -> Dict[str, Tuple[float, float]]:
+    """Lê limites por domínio no formato "dominio=req_por_s[:rajada],..."
+    (ex.: "news.google.com=0.5:2,www.gospelprime.com.br=1"). Entradas inválidas são ignoradas."""
+    limits: Dict[str, Tuple[float, float]] = {}
+    for entry in (spec or '').split(','):
+        domain, _, value = entry.partition('=')
+        domain = domain.strip().lower()
+        if not domain or not value:
+            continue
+        rate, _, burst = value.partition(':')
+        try:
+            limits[domain] = (float(rate), float(burst) if burst else 1.0)
+        except ValueError:
+            logger.warning(f"Limite por host inválido ignorado: {entry.strip()}")
+    return limits
+
+
+class HostRateLimiter:
+    """Token bucket por host, compartilhado entre todas as fontes e threads (e pelo modo assíncrono).
+    Cada host acumula até `burst` fichas a `rate` fichas/s; limites por domínio sobrepõem o padrão.
+    Respostas 429 (ou 503 com Retry-After) bloqueiam o host até o prazo indicado pelo servidor."""
+
+    def __init__(self, rate: float = 2.0, burst: float = 1.0,
+                 domain_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+                 default_backoff: float = 10.0, max_backoff: float = 120.0):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.domain_limits = {d.lower(): v for d, v in (domain_limits or {}).items()}
+        self.default_backoff = default_backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        # host -> [fichas, último reabastecimento, bloqueado até]
+        self._buckets: Dict[str, List[float]] = {}
+        self.throttled: Dict[str, int] = {}
+
+    def limits_for(self, host: str) -> Tuple[float, float]:
+        """(req/s, rajada) do host: o domínio configurado mais específico que o contém, senão o padrão."""
+        best = None
+        for domain in self.domain_limits:
+            if (host == domain or host.endswith('.' + domain)) and (best is None or len(domain) > len(best)):
+                best = domain
+        if best is None:
+            return self.rate, self.burst
+        rate, burst = self.domain_limits[best]
+        return rate, max(1.0, burst)
+
+    def reserve(self, url: str) -> float:
+        """Reserva uma ficha do host e devolve quantos segundos esperar antes de usá-la.
+        Não dorme: serve tanto para threads (acquire) quanto para o event loop (asyncio.sleep).
+        Se a espera passar do prazo da fonte em execução, devolve a ficha e levanta SourceDeadlineExceeded."""
+        host = (urlparse(url).hostname or '').lower()
+        if not host:
+            return 0.0
+        rate, burst = self.limits_for(host)
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._buckets.setdefault(host, [burst, now, 0.0])
+            if rate > 0:
+                bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+                bucket[0] -= 1
+                # Fichas negativas são reservas já feitas por outras threads: a espera cresce com a fila
+                delay = -bucket[0] / rate if bucket[0] < 0 else 0.0
+            else:
+                delay = 0.0
+            delay = max(delay, bucket[2] - now)
+            deadline = getattr(_source_context, 'deadline', None)
+            if deadline is not None and now + delay > deadline:
+                if rate > 0:
+                    bucket[0] += 1
+                raise SourceDeadlineExceeded(f"Prazo da fonte esgotado aguardando vez em {host}")
+        return delay
+
+    def acquire(self, url: str) -> None:
+        delay = self.reserve(url)
+        if delay > 0:
+            stats = getattr(_source_context, 'stats', None)
+            if stats is not None:
+                stats.add_wait(delay)
+            time.sleep(delay)
+
+    def penalize(self, url: str, retry_after: Optional[str] = None) -> float:
+        """Registra um 429/Retry-After: nenhuma nova requisição ao host antes do prazo (limitado a max_backoff)."""
+        host = (urlparse(url).hostname or '').lower()
+        delay = parse_retry_after(retry_after)
+        delay = min(self.max_backoff, self.default_backoff if delay is None else delay)
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._buckets.setdefault(host, [0.0, now, 0.0])
+            bucket[2] = max(bucket[2], now + delay)
+            self.throttled[host] = self.throttled.get(host, 0) + 1
+        logger.warning(f"⏳ {host} pediu para aguardar: pausa de {delay:.0f}s nas requisições a esse host")
+        return delay
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.throttled = {}
+
+    @staticmethod
+    def is_throttle_response(response) -> bool:
+        return response.status_code == 429 or (
+            response.status_code == 503 and bool(response.headers.get('Retry-After'))
+        )
+
+
+class HttpDiskCache:
+    """Cache HTTP persistente em SQLite: guarda corpo e validadores (ETag / Last-Modified) entre execuções.
+    Entradas expiram após o TTL e o tamanho total é limitado com despejo LRU (menos acessadas primeiro).
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 72 * 3600, max_bytes: int = 200 * 1024 * 1024):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS http_cache ('
+            ' url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, content_type TEXT,'
+            ' body BLOB, size INTEGER, stored_at REAL, accessed_at REAL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_http_cache_accessed ON http_cache (accessed_at)')
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        key = canonicalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified, content_type, body, stored_at FROM http_cache WHERE url = ?', (key,)
+            ).fetchone()
+            if not row:
+                return None
+            if self.ttl_seconds > 0 and now - row[4] > self.ttl_seconds:
+                self._conn.execute('DELETE FROM http_cache WHERE url = ?', (key,))
+                self._conn.commit()
+                return None
+        return {'etag': row[0], 'last_modified': row[1], 'content_type': row[2], 'body': row[3]}
+
+    def conditional_headers(self, entry: Dict) -> Dict[str, str]:
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def body(self, entry: Dict) -> bytes:
+        return zlib.decompress(entry['body'])
+
+    def store(self, url: str, response: requests.Response) -> None:
+        with self._lock:
+            self.misses += 1
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        cache_control = (response.headers.get('Cache-Control') or '').lower()
+        # Sem validadores não há como revalidar; no-store deve ser respeitado
+        if not (etag or last_modified) or 'no-store' in cache_control:
+            return
+        body = zlib.compress(response.content or b'', 6)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (canonicalize_url(url), etag, last_modified, response.headers.get('Content-Type'),
+                 body, len(body), now, now)
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def revalidated(self, url: str, response: requests.Response) -> None:
+        """Resposta 304: renova a entrada (e validadores, se o servidor enviou novos)."""
+        now = time.time()
+        with self._lock:
+            self.hits += 1
+            self._conn.execute(
+                'UPDATE http_cache SET stored_at = ?, accessed_at = ?,'
+                ' etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE url = ?',
+                (now, now, response.headers.get('ETag'), response.headers.get('Last-Modified'), canonicalize_url(url))
+            )
+            self._conn.commit()
+
+    def _evict_locked(self) -> None:
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM http_cache').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in self._conn.execute('SELECT url, size FROM http_cache ORDER BY accessed_at ASC').fetchall():
+            self._conn.execute('DELETE FROM http_cache WHERE url = ?', (url,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            count, total = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache').fetchone()
+        return {'hits': self.hits, 'misses': self.misses, 'entries': count, 'bytes': total}
+
+
+class ScraperSession(requests.Session):
+    """Sessão HTTP do scraper: aplica o limite de taxa por host, o prazo da fonte em execução
+    e o GET condicional contra o cache em disco."""
+
+    def __init__(self, rate_limiter: Optional[HostRateLimiter] = None,
+                 disk_cache: Optional[HttpDiskCache] = None,
+                 pool_hosts: int = 64, pool_maxsize: int = 8,
+                 retries: int = 2, backoff_factor: float = 0.5,
+                 throttle_retry_wait: float = 30.0):
+        super().__init__()
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.disk_cache = disk_cache
+        # Após um 429, tenta de novo uma vez se o servidor liberar o host em até throttle_retry_wait segundos
+        self.throttle_retry_wait = throttle_retry_wait
+        # Pool de conexões keep-alive por host (o padrão do requests guarda só 10 hosts)
+        # e retry com backoff exponencial para falhas transitórias. Retry-After fica com o
+        # rate limiter, que pausa o host para todas as threads em vez de dormir dentro desta
+        retry = Retry(
+            total=retries, connect=retries, read=1, backoff_factor=backoff_factor,
+            status_forcelist=(500, 502, 503, 504), allowed_methods=frozenset({'GET', 'HEAD'}),
+            raise_on_status=False, respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+        self.headers.update({'Accept-Encoding': ACCEPT_ENCODING, 'Connection': 'keep-alive'})
+        self._stats_lock = threading.Lock()
+        self.host_stats: Dict[str, Dict[str, float]] = {}
+
+    def record_request(self, url: str, elapsed: float, nbytes: int, error: bool) -> None:
+        host = (urlparse(url).hostname or '').lower()
+        with self._stats_lock:
+            st = self.host_stats.setdefault(host, {'requests': 0, 'seconds': 0.0, 'bytes': 0, 'errors': 0})
+            st['requests'] += 1
+            st['seconds'] += elapsed
+            st['bytes'] += nbytes
+            st['errors'] += int(error)
+
+    def add_bytes(self, url: str, nbytes: int) -> None:
+        """Contabiliza bytes lidos de respostas em streaming (não medidos em request)."""
+        host = (urlparse(url).hostname or '').lower()
+        with self._stats_lock:
+            st = self.host_stats.setdefault(host, {'requests': 0, 'seconds': 0.0, 'bytes': 0, 'errors': 0})
+            st['bytes'] += nbytes
+        stats = getattr(_source_context, 'stats', None)
+        if stats is not None:
+            stats.add_bytes(nbytes)
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.host_stats = {}
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._stats_lock:
+            return {host: dict(st) for host, st in self.host_stats.items()}
+
+    def request(self, method, url, *args, **kwargs):
+        response = self._request_once(method, url, *args, **kwargs)
+        if HostRateLimiter.is_throttle_response(response):
+            delay = self.rate_limiter.penalize(url, response.headers.get('Retry-After'))
+            if delay <= self.throttle_retry_wait:
+                try:
+                    retried = self._request_once(method, url, *args, **kwargs)
+                except SourceDeadlineExceeded:
+                    # A pausa pedida não cabe no prazo da fonte: devolve o próprio 429
+                    return response
+                response.close()
+                response = retried
+                if HostRateLimiter.is_throttle_response(response):
+                    self.rate_limiter.penalize(url, response.headers.get('Retry-After'))
+        return response
+
+    def _request_once(self, method, url, *args, **kwargs):
+        # A espera pela vez no host vem antes: o timeout é calculado sobre o prazo que sobrar
+        self.rate_limiter.acquire(url)
+        deadline = getattr(_source_context, 'deadline', None)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise SourceDeadlineExceeded(f"Prazo da fonte esgotado antes de {url}")
+            timeout = kwargs.get('timeout')
+            # Nunca esperar além do prazo restante da fonte
+            if timeout is None or isinstance(timeout, (int, float)):
+                kwargs['timeout'] = remaining if timeout is None else min(timeout, remaining)
+        cached = None
+        if self.disk_cache is not None and str(method).upper() == 'GET':
+            cached = self.disk_cache.lookup(url)
+            if cached:
+                headers = dict(kwargs.get('headers') or {})
+                headers.update(self.disk_cache.conditional_headers(cached))
+                kwargs['headers'] = headers
+        started = time.monotonic()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except Exception:
+            self.record_request(url, time.monotonic() - started, 0, True)
+            count_source_request(True, time.monotonic() - started)
+            raise
+        elapsed = time.monotonic() - started
+        nbytes = 0 if kwargs.get('stream') else len(response.content or b'')
+        self.record_request(url, elapsed, nbytes, response.status_code >= 400)
+        count_source_request(response.status_code >= 400, elapsed, nbytes,
+                             cached=bool(cached) and response.status_code == 304)
+        logger.debug(f"{method} {url} -> {response.status_code} em {elapsed:.2f}s ({nbytes} bytes)")
+        if self.disk_cache is None or str(method).upper() != 'GET':
+            return response
+        if response.status_code == 304 and cached:
+            # Não mudou desde a última execução: devolve o corpo guardado como um 200 normal
+            self.disk_cache.revalidated(url, response)
+            response.content  # consome o corpo vazio do 304 e devolve a conexão ao pool
+            response.status_code = 200
+            response._content = self.disk_cache.body(cached)
+            response._content_consumed = True
+            if cached.get('content_type'):
+                response.headers['Content-Type'] = cached['content_type']
+            response.from_cache = True
+        elif response.status_code == 200 and not kwargs.get('stream'):
+            # Respostas em streaming (ex.: só o <head>) não são lidas inteiras: não vão para o cache
+            self.disk_cache.store(url, response)
+        return response
+
+
+# Parâmetros de rastreamento que não alteram o conteúdo da página
+_TRACKING_PARAMS = {'fbclid', 'gclid', 'ocid', 'mc_cid', 'mc_eid', 'ref', 'cmpid'}
+
+
+def canonicalize_url(url: str) -> str:
+    """URL canônica usada como chave de cache: esquema/host em minúsculas, sem fragmento
+    e sem parâmetros de rastreamento (utm_*, fbclid, ...)."""
+    try:
+        p = urlparse((url or '').strip())
+        query = urlencode([
+            (k, v) for k, v in parse_qsl(p.query, keep_blank_values=True)
+            if not k.lower().startswith('utm_') and k.lower() not in _TRACKING_PARAMS
+        ])
+        return urlunparse((p.scheme.lower(), p.netloc.lower(), p.path or '/', p.params, query, ''))
+    except Exception:
+        return (url or '').strip()
+
+
+@dataclass
+class ArticleMetadata:
+    """Metadados de um artigo extraídos em uma única passada pelo HTML da página."""
+    url: str
+    title: str = ''
+    description: str = ''
+    image: Optional[str] = None
+    published_time: Optional[str] = None
+    canonical_url: Optional[str] = None
+    # Primeiros parágrafos do corpo (fallback de resumo quando não há description)
+    paragraphs: List[str] = field(default_factory=list)
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_date_utc(date_str: str) -> Optional[datetime]:
+    """Interpreta a data e devolve UTC sem tzinfo (datas sem fuso são mantidas como estão).
+    Caminhos rápidos para ISO 8601 (fromisoformat) e RFC 822 (pubDate de RSS); dateutil só
+    para os demais formatos. Memoizada: a mesma string nunca é interpretada duas vezes na execução
+    (datas sem ano/hora são completadas com o momento atual: o cache é limpo a cada coleta)."""
+    text = (date_str or '').strip()
+    if not text:
+        return None
+    dt = None
+    if text[0].isdigit():
+        try:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            dt = None
+    if dt is None:
+        try:
+            dt = parsedate_to_datetime(text)
+        except (TypeError, ValueError, IndexError):
+            dt = None
+    if dt is None:
+        try:
+            dt = dateutil_parser.parse(text)
+        except Exception:
+            return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+ARTICLE_FIELDS = ('title', 'summary', 'url', 'source', 'date', 'category', 'image_url')
+
+
+@dataclass(slots=True)
+class Article:
+    """Artigo normalizado uma única vez após a coleta, com a data já interpretada (UTC) e a data local.
+    Aceita acesso como dict (article['title'], article.get(...), dict(article)); chaves fora do
+    esquema ficam em extra. Alterar a data via article['date'] recalcula os campos derivados."""
+    title: str = ''
+    summary: str = ''
+    url: str = ''
+    source: str = ''
+    date: str = ''
+    category: str = ''
+    image_url: Optional[str] = None
+    published_at: Optional[datetime] = None
+    local_date: Optional[date_type] = None
+    extra: Dict[str, object] = field(default_factory=dict)
+    local_tz: Optional[tzinfo] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict, local_tz: Optional[tzinfo] = None) -> 'Article':
+        if isinstance(data, Article):
+            return data
+        article = cls(
+            **{key: data.get(key) for key in ARTICLE_FIELDS},
+            extra={k: v for k, v in data.items() if k not in ARTICLE_FIELDS},
+            local_tz=local_tz,
+        )
+        article._parse_date()
+        return article
+
+    def _parse_date(self) -> None:
+        self.published_at = parse_date_utc(str(self.date)) if self.date else None
+        self.local_date = None
+        if self.published_at is not None:
+            local = self.published_at.replace(tzinfo=timezone.utc)
+            self.local_date = (local.astimezone(self.local_tz) if self.local_tz else local).date()
+
+    def __getitem__(self, key: str):
+        if key in ARTICLE_FIELDS:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value) -> None:
+        if key in ARTICLE_FIELDS:
+            setattr(self, key, value)
+            if key == 'date':
+                self._parse_date()
+        else:
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return key in ARTICLE_FIELDS or key in self.extra
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        return list(ARTICLE_FIELDS) + list(self.extra)
+
+
+@dataclass
+class NewsOutput:
+    """Conjunto elegível da execução (política de saída aplicada uma única vez) e estatísticas
+    derivadas dele; é o mesmo para JSON, Supabase e Discord."""
+    articles: List[Dict]
+    generated_at: datetime = field(default_factory=datetime.now)
+    source_counts: Dict[str, int] = field(default_factory=dict)
+    category_counts: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_articles(cls, articles: List[Dict]) -> 'NewsOutput':
+        output = cls(articles=articles)
+        for article in articles:
+            source = article.get('source') or ''
+            category = article.get('category') or ''
+            output.source_counts[source] = output.source_counts.get(source, 0) + 1
+            output.category_counts[category] = output.category_counts.get(category, 0) + 1
+        return output
+
+    @property
+    def sources(self) -> List[str]:
+        return sorted(self.source_counts)
+
+    def payload(self) -> Dict:
+        return {
+            'last_updated': self.generated_at.isoformat(),
+            'total_articles': len(self.articles),
+            'sources': self.sources,
+            'categories': dict(sorted(self.category_counts.items())),
+            'articles': [dict(article) for article in self.articles],
+        }
+
+
+class CachedPage:
+    """Página baixada durante a execução: bytes da resposta e documento parseado sob demanda."""
+
+    def __init__(self, url: str, status_code: int, content: bytes = b'', partial: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content or b''
+        # True quando só o prefixo do documento (até </head>) foi baixado
+        self.partial = partial
+        self._soup: Optional[BeautifulSoup] = None
+        self._soup_lock = threading.Lock()
+        # Metadados extraídos uma vez e compartilhados (ver extract_article_metadata)
+        self.metadata: Optional[ArticleMetadata] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code == 200
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        # Parse único, compartilhado por todos os consumidores (leitura apenas)
+        with self._soup_lock:
+            if self._soup is None:
+                self._soup = make_soup(self.content)
+            return self._soup
+
+
+class PageCache:
+    """Cache de páginas com escopo de uma execução, chaveado pela URL canônica.
+    Requisições simultâneas para a mesma URL esperam o primeiro download em vez de repeti-lo.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, CachedPage] = {}
+        self._inflight: Dict[str, threading.Event] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def peek(self, url: str, variant: str = '') -> Optional[CachedPage]:
+        with self._lock:
+            return self._entries.get(variant + canonicalize_url(url))
+
+    def put(self, url: str, page: CachedPage, variant: str = '') -> None:
+        with self._lock:
+            self._entries.setdefault(variant + canonicalize_url(url), page)
+
+    def get(self, url: str, loader: Callable[[str], Optional[CachedPage]], variant: str = '') -> Optional[CachedPage]:
+        key = variant + canonicalize_url(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry
+            event = self._inflight.get(key)
+            owner = event is None
+            if owner:
+                event = threading.Event()
+                self._inflight[key] = event
+                self.misses += 1
+        if not owner:
+            event.wait()
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self.hits += 1
+            return entry
+        try:
+            entry = loader(url)
+            if entry is not None:
+                with self._lock:
+                    self._entries[key] = entry
+            return entry
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'pages': len(self._entries)}
+
+
+class SourceHealthTracker:
+    """Saúde das fontes entre execuções (JSON) com circuit breaker: após `threshold` falhas seguidas
+    o circuito abre e a fonte é pulada; depois de um backoff exponencial (base_backoff, 2x, 4x...
+    até max_backoff) uma execução faz a sondagem (half-open): sucesso fecha o circuito,
+    nova falha reabre com backoff maior."""
+
+    def __init__(self, path: str, threshold: int = 3, base_backoff: float = 3600, max_backoff: float = 86400):
+        self.path = path
+        self.threshold = max(1, threshold)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Estado de saúde das fontes ilegível ({path}); recomeçando: {e}")
+
+    def allow(self, source: str) -> bool:
+        """False enquanto o circuito da fonte estiver aberto e o backoff não tiver vencido."""
+        with self._lock:
+            entry = self._entries.get(source)
+        if not entry or entry.get('state') != 'open':
+            return True
+        return time.time() >= float(entry.get('retry_at', 0))
+
+    def is_probe(self, source: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(source)
+        return bool(entry) and entry.get('state') == 'open'
+
+    def record(self, source: str, ok: bool, articles: int, duration: float, error: Optional[str] = None) -> None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.setdefault(source, {'state': 'closed', 'failures': 0})
+            entry['last_run'] = now
+            entry['last_articles'] = articles
+            entry['last_duration'] = round(duration, 2)
+            if ok:
+                if entry.get('state') == 'open':
+                    logger.info(f"🟢 {source} voltou a responder: circuito fechado")
+                entry.update(state='closed', failures=0, last_success=now, last_error=None)
+                entry.pop('retry_at', None)
+                return
+            entry['failures'] = int(entry.get('failures', 0)) + 1
+            entry['last_error'] = (error or '')[:200]
+            if entry['failures'] >= self.threshold:
+                backoff = min(self.max_backoff, self.base_backoff * 2 ** (entry['failures'] - self.threshold))
+                entry.update(state='open', retry_at=now + backoff)
+                logger.warning(f"🔴 {source}: {entry['failures']} falhas seguidas, circuito aberto por {backoff / 3600:.1f}h")
+
+    def report(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {source: dict(entry) for source, entry in self._entries.items()}
+
+    def save(self) -> None:
+        """Grava o arquivo via arquivo temporário + os.replace."""
+        with self._lock:
+            payload = json.dumps(self._entries, ensure_ascii=False, indent=1, sort_keys=True)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Não foi possível gravar a saúde das fontes {self.path}: {e}")
+
+
+class SourceCadence:
+    """Cadência adaptativa por fonte (JSON entre execuções): aprende com os horários dos artigos novos
+    de cada fonte a frequência de publicação e agenda a próxima coleta dela com intervalo e jitter
+    próprios. Fontes fora do prazo são puladas e reaproveitam os artigos da última coleta."""
+
+    # Artigos por fonte usados na estimativa (os mais recentes)
+    MAX_SEEN = 30
+
+    def __init__(self, path: str, min_interval: float = 3600, max_interval: float = 86400,
+                 poll_fraction: float = 0.5, jitter: float = 0.1):
+        self.path = path
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.poll_fraction = poll_fraction
+        self.jitter = jitter
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Cadência das fontes ilegível ({path}); recomeçando: {e}")
+
+    def is_due(self, source: str, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(source)
+        if not entry:
+            return True
+        # Folga de 1/4 do intervalo mínimo: a coleta horária não perde fontes de intervalo mínimo por causa do jitter
+        return now + self.min_interval / 4 >= float(entry.get('next_run', 0))
+
+    def cached_articles(self, source: str) -> List[Dict]:
+        with self._lock:
+            entry = self._entries.get(source) or {}
+            return [dict(item) for item in entry.get('articles', [])]
+
+    def interval_for(self, published: List[float], now: float) -> float:
+        """Intervalo entre coletas: fração do tempo médio entre publicações, contando o período desde a
+        mais antiga até agora (fontes paradas espaçam sozinhas). Com poucos dados, o intervalo mínimo."""
+        if len(published) < 3:
+            return self.min_interval
+        mean_gap = (now - min(published)) / len(published)
+        return min(self.max_interval, max(self.min_interval, mean_gap * self.poll_fraction))
+
+    def observe(self, source: str, articles: List[Dict], now: Optional[float] = None) -> float:
+        """Registra uma coleta bem-sucedida e agenda a próxima; devolve o intervalo escolhido."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.setdefault(source, {})
+            seen: Dict[str, float] = entry.get('seen', {})
+            for article in articles:
+                url = canonicalize_url(article.get('url') or '')
+                if not url or url in seen:
+                    continue
+                # Publicação segundo a data do artigo; sem data confiável, o momento em que apareceu
+                published = parse_date_utc(article.get('date') or '')
+                ts = published.replace(tzinfo=timezone.utc).timestamp() if published else now
+                seen[url] = min(ts, now)
+            seen = dict(sorted(seen.items(), key=lambda kv: kv[1], reverse=True)[:self.MAX_SEEN])
+            interval = self.interval_for(list(seen.values()), now)
+            entry.update(
+                seen=seen, interval=round(interval), last_run=now,
+                next_run=now + interval * (1 + random.uniform(-self.jitter, self.jitter)),
+                articles=[dict(article) for article in articles],
+            )
+        return interval
+
+    def save(self) -> None:
+        """Grava o arquivo via arquivo temporário + os.replace."""
+        with self._lock:
+            payload = json.dumps(self._entries, ensure_ascii=False, default=str)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Não foi possível gravar a cadência das fontes {self.path}: {e}")
+
+
+def write_file_atomic(path: str, data: bytes) -> None:
+    """Grava via arquivo temporário no mesmo diretório + os.replace: quem lê nunca vê o arquivo pela metade."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_precompressed(path: str, data: bytes, enabled: bool = True) -> List[str]:
+    """Gera path.gz (e path.br, se houver brotli) com os mesmos bytes de path, para o host estático servir
+    comprimido sem recomprimir. Irmãos não gerados nesta execução são removidos (não servem conteúdo antigo)."""
+    compressors = {'.gz': lambda d: gzip.compress(d, compresslevel=9, mtime=0)}
+    if _brotli is not None:
+        compressors['.br'] = lambda d: _brotli.compress(d, quality=11)
+    written = []
+    for suffix in ('.gz', '.br'):
+        target = path + suffix
+        if enabled and suffix in compressors:
+            write_file_atomic(target, compressors[suffix](data))
+            written.append(target)
+        elif os.path.exists(target):
+            os.remove(target)
+    return written
+
+
+# Definida pelo news_scheduler.py ao rodar a coleta como subprocesso: a trava já é dele
+RUN_LOCK_HELD_ENV = 'NEWS_RUN_LOCK_HELD'
+
+
+def run_lock_held_by_parent() -> bool:
+    return os.getenv(RUN_LOCK_HELD_ENV, '').strip() == '1'
+
+
+def default_run_lock_path() -> str:
+    """Trava de coleta compartilhada por news_scraper.py, modo assíncrono e news_scheduler.py."""
+    return os.getenv('NEWS_RUN_LOCK') or os.path.join(
+        os.getenv('NEWS_HTTP_CACHE_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'),
+        'news_scraper.lock')
+
+
+class RunLock:
+    """Trava entre processos para uma única coleta por vez (daemon local, execução manual, CI).
+    Usa fcntl.flock, liberado pelo sistema se o processo morrer; sem fcntl, cria o arquivo com O_EXCL
+    e considera abandonada uma trava mais velha que stale_seconds."""
+
+    def __init__(self, path: str, stale_seconds: float = 6 * 3600):
+        self.path = path
+        self.stale_seconds = stale_seconds
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> bool:
+        """Tenta travar sem esperar; False se outra coleta estiver em andamento."""
+        if self._fd is not None:
+            return True
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        if fcntl is not None:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                return False
+            os.ftruncate(fd, 0)
+        else:
+            try:
+                fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                try:
+                    age = time.time() - os.path.getmtime(self.path)
+                    if age < self.stale_seconds:
+                        return False
+                    logger.warning(f"Trava de coleta abandonada há {age / 3600:.1f}h; removendo {self.path}")
+                    os.remove(self.path)
+                    fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                except OSError:
+                    return False
+        os.write(fd, f"pid={os.getpid()} desde {datetime.now().isoformat(timespec='seconds')}\n".encode())
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+            if fcntl is None:
+                os.remove(self.path)
+        except OSError as e:
+            logger.warning(f"Falha ao liberar a trava de coleta {self.path}: {e}")
+
+    def holder(self) -> str:
+        """Quem está com a trava (conteúdo do arquivo), para as mensagens de coleta pulada."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return f.read().strip() or 'desconhecido'
+        except OSError:
+            return 'desconhecido'
+
+
+class QueryResultCache:
+    """Resultados de buscas (ex.: consultas do Google News) persistidos em JSON com TTL curto,
+    chaveados pela string da consulta, para execuções seguidas não repetirem o mesmo trabalho."""
+
+    def __init__(self, path: str, ttl_seconds: float):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Cache de consultas ilegível ({path}); recomeçando: {e}")
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if not entry or time.time() - float(entry.get('stored_at', 0)) > self.ttl_seconds:
+            return None
+        return [dict(item) for item in entry.get('items', [])]
+
+    def put(self, key: str, items: List[Dict]) -> None:
+        with self._lock:
+            self._entries[key] = {'stored_at': time.time(), 'items': [dict(item) for item in items]}
+
+    def save(self) -> None:
+        """Grava o arquivo (descartando entradas expiradas) via arquivo temporário + os.replace."""
+        now = time.time()
+        with self._lock:
+            self._entries = {k: v for k, v in self._entries.items()
+                             if now - float(v.get('stored_at', 0)) <= self.ttl_seconds}
+            payload = json.dumps(self._entries, ensure_ascii=False, default=str)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Não foi possível gravar o cache de consultas {self.path}: {e}")
+
+
+class SeenArticleIndex:
+    """Índice persistente (SQLite) de artigos já enriquecidos: URL canônica → registro enriquecido,
+    hash do conteúdo vindo da fonte e quando o artigo foi visto pela primeira vez.
+    Artigos com o mesmo hash reaproveitam imagem e resumo sem novos downloads."""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS seen_articles ('
+            ' url TEXT PRIMARY KEY, source TEXT, content_hash TEXT, record TEXT,'
+            ' first_seen REAL, last_seen REAL)'
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def content_hash(article: Dict) -> str:
+        """Hash dos campos como vieram da fonte (antes do enriquecimento). A data fica de fora:
+        várias fontes sem data usam o horário da coleta."""
+        raw = '\x1f'.join(str(article.get(k) or '') for k in ('title', 'summary'))
+        return hashlib.sha1(raw.encode('utf-8', 'replace')).hexdigest()
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT content_hash, record, first_seen FROM seen_articles WHERE url = ?', (canonicalize_url(url),)
+            ).fetchone()
+        if not row:
+            return None
+        try:
+            record = json.loads(row[1])
+        except Exception:
+            return None
+        return {'content_hash': row[0], 'record': record, 'first_seen': row[2]}
+
+    def restore(self, article: Dict, content_hash: str) -> bool:
+        """Copia imagem e resumo já enriquecidos para o artigo se o conteúdo da fonte não mudou."""
+        known = self.lookup(article.get('url') or '')
+        with self._lock:
+            if not known or known['content_hash'] != content_hash:
+                self.misses += 1
+                return False
+            self.hits += 1
+        record = known['record']
+        for key in ('image_url', 'summary'):
+            if record.get(key):
+                article[key] = record[key]
+        return True
+
+    def remember(self, articles: List[Dict], hashes: Dict[str, str]) -> None:
+        now = time.time()
+        rows = []
+        for article in articles:
+            url = canonicalize_url(article.get('url') or '')
+            if url in hashes:
+                rows.append((url, article.get('source'), hashes[url], json.dumps(dict(article), ensure_ascii=False, default=str), now, now))
+        with self._lock:
+            # first_seen é preservado para URLs já conhecidas
+            self._conn.executemany(
+                'INSERT INTO seen_articles VALUES (?, ?, ?, ?, ?, ?)'
+                ' ON CONFLICT(url) DO UPDATE SET source = excluded.source, content_hash = excluded.content_hash,'
+                ' record = excluded.record, last_seen = excluded.last_seen',
+                rows
+            )
+            self._conn.commit()
+
+    def prune(self, is_current: Callable[[Dict], bool]) -> int:
+        """Remove registros cujo artigo saiu da janela de recência (mesmo critério da saída)."""
+        with self._lock:
+            rows = self._conn.execute('SELECT url, record FROM seen_articles').fetchall()
+        stale = []
+        for url, record in rows:
+            try:
+                keep = is_current(json.loads(record))
+            except Exception:
+                keep = False
+            if not keep:
+                stale.append((url,))
+        if stale:
+            with self._lock:
+                self._conn.executemany('DELETE FROM seen_articles WHERE url = ?', stale)
+                self._conn.commit()
+        return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM seen_articles').fetchone()[0]
+            return {'hits': self.hits, 'misses': self.misses, 'entries': entries}
+
+
+@dataclass
+class KeywordMatch:
+    """Resultado de KeywordMatcher.match: termos encontrados por grupo (na grafia original da lista)."""
+    keywords: Dict[str, List[str]] = field(default_factory=dict)
+
+    def has(self, group: str) -> bool:
+        return bool(self.keywords.get(group))
+
+
+class KeywordMatcher:
+    """Casamento de várias listas de palavras-chave em uma única varredura do texto.
+    Uma regex combinada é compilada uma vez, sem diferenciar maiúsculas nem acentos; cada termo
+    sabe a quais grupos pertence. O termo precisa começar uma palavra, mas pode ser prefixo dela
+    (flexões: 'igreja' casa 'igrejas', 'roma' casa 'romano'), como o text.includes do frontend."""
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self._groups: Dict[str, List[Tuple[str, str]]] = {}
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                self._groups.setdefault(self.normalize(keyword), []).append((group, keyword))
+        # Termos mais longos primeiro: 'manuscritos do mar morto' antes de 'mar morto'
+        terms = sorted(self._groups, key=len, reverse=True)
+        # Um termo também conta os termos que começam uma de suas palavras
+        # ('jerusalém antiga' → 'jerusalém', 'celebridades' → 'celebridade')
+        self._contained: Dict[str, List[str]] = {
+            term: [other for other in terms if f' {other}' in f' {term}']
+            for term in terms
+        }
+        alternatives = (r'\s+'.join(re.escape(part) for part in term.split()) for term in terms)
+        self._pattern = re.compile(r'\b(' + '|'.join(alternatives) + r')\w*')
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        decomposed = unicodedata.normalize('NFKD', text or '')
+        return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+    def match(self, text: str) -> KeywordMatch:
+        result = KeywordMatch()
+        normalized = self.normalize(text)
+        for found in self._pattern.finditer(normalized):
+            term = ' '.join(found.group(1).split())
+            for contained in self._contained.get(term, ()):
+                for group, keyword in self._groups[contained]:
+                    matched = result.keywords.setdefault(group, [])
+                    if keyword not in matched:
+                        matched.append(keyword)
+        return result
+
+
 class ChristianNewsScraper:
+    # Palavras-chave do filtro de conteúdo (compiladas uma vez em KeywordMatcher no __init__)
+    # Keywords that align with reformed theology and reconciliation ministry
+    POSITIVE_KEYWORDS = [
+        'reconciliação', 'reconciliation', 'graça', 'grace', 'doutrina', 'doctrine',
+        'teologia', 'theology', 'reforma', 'reformed', 'calvinismo', 'calvinist',
+        'soberania', 'sovereignty', 'predestinação', 'predestination', 'eleição', 'election',
+        'santificação', 'sanctification', 'justificação', 'justification', 'regeneração',
+        'igreja', 'church', 'irmandade', 'brotherhood', 'comunhão', 'fellowship',
+        'dons espirituais', 'spiritual gifts', 'edificação', 'edification', 'unidade', 'unity',
+        'paz', 'peace', 'perdão', 'forgiveness', 'restauração', 'restoration',
+        'perseguição', 'persecution', 'missões', 'missions', 'evangelização', 'evangelism',
+        'bíblia', 'bible', 'escrituras', 'scripture', 'palavra de deus', 'word of god',
+        'oração', 'prayer', 'jejum', 'fasting', 'adoração', 'worship',
+        'israel', 'jerusalem', 'jerusalém', 'profecia', 'prophecy', 'escatologia', 'eschatology',
+        'oriente médio', 'middle east', 'sionismo', 'zionism', 'judeus', 'jews',
+        'arqueologia', 'archaeology', 'história antiga', 'ancient history', 'egito', 'egypt',
+        'mesopotâmia', 'mesopotamia', 'israel antigo', 'ancient israel', 'jericó', 'jericho',
+        'jerusalém antiga', 'ancient jerusalem', 'mar morto', 'dead sea', 'qumran', 'caverna', 'cave',
+        'manuscritos do mar morto', 'dead sea scrolls', 'tabernáculo', 'templo', 'arqueólogos', 'archaeologists',
+        'escavação', 'excavation', 'achados', 'finds', 'descoberta', 'discovery', 'civilizações', 'civilizations',
+        'período interbíblico', 'intertestamental', 'patrística', 'pais da igreja',
+        'escavações bíblicas', 'idade média', 'história da igreja',
+        'debates teológicos', 'controvérsias teológicas',
+        'arminianismo',
+        'fariseus', 'saduceus', 'essênios', 'zelotes',
+        'usos e costumes da bíblia', 'costumes bíblicos', 'cultura bíblica', 'cultura judaica',
+        # Ciência e fé
+        'criacionismo', 'criação bíblica', 'intelligent design', 'desenho inteligente'
+    ]
+
+    # Keywords to avoid (prosperity gospel, extreme charismatic, liberal theology, fofocas/entretenimento)
+    NEGATIVE_KEYWORDS = [
+        'prosperidade', 'prosperity', 'determinação', 'confissão positiva',
+        'teologia liberal', 'liberal theology', 'universalismo', 'universalism',
+        'barganhar com deus', 'bargain with god', 'milagres financeiros',
+        'unção do riso', 'holy laughter', 'cair no espírito', 'slain in spirit',
+        'profetadas', 'prophetic words', 'revelações extras', 'extra revelations',
+        # Evitar fofoca/celebridades/moda/entretenimento
+        'fofoca', 'celebridade', 'celebridades', 'famosos', 'moda', 'novela', 'entretenimento', 'reality show', 'bbb',
+        'astrologia', 'signos', 'zodíaco', 'tarot'
+    ]
+
+    # Política sem contexto bíblico: caso o texto trate de política/legislação
+    # sem conexão clara com fé/ética cristã, filtramos como negativo
+    POLITICS_KEYWORDS = [
+        'política', 'eleição', 'partido', 'candidato', 'campanha', 'senador', 'deputado', 'vereador',
+        'presidente', 'governo', 'congresso', 'assembleia', 'parlamento', 'projeto de lei', 'lei', 'decisão judicial'
+    ]
+    POLITICS_CONTEXT_KEYWORDS = [
+        'bíblia', 'bíblico', 'igreja', 'cristão', 'cristãos', 'ética cristã', 'valores cristãos', 'teologia',
+        'reconciliação', 'perdão', 'vida', 'família', 'defesa da fé'
+    ]
+
+    # Pontuação de relevância (mesmos termos e pesos do frontend em src/api/newsApi.ts)
+    RELEVANCE_LOCATIONS = ['sítio', 'museu', 'israel', 'egito', 'grécia', 'roma', 'pérsia', 'babilônia', 'nínive', 'síria',
+                           'terra santa', 'crescente fértil', 'jerusalém', 'galileia']
+    RELEVANCE_TOPICS = ['arqueologia', 'arqueológico', 'escavação', 'descoberta', 'artefato', 'ruínas', 'criacionismo',
+                        'fóssil', 'antigo testamento']
+    RELEVANCE_WEIGHTS = {'location': 3, 'topic': 2}
+    AUTO_TAGS = {
+        'Israel e Terra Santa': ['israel', 'jerusalém', 'galileia', 'terra santa'],
+        'Oriente Médio Antigo': ['egito', 'pérsia', 'babilônia', 'nínive', 'síria', 'crescente fértil'],
+        'Mundo Greco-Romano': ['grécia', 'roma'],
+        'Criacionismo': ['criacionismo'],
+        'Arqueologia Bíblica': ['arqueologia', 'arqueológico', 'escavação', 'descoberta'],
+    }
+
+    # Whitelist de domínios confiáveis
+    TRUSTED_DOMAINS = [
+        'gospelprime.com.br', 'guiame.com.br', 'portasabertas.org.br',
+        'cafetorah.com', 'folhagospel.com', 'cpadnews.com.br', 'cpad.com.br',
+        'bbc.com', 'bbc.co.uk', 'bbc.com.br', 'cnnbrasil.com.br',
+        'nationalgeographic.com', 'nationalgeographicbrasil.com', 'abril.com.br',
+        'uol.com.br', 'terra.com.br',
+        # Confiar em domínios da Galileu para evitar descarte indevido
+        'globo.com', 'globo.com.br', 'revistagalileu.globo.com'
+    ]
+
+    # Fonte confiável por nome
+    TRUSTED_SOURCES = ['Voltemos ao Evangelho', 'Monergismo', 'Portas Abertas',
+                       'Portas Abertas - Cristãos Perseguidos', 'Cafetorah - Notícias de Israel',
+                       'Folha Gospel', 'Revista Galileu', 'Revista Galileu - Arqueologia']
+
+    # Colunas gravadas em news_articles no Supabase (também comparadas para pular linhas inalteradas)
+    SUPABASE_FIELDS = ('title', 'summary', 'url', 'source', 'date', 'category', 'image_url')
+
     def __init__(self):
-        self.session = requests.Session()
+        # Execução concorrente das fontes: nº de workers, prazo por fonte e intervalo mínimo por host
+        try:
+            self.max_workers = max(1, int(os.getenv('NEWS_MAX_WORKERS', '6')))
+        except Exception:
+            self.max_workers = 6
+        try:
+            self.source_timeout = float(os.getenv('NEWS_SOURCE_TIMEOUT', '90'))
+        except Exception:
+            self.source_timeout = 90.0
+        # Limite de taxa por host: NEWS_HOST_MIN_INTERVAL (padrão 0.5s) define a taxa padrão,
+        # NEWS_HOST_BURST a rajada e NEWS_HOST_RATE_LIMITS os limites por domínio
+        try:
+            host_min_interval = float(os.getenv('NEWS_HOST_MIN_INTERVAL', '0.5'))
+        except Exception:
+            host_min_interval = 0.5
+        try:
+            host_burst = float(os.getenv('NEWS_HOST_BURST', '1'))
+        except Exception:
+            host_burst = 1.0
+        try:
+            host_max_backoff = float(os.getenv('NEWS_HOST_MAX_RETRY_AFTER', '120'))
+        except Exception:
+            host_max_backoff = 120.0
+        self.rate_limiter = HostRateLimiter(
+            rate=1.0 / host_min_interval if host_min_interval > 0 else 0.0,
+            burst=host_burst,
+            domain_limits=parse_host_rate_limits(os.getenv('NEWS_HOST_RATE_LIMITS', '')),
+            max_backoff=host_max_backoff,
+        )
+
+        # Cache HTTP persistente (GET condicional com ETag / Last-Modified)
+        disk_cache = None
+        self.cache_dir = os.getenv('NEWS_HTTP_CACHE_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+        if os.getenv('NEWS_HTTP_CACHE', 'true').strip().lower() != 'false':
+            try:
+                ttl_hours = float(os.getenv('NEWS_HTTP_CACHE_TTL_HOURS', '72'))
+            except Exception:
+                ttl_hours = 72.0
+            try:
+                max_mb = float(os.getenv('NEWS_HTTP_CACHE_MAX_MB', '200'))
+            except Exception:
+                max_mb = 200.0
+            try:
+                disk_cache = HttpDiskCache(os.path.join(self.cache_dir, 'http_cache.sqlite3'),
+                                           ttl_seconds=ttl_hours * 3600, max_bytes=int(max_mb * 1024 * 1024))
+            except Exception as e:
+                logger.warning(f"Cache HTTP em disco indisponível: {e}")
+
+        # Camada HTTP única: timeout, pool por host e retry/backoff configuráveis
+        try:
+            self.http_timeout = float(os.getenv('NEWS_HTTP_TIMEOUT', '12'))
+        except Exception:
+            self.http_timeout = 12.0
+        try:
+            http_retries = int(os.getenv('NEWS_HTTP_RETRIES', '2'))
+        except Exception:
+            http_retries = 2
+        try:
+            http_pool_maxsize = int(os.getenv('NEWS_HTTP_POOL_MAXSIZE', str(max(8, self.max_workers))))
+        except Exception:
+            http_pool_maxsize = max(8, self.max_workers)
+
+        self.session = ScraperSession(
+            self.rate_limiter, disk_cache=disk_cache,
+            pool_maxsize=http_pool_maxsize, retries=http_retries,
+        )
+        # Cache de páginas da execução atual (recriado a cada scrape_all_sources)
+        self.page_cache = PageCache()
+        # Metadados via download só do <head> (para antes de </head> ou do limite de bytes)
+        self.head_only_fetch = os.getenv('NEWS_HEAD_ONLY_FETCH', 'true').strip().lower() != 'false'
+        try:
+            self.head_max_bytes = int(os.getenv('NEWS_HEAD_MAX_BYTES', '131072'))
+        except Exception:
+            self.head_max_bytes = 131072
+        self._head_stats_lock = threading.Lock()
+        self.head_fetch_stats = {'head_only': 0, 'full_fallback': 0}
+        # Itens de feed fora da janela de saída descartados já no feed (por fonte)
+        self._stale_feed_items_lock = threading.Lock()
+        self.stale_feed_items: Dict[str, int] = {}
+        # Imagens só para o conjunto final: extraídas em paralelo depois da seleção
+        try:
+            self.image_workers = int(os.getenv('NEWS_IMAGE_WORKERS', '8'))
+        except Exception:
+            self.image_workers = 8
+        # Artigos enriquecidos na execução atual: vão para o índice de vistos depois das imagens
+        self.enriched_articles: List[Dict] = []
+        self.content_hashes: Dict[str, str] = {}
+        # Google News: consultas em paralelo e resultados reaproveitados entre execuções próximas
+        try:
+            self.google_news_workers = int(os.getenv('NEWS_GOOGLE_NEWS_WORKERS', '6'))
+        except Exception:
+            self.google_news_workers = 6
+        try:
+            google_news_ttl_min = float(os.getenv('NEWS_GOOGLE_NEWS_CACHE_TTL_MIN', '30'))
+        except Exception:
+            google_news_ttl_min = 30.0
+        self.google_news_cache = None
+        if google_news_ttl_min > 0:
+            self.google_news_cache = QueryResultCache(os.path.join(self.cache_dir, 'google_news_queries.json'),
+                                                      ttl_seconds=google_news_ttl_min * 60)
+        # Filtro de conteúdo: todas as listas de palavras-chave em uma única regex compilada
+        self.keyword_matcher = KeywordMatcher({
+            'positive': self.POSITIVE_KEYWORDS,
+            'negative': self.NEGATIVE_KEYWORDS,
+            'politics': self.POLITICS_KEYWORDS,
+            'politics_context': self.POLITICS_CONTEXT_KEYWORDS,
+            'location': self.RELEVANCE_LOCATIONS,
+            'topic': self.RELEVANCE_TOPICS,
+        })
+        # Índice de artigos já enriquecidos (execuções incrementais)
+        self.seen_index = None
+        if os.getenv('NEWS_SEEN_INDEX', 'true').strip().lower() != 'false':
+            try:
+                self.seen_index = SeenArticleIndex(os.path.join(self.cache_dir, 'seen_articles.sqlite3'))
+            except Exception as e:
+                logger.warning(f"Índice de artigos vistos indisponível: {e}")
+        # Cópia pública do christian_news.json: JSON compacto e irmãos .gz/.br pré-comprimidos
+        self.public_json_compact = os.getenv('NEWS_PUBLIC_JSON_COMPACT', 'true').strip().lower() != 'false'
+        self.public_json_precompress = os.getenv('NEWS_PUBLIC_JSON_PRECOMPRESS', 'true').strip().lower() != 'false'
+        # Relatório da execução (tempos, bytes, requisições e contagens por fonte e por etapa)
+        self.run_report_path = os.getenv('NEWS_RUN_REPORT') or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'data', 'news_run_report.json')
+        self._source_reports_lock = threading.Lock()
+        self.source_reports: Dict[str, Dict] = {}
+        self.pipeline_stats: Dict[str, Dict] = {}
+        # Circuit breaker por fonte: fontes que falham seguidamente são puladas até a próxima sondagem
+        self.source_health = None
+        if os.getenv('NEWS_SOURCE_BREAKER', 'true').strip().lower() != 'false':
+            try:
+                breaker_threshold = int(os.getenv('NEWS_BREAKER_THRESHOLD', '3'))
+            except Exception:
+                breaker_threshold = 3
+            try:
+                breaker_backoff_min = float(os.getenv('NEWS_BREAKER_BACKOFF_MIN', '60'))
+            except Exception:
+                breaker_backoff_min = 60.0
+            try:
+                breaker_max_backoff_h = float(os.getenv('NEWS_BREAKER_MAX_BACKOFF_H', '24'))
+            except Exception:
+                breaker_max_backoff_h = 24.0
+            self.source_health = SourceHealthTracker(
+                os.path.join(self.cache_dir, 'source_health.json'), threshold=breaker_threshold,
+                base_backoff=breaker_backoff_min * 60, max_backoff=breaker_max_backoff_h * 3600,
+            )
+        # Cadência adaptativa: cada fonte é coletada no ritmo em que publica (entre os limites abaixo)
+        self.source_cadence = None
+        if os.getenv('NEWS_ADAPTIVE_CADENCE', 'true').strip().lower() != 'false':
+            try:
+                cadence_min_h = float(os.getenv('NEWS_CADENCE_MIN_H', '1'))
+            except Exception:
+                cadence_min_h = 1.0
+            try:
+                cadence_max_h = float(os.getenv('NEWS_CADENCE_MAX_H', '24'))
+            except Exception:
+                cadence_max_h = 24.0
+            try:
+                cadence_jitter = float(os.getenv('NEWS_CADENCE_JITTER', '0.1'))
+            except Exception:
+                cadence_jitter = 0.1
+            self.source_cadence = SourceCadence(
+                os.path.join(self.cache_dir, 'source_cadence.json'),
+                min_interval=cadence_min_h * 3600, max_interval=cadence_max_h * 3600, jitter=cadence_jitter,
+            )
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -85,6 +1500,12 @@ class ChristianNewsScraper:
             except Exception as e:
                 logger.error(f"Failed to initialize Supabase client: {e}")
                 self.supabase = None
+        # Escrita em lote no Supabase: tamanho do lote e modo (lookup = só insere novos; upsert = insere e atualiza)
+        try:
+            self.supabase_batch_size = max(1, int(os.getenv('NEWS_SUPABASE_BATCH_SIZE', '50')))
+        except Exception:
+            self.supabase_batch_size = 50
+        self.supabase_write_mode = os.getenv('NEWS_SUPABASE_WRITE_MODE', 'lookup').strip().lower()
         
         # News sources configuration - Focado em conteúdo teológico reformado e conservador
         self.sources = {
@@ -214,17 +1635,24 @@ class ChristianNewsScraper:
         try:
             if not date_str:
                 return None
-            dt = dateutil_parser.parse(str(date_str))
-            if dt.tzinfo is not None:
-                dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
-            return dt
+            return parse_date_utc(str(date_str))
         except Exception:
             return None
 
+    def to_article(self, data: Dict) -> Article:
+        """Normaliza o dict de um scraper em Article (data interpretada uma única vez)."""
+        return Article.from_dict(data, self.local_tz)
+
+    def article_datetime(self, article: Dict) -> Optional[datetime]:
+        """Data do artigo em UTC: já pronta no Article; em dicts, via parser memoizado."""
+        if isinstance(article, Article):
+            return article.published_at
+        return self.parse_article_date(article.get('date'))
+
     def is_recent_article(self, article: Dict, max_age_hours: int = 24) -> bool:
         dt = None
         if 'date' in article:
-            dt = self.parse_article_date(article.get('date'))
+            dt = self.article_datetime(article)
         # Permitir qualquer ano desde que esteja dentro da janela configurada
         if dt is None:
             return False
@@ -234,6 +1662,25 @@ class ChristianNewsScraper:
     def filter_recent_articles(self, articles: List[Dict], max_age_hours: int = 24) -> List[Dict]:
         return [a for a in articles if self.is_recent_article(a, max_age_hours=max_age_hours)]
 
+    def within_output_window(self, dt_utc: Optional[datetime]) -> bool:
+        """A política de saída ainda pode aceitar esta data (hoje no timezone local ou <= max_age_hours)?"""
+        if dt_utc is None:
+            return False
+        if datetime.utcnow() - dt_utc <= timedelta(hours=self.max_age_hours):
+            return True
+        local = self._to_local(dt_utc)
+        return bool(local) and local.date() == datetime.now(tz=self.local_tz).date()
+
+    def is_stale_feed_item(self, source_name: str, pub_date: Optional[str]) -> bool:
+        """True quando o pubDate do item já o exclui da saída: o scraper o descarta ainda no feed
+        (contabilizado em stale_feed_items por fonte). Sem data, mantém."""
+        dt_utc = self.parse_article_date(pub_date)
+        if dt_utc is None or self.within_output_window(dt_utc):
+            return False
+        with self._stale_feed_items_lock:
+            self.stale_feed_items[source_name] = self.stale_feed_items.get(source_name, 0) + 1
+        return True
+
     def _truncate_summary(self, text: str) -> str:
         """Aplica limite máximo e adiciona reticências se necessário."""
         if not text:
@@ -243,14 +1690,79 @@ class ChristianNewsScraper:
             return text[: self.summary_max_chars].rstrip() + "..."
         return text
 
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None,
+              timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """Ponto único de acesso HTTP dos scrapers: sessão compartilhada (keep-alive, pool por host,
+        gzip/brotli, retry com backoff) e timeout unificado (NEWS_HTTP_TIMEOUT)."""
+        return self.session.get(url, headers=headers, timeout=timeout or self.http_timeout, **kwargs)
+
+    def _load_page(self, url: str) -> Optional[CachedPage]:
+        try:
+            resp = self.fetch(url)
+            return CachedPage(url, resp.status_code, resp.content if resp.status_code == 200 else b'')
+        except SourceDeadlineExceeded:
+            # Não memoriza: outra fonte, com prazo próprio, ainda pode baixar a página
+            return None
+        except Exception as e:
+            logger.debug(f"Falha ao baixar {url}: {e}")
+            return CachedPage(url, 0)
+
+    def head_boundary_reached(self, buf: bytearray, new_from: int) -> bool:
+        """True quando os bytes lidos a partir de new_from fecham o <head> ou o orçamento estourou."""
+        window = bytes(buf[max(0, new_from - 8):]).lower()
+        return b'</head>' in window or b'<body' in window or len(buf) >= self.head_max_bytes
+
+    def read_head(self, chunks) -> Tuple[bytes, bool]:
+        """Consome chunks até </head> (ou <body>) ou NEWS_HEAD_MAX_BYTES; retorna (bytes, documento_completo)."""
+        buf = bytearray()
+        for chunk in chunks:
+            start = len(buf)
+            buf.extend(chunk)
+            if self.head_boundary_reached(buf, start):
+                return bytes(buf), False
+        return bytes(buf), True
+
+    def _load_page_head(self, url: str) -> Optional[CachedPage]:
+        """Lê a resposta em streaming e para ao encontrar </head> (ou <body>) ou ao atingir NEWS_HEAD_MAX_BYTES."""
+        try:
+            resp = self.fetch(url, stream=True)
+            try:
+                if resp.status_code != 200:
+                    return CachedPage(url, resp.status_code)
+                if getattr(resp, 'from_cache', False):
+                    # 304: o corpo completo já veio do cache em disco
+                    return CachedPage(resp.url or url, 200, resp.content)
+                buf, complete = self.read_head(resp.iter_content(chunk_size=16384))
+                self.session.add_bytes(url, len(buf))
+                # URL final (após redirecionamentos): usada por resolve_redirects
+                return CachedPage(resp.url or url, 200, buf, partial=not complete)
+            finally:
+                resp.close()
+        except SourceDeadlineExceeded:
+            return None
+        except Exception as e:
+            logger.debug(f"Falha ao baixar o <head> de {url}: {e}")
+            return CachedPage(url, 0)
+
+    def _metadata_is_complete(self, metadata: ArticleMetadata) -> bool:
+        return bool(metadata.image) and len(metadata.description) >= max(60, self.summary_min_chars // 2)
+
+    def _page_metadata(self, page: CachedPage, url: str) -> ArticleMetadata:
+        if page.metadata is None:
+            page.metadata = self.parse_article_metadata(page.soup, url)
+        return page.metadata
+
+    def fetch_page(self, url: str) -> Optional[CachedPage]:
+        """Baixa a página uma única vez por execução (via page_cache); retorna None se indisponível."""
+        if not url:
+            return None
+        page = self.page_cache.get(url, self._load_page)
+        return page if page is not None and page.ok else None
+
     def _fetch_page_soup(self, url: str) -> Optional[BeautifulSoup]:
         try:
-            if not url:
-                return None
-            resp = self.session.get(url, timeout=12)
-            if resp.status_code != 200:
-                return None
-            return BeautifulSoup(resp.content, 'html.parser')
+            page = self.fetch_page(url)
+            return page.soup if page else None
         except Exception:
             return None
 
@@ -258,42 +1770,25 @@ class ChristianNewsScraper:
         """Gera resumo detalhado a partir de meta description / og:description e, se faltar, dos 2–3 primeiros parágrafos.
         Retorna texto normalizado e limitado ao tamanho máximo configurado.
         """
-        soup = self._fetch_page_soup(url)
-        if not soup:
+        metadata = self.extract_article_metadata(url)
+        if not metadata:
             return ""
 
-        # 1) meta description / og:description
-        meta_candidates = []
-        try:
-            for tag in soup.find_all('meta'):
-                name = (tag.get('name') or tag.get('property') or '').lower()
-                if name in ['description', 'og:description', 'twitter:description']:
-                    content = self.clean_text(tag.get('content') or '')
-                    if content:
-                        meta_candidates.append(content)
-            if meta_candidates:
-                best = max(meta_candidates, key=len)
-                if len(best) >= max(60, self.summary_min_chars // 2):
-                    return self._truncate_summary(best)
-        except Exception:
-            pass
+        # 1) meta description / og:description (a mais longa)
+        best = metadata.description
+        if best and len(best) >= max(60, self.summary_min_chars // 2):
+            return self._truncate_summary(best)
 
-        # 2) primeiros parágrafos do corpo
-        try:
-            paragraphs = soup.find_all('p')
-            # pegar 3 primeiros parágrafos não muito curtos
-            selected = []
-            for p in paragraphs[:8]:
-                txt = self.clean_text(p.get_text())
-                if len(txt) >= 40:
-                    selected.append(txt)
-                if len(' '.join(selected)) >= self.summary_min_chars:
-                    break
-            candidate = ' '.join(selected).strip()
-            if candidate:
-                return self._truncate_summary(candidate)
-        except Exception:
-            pass
+        # 2) primeiros parágrafos do corpo não muito curtos
+        selected = []
+        for txt in metadata.paragraphs:
+            if len(txt) >= 40:
+                selected.append(txt)
+            if len(' '.join(selected)) >= self.summary_min_chars:
+                break
+        candidate = ' '.join(selected).strip()
+        if candidate:
+            return self._truncate_summary(candidate)
 
         # 3) fallback vazio
         return ""
@@ -314,17 +1809,18 @@ class ChristianNewsScraper:
                 base = detailed
         return self._truncate_summary(base)
 
-    def _article_local_date(self, article: Dict) -> Optional[datetime]:
-        dt_utc = self.parse_article_date(article.get('date'))
-        if not dt_utc:
-            return None
+    def _to_local(self, dt_utc: datetime) -> Optional[datetime]:
         try:
-            aware_utc = dt_utc.replace(tzinfo=timezone.utc)
-            local = aware_utc.astimezone(self.local_tz)
-            return local
+            return dt_utc.replace(tzinfo=timezone.utc).astimezone(self.local_tz)
         except Exception:
             return None
 
+    def _article_local_date(self, article: Dict) -> Optional[datetime]:
+        dt_utc = self.article_datetime(article)
+        if not dt_utc:
+            return None
+        return self._to_local(dt_utc)
+
     def filter_today_articles(self, articles: List[Dict]) -> List[Dict]:
         """Retorna apenas artigos cuja data local (timezone configurado) é hoje."""
         today_local = datetime.now(tz=self.local_tz).date()
@@ -336,11 +1832,32 @@ class ChristianNewsScraper:
         return out
 
     def filter_for_output(self, articles: List[Dict]) -> List[Dict]:
-        """Política de saída: prioriza notícias de hoje (timezone configurado); se não houver, usa recentes (<= max_age_hours)."""
-        today = self.filter_today_articles(articles)
-        if today:
-            return today
-        return self.filter_recent_articles(articles, max_age_hours=self.max_age_hours)
+        """Política de saída: prioriza notícias de hoje (timezone configurado); se não houver, usa recentes (<= max_age_hours).
+        Cada data é interpretada uma única vez para os dois critérios."""
+        today_local = datetime.now(tz=self.local_tz).date()
+        window = timedelta(hours=self.max_age_hours)
+        now_utc = datetime.utcnow()
+        today: List[Dict] = []
+        recent: List[Dict] = []
+        for a in articles:
+            dt_utc = self.article_datetime(a)
+            if dt_utc is None:
+                continue
+            if isinstance(a, Article) and a.local_tz is self.local_tz:
+                local_date = a.local_date
+            else:
+                local = self._to_local(dt_utc)
+                local_date = local.date() if local else None
+            if local_date == today_local:
+                today.append(a)
+            if now_utc - dt_utc <= window:
+                recent.append(a)
+        return today or recent
+
+    def build_output(self, news_data: List[Dict]) -> NewsOutput:
+        """Etapa de montagem da saída: deriva contagens por fonte/categoria do resultado de scrape_all_sources,
+        que é o único lugar onde filter_for_output é aplicado (não filtra de novo)."""
+        return NewsOutput.from_articles(news_data)
 
     def scrape_generic_rss(self, source_name: str, rss_url: str, category: str = 'Notícias Cristãs', limit: int = 10) -> List[Dict]:
         """Coletor genérico de RSS: normaliza itens para o nosso esquema."""
@@ -351,7 +1868,7 @@ class ChristianNewsScraper:
                 'Accept': 'application/rss+xml, application/xml, text/xml',
                 'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
             }
-            response = requests.get(rss_url, headers=headers, timeout=15)
+            response = self.fetch(rss_url, headers=headers)
             if response.status_code != 200:
                 logger.warning(f"Falha ao acessar RSS {source_name}: {response.status_code}")
                 return news_list
@@ -371,10 +1888,10 @@ class ChristianNewsScraper:
                     title = self.clean_text(title_elem.get_text())
                     link = (link_elem.get_text() or '').strip()
                     summary_raw = description_elem.get_text() if description_elem else ''
-                    summary = self.clean_text(BeautifulSoup(summary_raw, 'html.parser').get_text()) if summary_raw else ''
+                    summary = self.clean_text(strip_html(summary_raw)) if summary_raw else ''
                     date = pub_date_elem.get_text() if pub_date_elem else datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
-
-                    image_url = self.extract_image_from_content(link)
+                    if self.is_stale_feed_item(source_name, date):
+                        continue
 
                     news_list.append({
                         'title': title,
@@ -383,7 +1900,7 @@ class ChristianNewsScraper:
                         'source': source_name,
                         'date': date,
                         'category': category,
-                        'image_url': image_url
+                        'image_url': None
                     })
                 except Exception as e:
                     logger.warning(f"Erro ao parsear item de {source_name}: {e}")
@@ -417,109 +1934,61 @@ class ChristianNewsScraper:
         except Exception as e:
             logger.error(f"Erro ao limpar registros antigos no Supabase: {e}")
 
+    def score_relevance(self, match: 'KeywordMatch') -> Tuple[int, List[str], List[str]]:
+        """relevanceScore, detectedKeywords e autoTags (mesma regra do frontend) a partir de um casamento."""
+        locations = match.keywords.get('location', [])
+        topics = match.keywords.get('topic', [])
+        score = len(locations) * self.RELEVANCE_WEIGHTS['location'] + len(topics) * self.RELEVANCE_WEIGHTS['topic']
+        detected = list(dict.fromkeys(locations + topics))
+        tags = [tag for tag, terms in self.AUTO_TAGS.items() if any(term in detected for term in terms)]
+        return score, detected, tags
+
+    def domain_is_trusted(self, url: str) -> bool:
+        try:
+            domain = urlparse(url or '').netloc.lower()
+        except Exception:
+            domain = ''
+        return any(domain.endswith(d) for d in self.TRUSTED_DOMAINS if d)
+
+    def approved_despite_negatives(self, article: Dict, mode: str) -> bool:
+        """STRICT aprova fontes e domínios confiáveis mesmo com termos negativos (exceto Google News)."""
+        if (mode or 'STRICT').strip().upper() != 'STRICT':
+            return False
+        if str(article.get('source', '')).startswith('Google News - '):
+            return False
+        return article.get('source') in self.TRUSTED_SOURCES or self.domain_is_trusted(article.get('url', ''))
+
     def filter_content_for_reconciliation(self, news_list: List[Dict], mode: str = 'STRICT') -> List[Dict]:
         """Filter news content to align with Reconciliation brotherhood values
         Modes:
         - STRICT: original rules (positive keywords/domain/source required, no negatives)
         - RELAXED: approve any article that does not contain negative keywords
         - OFF: disable filtering (pass-through)
+        Todas as listas de palavras-chave são verificadas em uma única varredura (self.keyword_matcher),
+        que também preenche relevanceScore/detectedKeywords/autoTags.
         """
-        
-        # Keywords that align with reformed theology and reconciliation ministry
-        positive_keywords = [
-            'reconciliação', 'reconciliation', 'graça', 'grace', 'doutrina', 'doctrine',
-            'teologia', 'theology', 'reforma', 'reformed', 'calvinismo', 'calvinist',
-            'soberania', 'sovereignty', 'predestinação', 'predestination', 'eleição', 'election',
-            'santificação', 'sanctification', 'justificação', 'justification', 'regeneração',
-            'igreja', 'church', 'irmandade', 'brotherhood', 'comunhão', 'fellowship',
-            'dons espirituais', 'spiritual gifts', 'edificação', 'edification', 'unidade', 'unity',
-            'paz', 'peace', 'perdão', 'forgiveness', 'restauração', 'restoration',
-            'perseguição', 'persecution', 'missões', 'missions', 'evangelização', 'evangelism',
-            'bíblia', 'bible', 'escrituras', 'scripture', 'palavra de deus', 'word of god',
-            'oração', 'prayer', 'jejum', 'fasting', 'adoração', 'worship',
-            'israel', 'jerusalem', 'jerusalém', 'profecia', 'prophecy', 'escatologia', 'eschatology',
-            'oriente médio', 'middle east', 'sionismo', 'zionism', 'judeus', 'jews',
-            'arqueologia', 'archaeology', 'história antiga', 'ancient history', 'egito', 'egypt',
-            'mesopotâmia', 'mesopotamia', 'israel antigo', 'ancient israel', 'jericó', 'jericho',
-            'jerusalém antiga', 'ancient jerusalem', 'mar morto', 'dead sea', 'qumran', 'caverna', 'cave',
-            'manuscritos do mar morto', 'dead sea scrolls', 'tabernáculo', 'templo', 'arqueólogos', 'archaeologists',
-            'escavação', 'excavation', 'achados', 'finds', 'descoberta', 'discovery', 'civilizações', 'civilizations',
-            'período interbíblico', 'intertestamental', 'patrística', 'pais da igreja',
-            'escavações bíblicas', 'idade média', 'história da igreja',
-            'debates teológicos', 'controvérsias teológicas',
-            'arminianismo',
-            'fariseus', 'saduceus', 'essênios', 'zelotes',
-            'usos e costumes da bíblia', 'costumes bíblicos', 'cultura bíblica', 'cultura judaica',
-            # Ciência e fé
-            'criacionismo', 'criação bíblica', 'intelligent design', 'desenho inteligente'
-        ]
-        
-        # Keywords to avoid (prosperity gospel, extreme charismatic, liberal theology, fofocas/entretenimento)
-        negative_keywords = [
-            'prosperidade', 'prosperity', 'determinação', 'confissão positiva',
-            'teologia liberal', 'liberal theology', 'universalismo', 'universalism',
-            'barganhar com deus', 'bargain with god', 'milagres financeiros',
-            'unção do riso', 'holy laughter', 'cair no espírito', 'slain in spirit',
-            'profetadas', 'prophetic words', 'revelações extras', 'extra revelations',
-            # Evitar fofoca/celebridades/moda/entretenimento
-            'fofoca', 'celebridade', 'celebridades', 'famosos', 'moda', 'novela', 'entretenimento', 'reality show', 'bbb',
-            'astrologia', 'signos', 'zodíaco', 'tarot'
-        ]
-        
-        # Whitelist de domínios confiáveis
-        trusted_domains = [
-            'gospelprime.com.br', 'guiame.com.br', 'portasabertas.org.br',
-            'cafetorah.com', 'folhagospel.com', 'cpadnews.com.br', 'cpad.com.br',
-            'bbc.com', 'bbc.co.uk', 'bbc.com.br', 'cnnbrasil.com.br',
-            'nationalgeographic.com', 'nationalgeographicbrasil.com', 'abril.com.br',
-            'uol.com.br', 'terra.com.br',
-            # Confiar em domínios da Galileu para evitar descarte indevido
-            'globo.com', 'globo.com.br', 'revistagalileu.globo.com'
-        ]
-        
         filtered_news = []
+        # Modo de filtro baseado em env
+        mode_upper = (mode or 'STRICT').strip().upper()
         
         for article in news_list:
-            title_lower = article['title'].lower()
-            summary_lower = article['summary'].lower()
-            content = f"{title_lower} {summary_lower}"
-            
-            # Check for positive keywords
-            has_positive = any(keyword.lower() in content for keyword in positive_keywords)
+            match = self.keyword_matcher.match(f"{article['title']} {article['summary']}")
+            score, detected, tags = self.score_relevance(match)
+            article['relevanceScore'] = score
+            article['detectedKeywords'] = detected
+            article['autoTags'] = tags
             
-            # Check for negative keywords
-            has_negative = any(keyword.lower() in content for keyword in negative_keywords)
+            # Check for positive / negative keywords
+            has_positive = match.has('positive')
+            has_negative = match.has('negative')
 
-            # Política sem contexto bíblico: caso o texto trate de política/legislação
-            # sem conexão clara com fé/ética cristã, filtramos como negativo
-            politics_keywords = [
-                'política', 'eleição', 'partido', 'candidato', 'campanha', 'senador', 'deputado', 'vereador',
-                'presidente', 'governo', 'congresso', 'assembleia', 'parlamento', 'projeto de lei', 'lei', 'decisão judicial'
-            ]
-            politics_context_keywords = [
-                'bíblia', 'bíblico', 'igreja', 'cristão', 'cristãos', 'ética cristã', 'valores cristãos', 'teologia',
-                'reconciliação', 'perdão', 'vida', 'família', 'defesa da fé'
-            ]
-            has_politics = any(k in content for k in politics_keywords)
-            has_biblical_context = any(k in content for k in politics_context_keywords)
-            if has_politics and not has_biblical_context:
+            # Política sem contexto bíblico conta como negativo
+            if match.has('politics') and not match.has('politics_context'):
                 has_negative = True
             
-            # Fonte confiável por nome
-            trusted_sources = ['Voltemos ao Evangelho', 'Monergismo', 'Portas Abertas', 
-                              'Portas Abertas - Cristãos Perseguidos', 'Cafetorah - Notícias de Israel',
-                              'Folha Gospel', 'Revista Galileu', 'Revista Galileu - Arqueologia']
-            
             # Verificar domínio do link
-            domain = ''
-            try:
-                domain = urlparse(article.get('url', '')).netloc.lower()
-            except Exception:
-                domain = ''
-            domain_is_trusted = any(domain.endswith(d) for d in trusted_domains if d)
+            domain_is_trusted = self.domain_is_trusted(article.get('url', ''))
             
-            # Modo de filtro baseado em env
-            mode_upper = (mode or 'STRICT').strip().upper()
             is_google_news = str(article.get('source', '')).startswith('Google News - ')
             
             if mode_upper == 'OFF':
@@ -549,7 +2018,7 @@ class ChristianNewsScraper:
                     logger.info(f"❌ Filtered out (Google News) article: {article['title'][:50]}...")
                 continue
             
-            if (has_positive and not has_negative) or (article['source'] in trusted_sources) or domain_is_trusted:
+            if (has_positive and not has_negative) or (article['source'] in self.TRUSTED_SOURCES) or domain_is_trusted:
                 filtered_news.append(article)
                 logger.info(f"✅ Approved article: {article['title'][:50]}...")
             else:
@@ -568,73 +2037,131 @@ class ChristianNewsScraper:
         text = re.sub(r'[^\w\s\-.,!?;:()\[\]"\'áàâãéèêíìîóòôõúùûçÁÀÂÃÉÈÊÍÌÎÓÒÔÕÚÙÛÇ]', '', text)
         return text
 
-    def extract_image_from_content(self, url: str) -> Optional[str]:
-        """Extract the main image from article content"""
+    def _resolve_image_url(self, img_url: Optional[str], base_url: str) -> Optional[str]:
+        img_url = (img_url or '').strip()
+        if img_url.startswith('http'):
+            return img_url
+        if img_url.startswith('/'):
+            return urljoin(base_url, img_url)
+        return None
+
+    def parse_article_metadata(self, soup: BeautifulSoup, url: str) -> ArticleMetadata:
+        """Percorre o documento uma única vez coletando meta tags, link rel, título, data e parágrafos."""
+        metadata = ArticleMetadata(url=url)
+        props: Dict[str, str] = {}
+        descriptions: List[str] = []
+        link_image = None
+        h1_text = ''
+        doc_title = ''
+        time_value = None
+        for tag in soup.find_all(['meta', 'link', 'title', 'h1', 'time', 'p']):
+            name = tag.name
+            if name == 'meta':
+                key = (tag.get('property') or tag.get('name') or tag.get('itemprop') or '').strip().lower()
+                content = (tag.get('content') or '').strip()
+                if not key or not content:
+                    continue
+                props.setdefault(key, content)
+                if key in ('description', 'og:description', 'twitter:description'):
+                    cleaned = self.clean_text(content)
+                    if cleaned:
+                        descriptions.append(cleaned)
+            elif name == 'link':
+                rel = ' '.join(tag.get('rel') or []).lower()
+                href = tag.get('href')
+                if not href:
+                    continue
+                if rel == 'canonical' and not metadata.canonical_url:
+                    metadata.canonical_url = urljoin(url, href)
+                elif rel == 'image_src' and not link_image:
+                    link_image = href
+            elif name == 'title' and not doc_title:
+                doc_title = self.clean_text(tag.get_text())
+            elif name == 'h1' and not h1_text:
+                h1_text = self.clean_text(tag.get_text())
+            elif name == 'time' and time_value is None and tag.get('datetime'):
+                time_value = tag.get('datetime')
+            elif name == 'p' and len(metadata.paragraphs) < 8:
+                metadata.paragraphs.append(self.clean_text(tag.get_text()))
+
+        metadata.title = self.clean_text(props.get('og:title') or props.get('twitter:title') or '') or h1_text or doc_title
+        metadata.description = max(descriptions, key=len) if descriptions else ''
+        metadata.published_time = (props.get('article:published_time') or props.get('og:published_time')
+                                   or props.get('datepublished') or time_value)
+        if not metadata.canonical_url and props.get('og:url'):
+            metadata.canonical_url = urljoin(url, props['og:url'])
+
+        for candidate in (props.get('og:image'), props.get('twitter:image'), props.get('twitter:image:src'), link_image):
+            metadata.image = self._resolve_image_url(candidate, url)
+            if metadata.image:
+                break
+        if not metadata.image:
+            # Sem meta tags: procurar a imagem principal no corpo do artigo
+            for selector in ['.post-thumbnail img', '.featured-image img', 'article img', '.content img',
+                             '.entry-content img', 'img[data-src]', 'img[srcset]']:
+                img_tag = soup.select_one(selector)
+                if not img_tag:
+                    continue
+                # Preferir src; se não houver, tentar data-src; se houver srcset, pegar a primeira URL
+                img_url = img_tag.get('src') or img_tag.get('data-src')
+                if not img_url and img_tag.get('srcset'):
+                    img_url = img_tag.get('srcset').split(',')[0].strip().split(' ')[0]
+                metadata.image = self._resolve_image_url(img_url, url)
+                if metadata.image:
+                    break
+        return metadata
+
+    def extract_article_metadata(self, url: str) -> Optional[ArticleMetadata]:
+        """Metadados do artigo (título, descrição, imagem, data, URL canônica) a partir de um único download
+        e um único parse por execução; imagem, resumo e scrapers consomem o mesmo registro."""
         try:
-            response = self.session.get(url, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Try different selectors for images
-                image_selectors = [
-                    'meta[property="og:image"]',
-                    'meta[name="twitter:image"]',
-                    'meta[name="twitter:image:src"]',
-                    'link[rel="image_src"]',
-                    '.post-thumbnail img',
-                    '.featured-image img',
-                    'article img',
-                    '.content img',
-                    '.entry-content img',
-                    'img[data-src]',
-                    'img[srcset]'
-                ]
-                
-                for selector in image_selectors:
-                    if selector.startswith('meta'):
-                        meta_tag = soup.select_one(selector)
-                        if meta_tag and meta_tag.get('content'):
-                            img_url = meta_tag.get('content')
-                            if img_url.startswith('http'):
-                                return img_url
-                            elif img_url.startswith('/'):
-                                return urljoin(url, img_url)
-                    elif selector.startswith('link'):
-                        link_tag = soup.select_one(selector)
-                        if link_tag and link_tag.get('href'):
-                            img_url = link_tag.get('href')
-                            if img_url.startswith('http'):
-                                return img_url
-                            elif img_url.startswith('/'):
-                                return urljoin(url, img_url)
-                    else:
-                        img_tag = soup.select_one(selector)
-                        if img_tag:
-                            # Preferir src; se não houver, tentar data-src; se houver srcset, pegar a primeira URL
-                            img_url = img_tag.get('src') or img_tag.get('data-src')
-                            if not img_url:
-                                srcset = img_tag.get('srcset')
-                                if srcset:
-                                    # srcset pode conter múltiplas URLs separadas por vírgulas
-                                    first = srcset.split(',')[0].strip().split(' ')[0]
-                                    img_url = first
-                            if img_url:
-                                if img_url.startswith('http'):
-                                    return img_url
-                                elif img_url.startswith('/'):
-                                    return urljoin(url, img_url)
-                                
+            if not url:
+                return None
+            # Página completa já baixada nesta execução (ex.: pelo scraper): reutiliza
+            page = self.page_cache.peek(url)
+            if page is None and self.head_only_fetch:
+                head = self.page_cache.get(url, self._load_page_head, variant='head:')
+                if head is None or not head.ok:
+                    return None
+                if not head.partial:
+                    # Documento inteiro coube no limite: vale como página completa
+                    self.page_cache.put(url, head)
+                    page = head
+                else:
+                    first_parse = head.metadata is None
+                    metadata = self._page_metadata(head, url)
+                    complete = self._metadata_is_complete(metadata)
+                    if first_parse:
+                        with self._head_stats_lock:
+                            self.head_fetch_stats['head_only' if complete else 'full_fallback'] += 1
+                    if complete:
+                        return metadata
+                    # Sem og:image / description no <head>: cai para o corpo completo
+            if page is None or not page.ok:
+                page = self.fetch_page(url)
+            if not page:
+                return None
+            return self._page_metadata(page, url)
         except Exception as e:
-            logger.warning(f"Error extracting image from {url}: {e}")
-            
-        return None
+            logger.warning(f"Error extracting metadata from {url}: {e}")
+            return None
+
+    def extract_image_from_content(self, url: str) -> Optional[str]:
+        """Extract the main image from article content"""
+        if self.seen_index is not None and url:
+            # Artigo já enriquecido em execução anterior: a imagem não muda com a URL
+            known = self.seen_index.lookup(url)
+            if known and known['record'].get('image_url'):
+                return known['record']['image_url']
+        metadata = self.extract_article_metadata(url)
+        return metadata.image if metadata else None
 
     def scrape_gospel_prime(self) -> List[Dict]:
         """Scrape news from Gospel Prime"""
         news_list = []
         try:
             # Try RSS first
-            response = self.session.get(self.sources['gospel_prime']['rss'], timeout=10)
+            response = self.fetch(self.sources['gospel_prime']['rss'])
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'xml')
                 items = soup.find_all('item')[:20]  # Aumenta para 20 itens recentes
@@ -646,10 +2173,7 @@ class ChristianNewsScraper:
                         link = item.link.text if item.link else ""
                         pub_date = item.pubDate.text if item.pubDate else ""
                         
-                        if title and link:
-                            # Extract image from article
-                            image_url = self.extract_image_from_content(link)
-                            
+                        if title and link and not self.is_stale_feed_item('Gospel Prime', pub_date):
                             news_list.append({
                                 'title': title,
                                 'summary': description[:200] + "..." if len(description) > 200 else description,
@@ -657,7 +2181,7 @@ class ChristianNewsScraper:
                                 'source': 'Gospel Prime',
                                 'date': pub_date,
                                 'category': 'Notícias Cristãs',
-                                'image_url': image_url
+                                'image_url': None
                             })
                     except Exception as e:
                         logger.warning(f"Error parsing Gospel Prime item: {e}")
@@ -674,7 +2198,7 @@ class ChristianNewsScraper:
         try:
             query = "IPB Igreja Presbiteriana Brasil eventos teológicos"
             url = f"https://news.google.com/rss/search?q={query}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'xml')
@@ -713,7 +2237,7 @@ class ChristianNewsScraper:
         try:
             query = "Luís Sayão teólogo pastor pregador"
             url = f"https://news.google.com/rss/search?q={query}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'xml')
@@ -752,7 +2276,7 @@ class ChristianNewsScraper:
         try:
             query = "Hernandes Dias Lopes pastor pregador teólogo"
             url = f"https://news.google.com/rss/search?q={query}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'xml')
@@ -791,7 +2315,7 @@ class ChristianNewsScraper:
         try:
             query = "Augustus Nicodemus pastor teólogo reformado"
             url = f"https://news.google.com/rss/search?q={query}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'xml')
@@ -829,7 +2353,7 @@ class ChristianNewsScraper:
         news_list = []
         try:
             # Try RSS first
-            response = self.session.get(self.sources['guiame']['rss'], timeout=10)
+            response = self.fetch(self.sources['guiame']['rss'])
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'xml')
                 items = soup.find_all('item')[:8]  # Get latest 8 items
@@ -841,10 +2365,7 @@ class ChristianNewsScraper:
                         link = item.link.text if item.link else ""
                         pub_date = item.pubDate.text if item.pubDate else ""
                         
-                        if title and link:
-                            # Extract image from article
-                            image_url = self.extract_image_from_content(link)
-                            
+                        if title and link and not self.is_stale_feed_item('Guiame', pub_date):
                             news_list.append({
                                 'title': title,
                                 'summary': description[:200] + "..." if len(description) > 200 else description,
@@ -852,7 +2373,7 @@ class ChristianNewsScraper:
                                 'source': 'Guiame',
                                 'date': pub_date,
                                 'category': 'Gospel',
-                                'image_url': image_url
+                                'image_url': None
                             })
                     except Exception as e:
                         logger.warning(f"Error parsing Guiame item: {e}")
@@ -870,9 +2391,9 @@ class ChristianNewsScraper:
             base = self.sources['portas_abertas']['url']
             list_url = f"{base}/noticias"
 
-            response = self.session.get(list_url, timeout=15)
+            response = self.fetch(list_url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
 
                 # Estratégia mais robusta: coletar links com padrão /noticias/ e depois abrir cada artigo
                 links = set()
@@ -885,44 +2406,14 @@ class ChristianNewsScraper:
 
                 for link in links:
                     try:
-                        art_resp = self.session.get(link, timeout=15)
-                        if art_resp.status_code != 200:
+                        metadata = self.extract_article_metadata(link)
+                        if not metadata:
                             continue
-                        art = BeautifulSoup(art_resp.content, 'html.parser')
-
-                        # Título: meta og:title ou h1
-                        title = None
-                        og_title = art.find('meta', attrs={'property': 'og:title'})
-                        if og_title and og_title.get('content'):
-                            title = self.clean_text(og_title['content'])
-                        if not title:
-                            h1 = art.find('h1')
-                            if h1:
-                                title = self.clean_text(h1.get_text())
-
-                        # Resumo: meta description/og:description ou primeiro parágrafo
-                        summary = ''
-                        og_desc = art.find('meta', attrs={'property': 'og:description'})
-                        if og_desc and og_desc.get('content'):
-                            summary = self.clean_text(og_desc['content'])
-                        if not summary:
-                            meta_desc = art.find('meta', attrs={'name': 'description'})
-                            if meta_desc and meta_desc.get('content'):
-                                summary = self.clean_text(meta_desc['content'])
-                        if not summary:
-                            p = art.find('article') or art
-                            p_tag = p.find('p') if p else None
-                            if p_tag:
-                                summary = self.clean_text(p_tag.get_text())
-
-                        # Imagem: og:image
-                        image_url = None
-                        og_img = art.find('meta', attrs={'property': 'og:image'})
-                        if og_img and og_img.get('content'):
-                            image_url = urljoin(base, og_img['content'])
-                        if not image_url:
-                            # fallback: tentar extrair do conteúdo
-                            image_url = self.extract_image_from_content(link)
+
+                        # Título: og:title ou h1; resumo: description ou primeiro parágrafo; imagem: og:image
+                        title = metadata.title
+                        summary = metadata.description or next((p for p in metadata.paragraphs if p), '')
+                        image_url = metadata.image
 
                         if title and link:
                             news_list.append({
@@ -930,7 +2421,7 @@ class ChristianNewsScraper:
                                 'summary': summary[:200] + "..." if len(summary) > 200 else summary,
                                 'url': link,
                                 'source': 'Portas Abertas',
-                                'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                                'date': metadata.published_time or datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                                 'category': 'Perseguição Religiosa',
                                 'image_url': image_url
                             })
@@ -958,9 +2449,9 @@ class ChristianNewsScraper:
             
             for url in urls:
                 try:
-                    response = self.session.get(url, timeout=15)
+                    response = self.fetch(url)
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
+                        soup = make_soup(response.content)
                         
                         # Look for news articles with different selectors
                         articles = []
@@ -1049,9 +2540,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = self.sources['cafetorah_israel']['url']
-            response = self.session.get(url, timeout=15)
+            response = self.fetch(url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
                 
                 # Look for news articles about Israel
                 articles = soup.find_all(['article', 'div'], class_=re.compile(r'(post|article|news|entry)', re.I))[:8]
@@ -1077,9 +2568,6 @@ class ChristianNewsScraper:
                             link = urljoin('https://cafetorah.com', link_elem['href'])
                             summary = self.clean_text(summary_elem.get_text() if summary_elem else "")
                             
-                            # Extract image
-                            image_url = self.extract_image_from_content(link)
-                            
                             if title and len(title) > 10:
                                 news_list.append({
                                     'title': title,
@@ -1088,7 +2576,7 @@ class ChristianNewsScraper:
                                     'source': 'Cafetorah - Notícias de Israel',
                                     'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                                     'category': 'Israel e Oriente Médio',
-                                    'image_url': image_url
+                                    'image_url': None
                                 })
                     except Exception as e:
                         logger.warning(f"Error parsing Cafetorah Israel item: {e}")
@@ -1105,7 +2593,7 @@ class ChristianNewsScraper:
         try:
             # Use RSS feed for more reliable scraping
             rss_url = 'https://folhagospel.com/feed/'
-            response = self.session.get(rss_url, timeout=15)
+            response = self.fetch(rss_url)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'xml')
@@ -1126,14 +2614,12 @@ class ChristianNewsScraper:
                             summary = ""
                             if description_elem:
                                 # Clean HTML from description
-                                desc_soup = BeautifulSoup(description_elem.get_text(), 'html.parser')
-                                summary = self.clean_text(desc_soup.get_text())
+                                summary = self.clean_text(strip_html(description_elem.get_text()))
                             
                             # Get publication date or use current
                             date = pub_date_elem.get_text() if pub_date_elem else datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
-                            
-                            # Extract image
-                            image_url = self.extract_image_from_content(link)
+                            if self.is_stale_feed_item('Folha Gospel', date):
+                                continue
                             
                             if title and len(title) > 10:
                                 news_list.append({
@@ -1143,7 +2629,7 @@ class ChristianNewsScraper:
                                     'source': 'Folha Gospel',
                                     'date': date,
                                     'category': 'Notícias Cristãs',
-                                    'image_url': image_url
+                                    'image_url': None
                                 })
                                 
                     except Exception as e:
@@ -1171,7 +2657,7 @@ class ChristianNewsScraper:
                 'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
             }
             
-            response = requests.get(rss_url, headers=headers, timeout=15)
+            response = self.fetch(rss_url, headers=headers)
             
             if response.status_code == 200:
                 # Parse XML using xml parser for RSS
@@ -1193,8 +2679,7 @@ class ChristianNewsScraper:
                             summary = ""
                             if description_elem:
                                 # Clean HTML from description
-                                desc_soup = BeautifulSoup(description_elem.get_text(), 'html.parser')
-                                summary = self.clean_text(desc_soup.get_text())
+                                summary = self.clean_text(strip_html(description_elem.get_text()))
                             
                             # Get publication date or use current
                             date = pub_date_elem.get_text() if pub_date_elem else datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
@@ -1208,7 +2693,7 @@ class ChristianNewsScraper:
                                 # Try to extract from content
                                 content_elem = item.find('content:encoded') or item.find('encoded')
                                 if content_elem:
-                                    content_soup = BeautifulSoup(content_elem.get_text(), 'html.parser')
+                                    content_soup = make_soup(content_elem.get_text())
                                     img_tag = content_soup.find('img')
                                     if img_tag and img_tag.get('src'):
                                         image_url = img_tag.get('src')
@@ -1241,9 +2726,9 @@ class ChristianNewsScraper:
         try:
             base_url = self.sources['cpad_news']['url']
             list_url = urljoin(base_url, '/noticias')
-            response = self.session.get(list_url, timeout=15)
+            response = self.fetch(list_url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
 
                 candidate_blocks = []
                 selectors = [
@@ -1280,21 +2765,14 @@ class ChristianNewsScraper:
                         summary = self.clean_text(summary_elem.get_text() if summary_elem else '')
 
                         pub_date = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
+                        metadata = None
                         if not summary or len(summary) < 30:
-                            try:
-                                a_resp = self.session.get(link, timeout=15)
-                                if a_resp.status_code == 200:
-                                    a_soup = BeautifulSoup(a_resp.content, 'html.parser')
-                                    meta_desc = a_soup.find('meta', attrs={'name': 'description'})
-                                    if meta_desc and meta_desc.get('content'):
-                                        summary = self.clean_text(meta_desc.get('content'))
-                                    time_meta = a_soup.find('meta', attrs={'property': 'article:published_time'}) or a_soup.find('time')
-                                    if time_meta:
-                                        pub_date = time_meta.get('datetime') or self.clean_text(time_meta.get_text()) or pub_date
-                            except Exception as e:
-                                logger.debug(f"Fallback to meta description failed for CPAD article: {e}")
+                            metadata = self.extract_article_metadata(link)
+                            if metadata:
+                                summary = metadata.description or summary
+                                pub_date = metadata.published_time or pub_date
 
-                        image_url = self.extract_image_from_content(link)
+                        image_url = metadata.image if metadata else None
 
                         news_list.append({
                             'title': title,
@@ -1334,9 +2812,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = self.sources['bbc_portuguese']['url']
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
                 # Tenta diferentes padrões de blocos de promoção/stream usados pela BBC
                 articles = soup.find_all(['article', 'div'], class_=re.compile(r'(Promo|promo|article|lx-stream|gs-c-promo)', re.I))[:8]
                 for article in articles:
@@ -1350,7 +2828,6 @@ class ChristianNewsScraper:
                             title = self.clean_text(title_elem.get_text())
                             link = urljoin(url, link_elem['href'])
                             summary = self.clean_text(summary_elem.get_text() if summary_elem else '')
-                            image_url = self.extract_image_from_content(link)
                             if title and len(title) > 10:
                                 news_list.append({
                                     'title': title,
@@ -1359,7 +2836,7 @@ class ChristianNewsScraper:
                                     'source': 'BBC News Brasil',
                                     'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                                     'category': 'Arqueologia e História',
-                                    'image_url': image_url
+                                    'image_url': None
                                 })
                     except Exception as e:
                         logger.warning(f"Error parsing BBC Portuguese item: {e}")
@@ -1373,9 +2850,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = self.sources['bbc_arqueologia']['url']
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
                 articles = soup.find_all(['article', 'div'], class_=re.compile(r'(Promo|promo|article|lx-stream|gs-c-promo)', re.I))[:8]
                 for article in articles:
                     try:
@@ -1388,7 +2865,6 @@ class ChristianNewsScraper:
                             title = self.clean_text(title_elem.get_text())
                             link = urljoin(url, link_elem['href'])
                             summary = self.clean_text(summary_elem.get_text() if summary_elem else '')
-                            image_url = self.extract_image_from_content(link)
                             if title and len(title) > 10:
                                 news_list.append({
                                     'title': title,
@@ -1397,7 +2873,7 @@ class ChristianNewsScraper:
                                     'source': 'BBC News Brasil - Arqueologia',
                                     'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                                     'category': 'Arqueologia e História',
-                                    'image_url': image_url
+                                    'image_url': None
                                 })
                     except Exception as e:
                         logger.warning(f"Error parsing BBC Arqueologia item: {e}")
@@ -1411,9 +2887,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = self.sources['galileu_arqueologia']['url']
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
                 articles = soup.find_all(['article', 'div'], class_=re.compile(r'(post|article|materia|card)', re.I))[:8]
                 for article in articles:
                     try:
@@ -1426,7 +2902,6 @@ class ChristianNewsScraper:
                             title = self.clean_text(title_elem.get_text())
                             link = urljoin(url, link_elem['href'])
                             summary = self.clean_text(summary_elem.get_text() if summary_elem else '')
-                            image_url = self.extract_image_from_content(link)
                             if title and len(title) > 10:
                                 news_list.append({
                                     'title': title,
@@ -1435,7 +2910,7 @@ class ChristianNewsScraper:
                                     'source': 'Revista Galileu - Arqueologia',
                                     'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                                     'category': 'Arqueologia e História',
-                                    'image_url': image_url
+                                    'image_url': None
                                 })
                     except Exception as e:
                         logger.warning(f"Error parsing Galileu Arqueologia item: {e}")
@@ -1449,9 +2924,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = self.sources['cnnbrasil_arqueologia']['url']
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
                 articles = soup.find_all(['article', 'div'], class_=re.compile(r'(post|article|card|tags-list|news)', re.I))[:8]
                 for article in articles:
                     try:
@@ -1464,7 +2939,6 @@ class ChristianNewsScraper:
                             title = self.clean_text(title_elem.get_text())
                             link = urljoin(url, link_elem['href'])
                             summary = self.clean_text(summary_elem.get_text() if summary_elem else '')
-                            image_url = self.extract_image_from_content(link)
                             if title and len(title) > 10:
                                 news_list.append({
                                     'title': title,
@@ -1473,7 +2947,7 @@ class ChristianNewsScraper:
                                     'source': 'CNN Brasil - Arqueologia',
                                     'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                                     'category': 'Arqueologia e História',
-                                    'image_url': image_url
+                                    'image_url': None
                                 })
                     except Exception as e:
                         logger.warning(f"Error parsing CNN Brasil Arqueologia item: {e}")
@@ -1488,9 +2962,9 @@ class ChristianNewsScraper:
         try:
             # URL principal da Revista Galileu
             url = "https://revistagalileu.globo.com/"
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
                 
                 # Buscar artigos nas seções principais
                 articles = soup.find_all(['article', 'div'], class_=re.compile(r'(post|article|materia|card|feed-post)', re.I))[:10]
@@ -1559,9 +3033,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = self.sources['nationalgeo_br_arqueologia']['url']
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
                 articles = soup.find_all(['article', 'div'], class_=re.compile(r'(post|article|card|listing|item)', re.I))[:8]
                 for article in articles:
                     try:
@@ -1574,7 +3048,6 @@ class ChristianNewsScraper:
                             title = self.clean_text(title_elem.get_text())
                             link = urljoin(url, link_elem['href'])
                             summary = self.clean_text(summary_elem.get_text() if summary_elem else '')
-                            image_url = self.extract_image_from_content(link)
                             if title and len(title) > 10:
                                 news_list.append({
                                     'title': title,
@@ -1583,7 +3056,7 @@ class ChristianNewsScraper:
                                     'source': 'National Geographic Brasil - Arqueologia',
                                     'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                                     'category': 'Arqueologia e História',
-                                    'image_url': image_url
+                                    'image_url': None
                                 })
                     except Exception as e:
                         logger.warning(f"Error parsing National Geographic Brasil Arqueologia item: {e}")
@@ -1592,52 +3065,83 @@ class ChristianNewsScraper:
             logger.error(f"Error scraping National Geographic Brasil Arqueologia: {e}")
         return news_list
 
+    def _fetch_google_news_query(self, qconf: Dict) -> List[Dict]:
+        """Baixa e interpreta o RSS de uma consulta do Google News (sem imagens nem redirecionamentos)."""
+        label = qconf.get('label', '')
+        category = qconf.get('category', 'Notícias')
+        url = f"https://news.google.com/rss/search?q={quote(qconf['q'])}&hl=pt-BR&gl=BR&ceid=BR:pt"
+        news_list = []
+        response = self.fetch(url)
+        if response.status_code != 200:
+            return news_list
+        soup = BeautifulSoup(response.content, 'xml')
+        for item in soup.find_all('item')[:6]:
+            try:
+                title = self.clean_text(item.title.text if item.title else '')
+                link_raw = item.link.text if item.link else ''
+                # Extrair URL original quando possível (news.google.com com parâmetro url=)
+                link = link_raw
+                try:
+                    parsed = urlparse(link_raw)
+                    qs = parse_qs(parsed.query)
+                    if 'url' in qs and len(qs['url']) > 0:
+                        link = unquote(qs['url'][0])
+                except Exception:
+                    link = link_raw
+                description = self.clean_text(item.description.text if item.description else '')
+                pub_date = item.pubDate.text if item.pubDate else datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
+                # Antigos saem antes da resolução do link e da extração de imagem
+                if title and link and not self.is_stale_feed_item('Google News (Temas)', pub_date):
+                    news_list.append({
+                        'title': title,
+                        'summary': description[:200] + '...' if len(description) > 200 else description,
+                        'url': link,
+                        'source': f"Google News - {label}" if label else 'Google News',
+                        'date': pub_date,
+                        'category': category,
+                        'image_url': None
+                    })
+            except Exception as e:
+                logger.warning(f"Error parsing Google News item for '{label}': {e}")
+                continue
+        return news_list
+
     def scrape_google_news(self) -> List[Dict]:
-        """Scrape Google News RSS para temas específicos (pt-BR)"""
+        """Scrape Google News RSS para temas específicos (pt-BR).
+        Consultas em paralelo, links resolvidos em lote e resultados reaproveitados por
+        NEWS_GOOGLE_NEWS_CACHE_TTL_MIN (chave: string da consulta)."""
         news_list = []
         try:
-            base = "https://news.google.com/rss/search"
-            queries = self.sources.get('google_news', {}).get('queries', [])
+            queries = [q for q in self.sources.get('google_news', {}).get('queries', []) if q.get('q')]
+            results: Dict[str, List[Dict]] = {}
+            pending = []
             for qconf in queries:
-                label = qconf.get('label', '')
-                query = qconf.get('q', '')
-                category = qconf.get('category', 'Notícias')
-                if not query:
-                    continue
-                url = f"{base}?q={quote(query)}&hl=pt-BR&gl=BR&ceid=BR:pt"
-                response = self.session.get(url, timeout=10)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'xml')
-                    items = soup.find_all('item')[:6]
-                    for item in items:
-                        try:
-                            title = self.clean_text(item.title.text if item.title else '')
-                            link_raw = item.link.text if item.link else ''
-                            # Extrair URL original quando possível (news.google.com com parâmetro url=)
-                            link = link_raw
-                            try:
-                                parsed = urlparse(link_raw)
-                                qs = parse_qs(parsed.query)
-                                if 'url' in qs and len(qs['url']) > 0:
-                                    link = unquote(qs['url'][0])
-                            except Exception:
-                                link = link_raw
-                            description = self.clean_text(item.description.text if item.description else '')
-                            pub_date = item.pubDate.text if item.pubDate else datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
-                            if title and link:
-                                image_url = self.extract_image_from_content(link)
-                                news_list.append({
-                                    'title': title,
-                                    'summary': description[:200] + '...' if len(description) > 200 else description,
-                                    'url': link,
-                                    'source': f"Google News - {label}" if label else 'Google News',
-                                    'date': pub_date,
-                                    'category': category,
-                                    'image_url': image_url
-                                })
-                        except Exception as e:
-                            logger.warning(f"Error parsing Google News item for '{label}': {e}")
-                            continue
+                cached = self.google_news_cache.get(qconf['q']) if self.google_news_cache else None
+                if cached is not None:
+                    results[qconf['q']] = cached
+                else:
+                    pending.append(qconf)
+            if results:
+                logger.info(f"Google News: {len(results)} consultas reaproveitadas do cache, {len(pending)} a buscar")
+
+            fetched = self.map_in_source_context(self._fetch_google_news_query, pending, self.google_news_workers)
+            fetched = [items or [] for items in fetched]
+            new_items = [item for items in fetched for item in items]
+
+            resolved = self.resolve_redirects([item['url'] for item in new_items])
+            for item in new_items:
+                item['url'] = resolved.get(item['url'], item['url'])
+
+            for qconf, items in zip(pending, fetched):
+                results[qconf['q']] = items
+                # Consultas vazias (ou que falharam) não são guardadas: a próxima execução tenta de novo
+                if items and self.google_news_cache is not None:
+                    self.google_news_cache.put(qconf['q'], items)
+            if self.google_news_cache is not None and pending:
+                self.google_news_cache.save()
+
+            for qconf in queries:
+                news_list.extend(results.get(qconf['q'], []))
         except Exception as e:
             logger.error(f"Error scraping Google News: {e}")
         return news_list
@@ -1648,10 +3152,10 @@ class ChristianNewsScraper:
         try:
             url = 'https://noticiasdeisrael.com.br/'
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.fetch(url, headers=headers)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Procurar por artigos
             articles = soup.find_all(['article', 'div'], class_=lambda x: x and any(
@@ -1689,12 +3193,10 @@ class ChristianNewsScraper:
                     
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:100] + '...'
                     
-                    # Imagem
-                    image_url = self.extract_image_from_content(link)
-                    if not image_url:
-                        img_elem = article.find('img')
-                        if img_elem and img_elem.get('src'):
-                            image_url = urljoin(url, img_elem.get('src'))
+                    image_url = None
+                    img_elem = article.find('img')
+                    if img_elem and img_elem.get('src'):
+                        image_url = urljoin(url, img_elem.get('src'))
                     
                     news_list.append({
                         'title': title,
@@ -1714,18 +3216,16 @@ class ChristianNewsScraper:
             
         return news_list
 
-
-
     def scrape_voltemos_evangelho(self) -> List[Dict]:
         """Scrape news from Voltemos ao Evangelho"""
         news_list = []
         try:
             url = 'https://voltemosaoevangelho.com/'
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.fetch(url, headers=headers)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Procurar por artigos
             articles = soup.find_all(['article', 'div'], class_=lambda x: x and any(
@@ -1753,12 +3253,10 @@ class ChristianNewsScraper:
                     summary_elem = article.find('p')
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:100] + '...'
                     
-                    # Imagem
-                    image_url = self.extract_image_from_content(link)
-                    if not image_url:
-                        img_elem = article.find('img')
-                        if img_elem and img_elem.get('src'):
-                            image_url = urljoin(url, img_elem.get('src'))
+                    image_url = None
+                    img_elem = article.find('img')
+                    if img_elem and img_elem.get('src'):
+                        image_url = urljoin(url, img_elem.get('src'))
                     
                     news_list.append({
                         'title': title,
@@ -1784,10 +3282,10 @@ class ChristianNewsScraper:
         try:
             url = 'https://ministeriofiel.com.br/'
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.fetch(url, headers=headers)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Procurar por artigos
             articles = soup.find_all(['article', 'div'], class_=lambda x: x and any(
@@ -1815,12 +3313,10 @@ class ChristianNewsScraper:
                     summary_elem = article.find('p')
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:100] + '...'
                     
-                    # Imagem
-                    image_url = self.extract_image_from_content(link)
-                    if not image_url:
-                        img_elem = article.find('img')
-                        if img_elem and img_elem.get('src'):
-                            image_url = urljoin(url, img_elem.get('src'))
+                    image_url = None
+                    img_elem = article.find('img')
+                    if img_elem and img_elem.get('src'):
+                        image_url = urljoin(url, img_elem.get('src'))
                     
                     news_list.append({
                         'title': title,
@@ -1846,10 +3342,10 @@ class ChristianNewsScraper:
         try:
             url = 'https://www.biblicalarchaeology.org/news/'
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.fetch(url, headers=headers)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Procurar por artigos
             articles = soup.find_all(['article', 'div'], class_=lambda x: x and any(
@@ -1877,12 +3373,10 @@ class ChristianNewsScraper:
                     summary_elem = article.find('p')
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:100] + '...'
                     
-                    # Imagem
-                    image_url = self.extract_image_from_content(link)
-                    if not image_url:
-                        img_elem = article.find('img')
-                        if img_elem and img_elem.get('src'):
-                            image_url = urljoin(url, img_elem.get('src'))
+                    image_url = None
+                    img_elem = article.find('img')
+                    if img_elem and img_elem.get('src'):
+                        image_url = urljoin(url, img_elem.get('src'))
                     
                     news_list.append({
                         'title': title,
@@ -1907,9 +3401,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = 'https://pt.christianitytoday.com/'
-            response = self.session.get(url, timeout=12)
+            response = self.fetch(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
 
             articles = soup.find_all(['article','div'], class_=lambda x: x and any(
                 k in x.lower() for k in ['post','article','entry','card','news']
@@ -1927,11 +3421,10 @@ class ChristianNewsScraper:
                     link = urljoin(url, link_elem.get('href',''))
                     summary_elem = article.find('p')
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:120] + '...'
-                    image_url = self.extract_image_from_content(link)
-                    if not image_url:
-                        img = article.find('img')
-                        if img and img.get('src'):
-                            image_url = urljoin(url, img.get('src'))
+                    image_url = None
+                    img = article.find('img')
+                    if img and img.get('src'):
+                        image_url = urljoin(url, img.get('src'))
                     news_list.append({
                         'title': title,
                         'summary': summary[:200] + '...' if len(summary) > 200 else summary,
@@ -1953,9 +3446,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = 'https://revista.sabnet.org/'
-            response = self.session.get(url, timeout=12)
+            response = self.fetch(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             # Padrões comuns do OJS (obj_article_summary)
             articles = soup.find_all(['div','li','article'], class_=lambda x: x and any(
                 k in x.lower() for k in ['obj_article_summary','post','entry','article']
@@ -1974,7 +3467,6 @@ class ChristianNewsScraper:
                     link = urljoin(url, link_elem.get('href',''))
                     summary_elem = article.find('p')
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:120] + '...'
-                    image_url = self.extract_image_from_content(link)
                     news_list.append({
                         'title': title,
                         'summary': summary[:200] + '...' if len(summary) > 200 else summary,
@@ -1982,7 +3474,7 @@ class ChristianNewsScraper:
                         'source': 'SABNET Revista',
                         'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                         'category': 'Arqueologia e História',
-                        'image_url': image_url
+                        'image_url': None
                     })
                 except Exception as e:
                     logger.warning(f"Error parsing SABNET item: {e}")
@@ -1996,9 +3488,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = 'https://mae.usp.br/'
-            response = self.session.get(url, timeout=12)
+            response = self.fetch(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             articles = soup.find_all(['article','div'], class_=lambda x: x and any(
                 k in x.lower() for k in ['post','article','entry','noticia','news']
             ))[:10]
@@ -2014,7 +3506,6 @@ class ChristianNewsScraper:
                     link = urljoin(url, link_elem.get('href',''))
                     summary_elem = article.find('p')
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:120] + '...'
-                    image_url = self.extract_image_from_content(link)
                     news_list.append({
                         'title': title,
                         'summary': summary[:200] + '...' if len(summary) > 200 else summary,
@@ -2022,7 +3513,7 @@ class ChristianNewsScraper:
                         'source': 'MAE USP',
                         'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                         'category': 'Arqueologia e História',
-                        'image_url': image_url
+                        'image_url': None
                     })
                 except Exception as e:
                     logger.warning(f"Error parsing MAE USP item: {e}")
@@ -2036,9 +3527,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = 'https://arqueologia-iab.com.br/'
-            response = self.session.get(url, timeout=12)
+            response = self.fetch(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             articles = soup.find_all(['article','div'], class_=lambda x: x and any(
                 k in x.lower() for k in ['post','entry','article','news']
             ))[:10]
@@ -2054,7 +3545,6 @@ class ChristianNewsScraper:
                     link = urljoin(url, link_elem.get('href',''))
                     summary_elem = article.find('p')
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:120] + '...'
-                    image_url = self.extract_image_from_content(link)
                     news_list.append({
                         'title': title,
                         'summary': summary[:200] + '...' if len(summary) > 200 else summary,
@@ -2062,7 +3552,7 @@ class ChristianNewsScraper:
                         'source': 'IAB - Instituto de Arqueologia Brasileira',
                         'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                         'category': 'Arqueologia e História',
-                        'image_url': image_url
+                        'image_url': None
                     })
                 except Exception as e:
                     logger.warning(f"Error parsing IAB item: {e}")
@@ -2076,9 +3566,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = 'https://ibarq.org.br/'
-            response = self.session.get(url, timeout=12)
+            response = self.fetch(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             articles = soup.find_all(['article','div'], class_=lambda x: x and any(
                 k in x.lower() for k in ['post','entry','article','news']
             ))[:10]
@@ -2094,7 +3584,6 @@ class ChristianNewsScraper:
                     link = urljoin(url, link_elem.get('href',''))
                     summary_elem = article.find('p')
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:120] + '...'
-                    image_url = self.extract_image_from_content(link)
                     news_list.append({
                         'title': title,
                         'summary': summary[:200] + '...' if len(summary) > 200 else summary,
@@ -2102,7 +3591,7 @@ class ChristianNewsScraper:
                         'source': 'IBArq',
                         'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                         'category': 'Arqueologia Bíblica',
-                        'image_url': image_url
+                        'image_url': None
                     })
                 except Exception as e:
                     logger.warning(f"Error parsing IBArq item: {e}")
@@ -2116,9 +3605,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = 'https://www.incrivelhistoria.com.br/'
-            response = self.session.get(url, timeout=12)
+            response = self.fetch(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             articles = soup.find_all(['article','div'], class_=lambda x: x and any(
                 k in x.lower() for k in ['post','entry','article','news','card']
             ))[:10]
@@ -2134,7 +3623,6 @@ class ChristianNewsScraper:
                     link = urljoin(url, link_elem.get('href',''))
                     summary_elem = article.find('p')
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:120] + '...'
-                    image_url = self.extract_image_from_content(link)
                     news_list.append({
                         'title': title,
                         'summary': summary[:200] + '...' if len(summary) > 200 else summary,
@@ -2142,7 +3630,7 @@ class ChristianNewsScraper:
                         'source': 'Incrível História',
                         'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                         'category': 'História e Arqueologia',
-                        'image_url': image_url
+                        'image_url': None
                     })
                 except Exception as e:
                     logger.warning(f"Error parsing Incrível História item: {e}")
@@ -2156,9 +3644,9 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = 'https://www.arqueologiaeprehistoria.com/'
-            response = self.session.get(url, timeout=12)
+            response = self.fetch(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             articles = soup.find_all(['article','div'], class_=lambda x: x and any(
                 k in x.lower() for k in ['post','entry','article','news']
             ))[:10]
@@ -2174,7 +3662,6 @@ class ChristianNewsScraper:
                     link = urljoin(url, link_elem.get('href',''))
                     summary_elem = article.find('p')
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:120] + '...'
-                    image_url = self.extract_image_from_content(link)
                     news_list.append({
                         'title': title,
                         'summary': summary[:200] + '...' if len(summary) > 200 else summary,
@@ -2182,7 +3669,7 @@ class ChristianNewsScraper:
                         'source': 'Arqueologia e Pré-História',
                         'date': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT'),
                         'category': 'Arqueologia e História',
-                        'image_url': image_url
+                        'image_url': None
                     })
                 except Exception as e:
                     logger.warning(f"Error parsing Arqueologia e Pré-História item: {e}")
@@ -2197,10 +3684,10 @@ class ChristianNewsScraper:
         try:
             url = 'https://teologiabrasileira.com.br/noticias/'
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.fetch(url, headers=headers)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Procurar por artigos
             articles = soup.find_all(['article', 'div'], class_=lambda x: x and any(
@@ -2228,12 +3715,10 @@ class ChristianNewsScraper:
                     summary_elem = article.find('p')
                     summary = self.clean_text(summary_elem.get_text()) if summary_elem else title[:100] + '...'
                     
-                    # Imagem
-                    image_url = self.extract_image_from_content(link)
-                    if not image_url:
-                        img_elem = article.find('img')
-                        if img_elem and img_elem.get('src'):
-                            image_url = urljoin(url, img_elem.get('src'))
+                    image_url = None
+                    img_elem = article.find('img')
+                    if img_elem and img_elem.get('src'):
+                        image_url = urljoin(url, img_elem.get('src'))
                     
                     news_list.append({
                         'title': title,
@@ -2258,10 +3743,10 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = "https://www.monergismo.com/"
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Find articles
             articles = soup.find_all(['article', 'div'], class_=['post', 'entry', 'article'])[:5]
@@ -2314,10 +3799,10 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = "https://ipb.org.br/"
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Find news articles
             articles = soup.find_all(['article', 'div'], class_=['post', 'news', 'noticia'])[:5]
@@ -2370,10 +3855,10 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = "https://www.mackenzie.br/noticias/"
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Find news articles
             articles = soup.find_all(['article', 'div'], class_=['noticia', 'news-item', 'post'])[:5]
@@ -2459,7 +3944,7 @@ class ChristianNewsScraper:
             query = "patrística+teologia+pais+da+igreja"
             url = f"https://news.google.com/rss/search?q={query}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
             
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'xml')
@@ -2499,7 +3984,7 @@ class ChristianNewsScraper:
             query = "arqueologia+bíblica+descobertas+israel+jerusalém"
             url = f"https://news.google.com/rss/search?q={query}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
             
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'xml')
@@ -2539,7 +4024,7 @@ class ChristianNewsScraper:
             query = "calvinismo+arminianismo+predestinação+livre+arbítrio+teologia"
             url = f"https://news.google.com/rss/search?q={query}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
             
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'xml')
@@ -2587,9 +4072,9 @@ class ChristianNewsScraper:
             
             for url in urls:
                 try:
-                    response = self.session.get(url, timeout=15)
+                    response = self.fetch(url)
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
+                        soup = make_soup(response.content)
                         
                         # Try different selectors for articles
                         articles = []
@@ -2678,10 +4163,10 @@ class ChristianNewsScraper:
         news_list = []
         try:
             url = "https://www.cpad.com.br/noticias/"
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Find articles
             articles = soup.find_all(['article', 'div'], class_=['post', 'entry', 'news-item'])[:5]
@@ -2737,7 +4222,7 @@ class ChristianNewsScraper:
             query = "livros+teológicos+reformados+recomendações"
             url = f"https://news.google.com/rss/search?q={query}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
             
-            response = self.session.get(url, timeout=10)
+            response = self.fetch(url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'xml')
@@ -2811,9 +4296,193 @@ class ChristianNewsScraper:
             }
         ]
 
+    def map_in_source_context(self, fn: Callable, items: List, max_workers: int) -> List:
+        """Aplica fn a cada item em paralelo, preservando a ordem; as threads auxiliares herdam o prazo
+        da fonte em execução. Falhas viram None no resultado."""
+        items = list(items)
+        if not items:
+            return []
+        deadline = getattr(_source_context, 'deadline', None)
+        stats = getattr(_source_context, 'stats', None)
+
+        def _run(item):
+            _source_context.deadline = deadline
+            _source_context.stats = stats
+            try:
+                return fn(item)
+            except Exception as e:
+                logger.debug(f"Falha em tarefa paralela: {e}")
+                return None
+            finally:
+                _source_context.deadline = None
+                _source_context.stats = None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))), thread_name_prefix='fanout') as executor:
+            return list(executor.map(_run, items))
+
+    def _resolve_redirect(self, url: str) -> str:
+        # O <head> baixado na resolução fica no page_cache também sob a URL final (imagem sai sem novo download)
+        page = self.page_cache.get(url, self._load_page_head, variant='head:')
+        if page is None or not page.ok or not page.url or page.url == url:
+            return url
+        if (urlparse(page.url).hostname or '').endswith('news.google.com'):
+            return url
+        self.page_cache.put(page.url, page, variant='head:')
+        return page.url
+
+    def resolve_redirects(self, urls: List[str]) -> Dict[str, str]:
+        """Resolve em lote (em paralelo, sem repetir URLs) links de redirecionamento do Google News."""
+        pending = list(dict.fromkeys(
+            u for u in urls if u and (urlparse(u).hostname or '').endswith('news.google.com')
+        ))
+        resolved = self.map_in_source_context(self._resolve_redirect, pending, self.google_news_workers)
+        return {u: r for u, r in zip(pending, resolved) if r}
+
+    def _run_source_with_deadline(self, source_name: str, scraper_func: Callable[[], List[Dict]],
+                                  stats: Optional[SourceRunStats] = None) -> List[Dict]:
+        """Executa uma fonte na thread atual com o prazo NEWS_SOURCE_TIMEOUT aplicado às requisições.
+        O resultado alimenta o circuit breaker: falha é exceção/prazo, ou nenhum artigo com erros HTTP.
+        Se o pool já desistiu da fonte (stats já resolvido), a conclusão tardia não é registrada."""
+        _source_context.deadline = time.monotonic() + self.source_timeout if self.source_timeout > 0 else None
+        _source_context.stats = stats = stats or SourceRunStats()
+        started = time.monotonic()
+        news: List[Dict] = []
+        error = None
+        try:
+            logger.info(f"Scraping {source_name}...")
+            news = scraper_func() or []
+            logger.info(f"Found {len(news)} articles from {source_name} ({time.monotonic() - started:.1f}s)")
+            if not news and stats.http_errors:
+                error = f"nenhum artigo; {stats.http_errors} de {stats.requests} requisições falharam"
+            return news
+        except Exception as e:
+            logger.error(f"Failed to scrape {source_name}: {e}")
+            error = f"{type(e).__name__}: {e}"
+            return []
+        finally:
+            _source_context.deadline = None
+            _source_context.stats = None
+            duration = time.monotonic() - started
+            if not stats.settle():
+                logger.info(f"{source_name} terminou depois que a execução desistiu dela; resultado descartado")
+                return []
+            self._report_source(source_name, 'ok' if error is None else 'failed', duration, len(news), stats, error)
+            if self.source_health is not None:
+                self.source_health.record(source_name, error is None, len(news), duration, error)
+
+    def _report_source(self, source_name: str, status: str, seconds: float = 0.0, articles: int = 0,
+                       stats: Optional[SourceRunStats] = None, error: Optional[str] = None) -> None:
+        entry = {'status': status, 'seconds': round(seconds, 3), 'articles': articles}
+        if stats is not None:
+            entry.update(stats.as_dict())
+            # O que não foi rede nem espera pelo limite do host é parsing/processamento da própria fonte
+            # (aproximado: requisições paralelas da mesma fonte somam mais que o tempo de relógio)
+            entry['parse_seconds'] = round(
+                max(0.0, seconds - entry['network_seconds'] - entry['rate_limit_wait_seconds']), 3)
+        if error:
+            entry['error'] = error
+        with self._source_reports_lock:
+            self.source_reports[source_name] = entry
+
+    def run_sources(self, scrapers: List[Tuple[str, Callable[[], List[Dict]]]]) -> List[Dict]:
+        """Roda as fontes em um pool de threads (NEWS_MAX_WORKERS) e devolve os artigos na ordem das fontes.
+        Uma fonte que estoura o prazo é abandonada sem travar a execução das demais.
+        """
+        if self.source_health is not None:
+            allowed = []
+            for name, fn in scrapers:
+                if self.source_health.allow(name):
+                    if self.source_health.is_probe(name):
+                        logger.info(f"🟡 {name}: circuito aberto, tentando sondagem")
+                    allowed.append((name, fn))
+                else:
+                    logger.info(f"⏭️ {name}: circuito aberto (falhas seguidas), pulando nesta execução")
+                    self._report_source(name, 'skipped')
+            scrapers = allowed
+        reused: List[Dict] = []
+        if self.source_cadence is not None:
+            due = []
+            for name, fn in scrapers:
+                if self.source_cadence.is_due(name):
+                    due.append((name, fn))
+                else:
+                    # Fora do prazo: os artigos da última coleta seguem no pipeline (o filtro de recência decide)
+                    cached = self.source_cadence.cached_articles(name)
+                    reused.extend(cached)
+                    self._report_source(name, 'not_due', articles=len(cached))
+            if len(due) < len(scrapers):
+                logger.info(f"🕒 Cadência adaptativa: {len(due)} fontes no prazo, {len(scrapers) - len(due)} adiadas "
+                            f"({len(reused)} artigos reaproveitados da coleta anterior)")
+            scrapers = due
+        if not scrapers:
+            return reused
+        results: List[List[Dict]] = [[] for _ in scrapers]
+        tokens = [SourceRunStats() for _ in scrapers]
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(scrapers)), thread_name_prefix='source')
+        try:
+            futures = {
+                executor.submit(self._run_source_with_deadline, name, fn, tokens[idx]): idx
+                for idx, (name, fn) in enumerate(scrapers)
+            }
+            # O prazo é aplicado dentro de cada fonte; aqui só há uma margem de segurança para o pool todo
+            overall_timeout = None
+            if self.source_timeout > 0:
+                batches = -(-len(scrapers) // min(self.max_workers, len(scrapers)))
+                overall_timeout = self.source_timeout * batches + 30
+            done, not_done = wait(futures, timeout=overall_timeout)
+            for future in done:
+                results[futures[future]] = future.result()
+            for future in not_done:
+                idx = futures[future]
+                name = scrapers[idx][0]
+                if not tokens[idx].settle():
+                    # Terminou entre o wait() e aqui: já registrou o próprio resultado
+                    results[idx] = future.result()
+                    continue
+                logger.error(f"Fonte {name} não terminou dentro do prazo; ignorando resultados")
+                self._report_source(name, 'timeout', overall_timeout or 0)
+                if self.source_health is not None:
+                    self.source_health.record(name, False, 0, overall_timeout or 0, 'prazo total esgotado')
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if self.source_health is not None:
+            self.source_health.save()
+        if self.source_cadence is not None:
+            for (name, _), news in zip(scrapers, results):
+                # Só coletas bem-sucedidas ensinam a cadência; falhas tentam de novo na próxima execução
+                if self.source_reports.get(name, {}).get('status') == 'ok':
+                    interval = self.source_cadence.observe(name, news)
+                    self.source_reports[name]['next_interval_h'] = round(interval / 3600, 1)
+            self.source_cadence.save()
+        return [item for news in results for item in news] + reused
+
+    def log_source_health(self) -> None:
+        """Resumo da saúde das fontes: quantas estão ok e quais estão com o circuito aberto."""
+        report = self.source_health.report()
+        failing = {k: v for k, v in report.items() if v.get('state') == 'open' or v.get('failures')}
+        logger.info(f"Saúde das fontes: {len(report) - len(failing)} ok, {len(failing)} com falhas")
+        for source, entry in sorted(failing.items(), key=lambda kv: -int(kv[1].get('failures', 0))):
+            if entry.get('state') == 'open':
+                retry_at = datetime.fromtimestamp(float(entry.get('retry_at', 0)), self.local_tz).strftime('%d/%m %H:%M')
+                status = f"circuito aberto até {retry_at}"
+            else:
+                status = 'circuito fechado'
+            logger.info(f"  • {source}: {entry.get('failures', 0)} falhas seguidas, {status} ({entry.get('last_error') or '-'})")
+
     def scrape_all_sources(self) -> List[Dict]:
         """Scrape news from all configured sources"""
         all_news = []
+        # Cache de páginas com escopo desta execução (idem para datas: as incompletas dependem de "agora")
+        self.page_cache = PageCache()
+        parse_date_utc.cache_clear()
+        self.session.reset_stats()
+        self.rate_limiter.reset_stats()
+        self.head_fetch_stats = {'head_only': 0, 'full_fallback': 0}
+        self.stale_feed_items = {}
+        self.enriched_articles = []
+        self.content_hashes = {}
+        self.source_reports = {}
+        self.pipeline_stats = {}
         
         logger.info("Starting news scraping from all sources...")
         
@@ -2894,16 +4563,6 @@ class ChristianNewsScraper:
         # Filtra para rodar apenas as fontes permitidas
         scrapers = [(name, fn) for (name, fn) in scrapers_all if name in allowed_sources]
         
-        for source_name, scraper_func in scrapers:
-            try:
-                logger.info(f"Scraping {source_name}...")
-                news = scraper_func()
-                all_news.extend(news)
-                logger.info(f"Found {len(news)} articles from {source_name}")
-                time.sleep(2)  # Be respectful to servers
-            except Exception as e:
-                logger.error(f"Failed to scrape {source_name}: {e}")
-
         # RSS extras (genéricos) para ampliar cobertura de fontes gratuitas
         extra_rss_feeds = [
             ('Folha Gospel', 'https://folhagospel.com/feed/', 'Notícias Cristãs', 8),
@@ -2913,26 +4572,131 @@ class ChristianNewsScraper:
             ('Ministério Fiel', 'https://ministeriofiel.com.br/feed/', 'Teologia Reformada', 8),
             ('CPAD News', 'https://www.cpadnews.com.br/feed/', 'Educação Cristã', 6)
         ]
-
         for name, url, category, limit in extra_rss_feeds:
             if name in allowed_sources:
-                try:
-                    logger.info(f"Scraping RSS genérico: {name}")
-                    items = self.scrape_generic_rss(name, url, category=category, limit=limit)
-                    all_news.extend(items)
-                except Exception as e:
-                    logger.warning(f"Falha no RSS genérico {name}: {e}")
+                scrapers.append((
+                    f"RSS genérico: {name}",
+                    lambda name=name, url=url, category=category, limit=limit:
+                        self.scrape_generic_rss(name, url, category=category, limit=limit)
+                ))
+
+        # Fontes independentes rodam em paralelo; o limite de taxa por host fica a cargo da sessão
+        started = time.monotonic()
+        all_news.extend(self.run_sources(scrapers))
+        # Etapas contam artigos nos dois lados; quantas fontes foram consultadas vai à parte
+        self._record_stage('fetch', len(all_news), len(all_news), time.monotonic() - started, sources=len(scrapers))
         
         # If we don't have enough news, add fallback content
         if len(all_news) < 5:
             logger.info("Adding fallback news due to insufficient scraped content")
             all_news.extend(self.get_fallback_news())
+
+        # Pipeline em etapas encadeadas: filtros baratos (normalização, duplicatas, recência,
+        # palavras negativas) antes de qualquer enriquecimento via rede
+        started = time.monotonic()
+        mode = os.getenv('NEWS_FILTER_MODE', 'RELAXED').strip().upper()
+        stream = self._stage_normalize(all_news)
+        stream = self._stage_dedupe(stream)
+        stream = self._stage_recent(stream)
+        stream = self._stage_exclude_negative(stream, mode)
+
+        # Ordenar por data (mais recentes primeiro); datas já interpretadas na normalização
+        now_utc = datetime.utcnow()
+        candidates = sorted(stream, key=lambda a: self.article_datetime(a) or now_utc, reverse=True)
+        # As etapas encadeadas só rodam ao consumir o stream: o tempo delas fica todo em 'rank'
+        self._record_stage('rank', len(all_news), len(candidates), time.monotonic() - started)
+
+        # Enriquecimento só para quem ainda pode entrar nos max_items finais
+        logger.info(f"Applying content filter for Reconciliation brotherhood (mode={mode})...")
+        filtered_news = self.select_and_enrich(candidates, mode)
+        for stage, st in self.pipeline_stats.items():
+            logger.info(f"Etapa {stage}: {st['in']} → {st['out']} artigos"
+                        + (f" de {st['sources']} fontes" if 'sources' in st else '')
+                        + (f" ({st['seconds']:.1f}s)" if 'seconds' in st else ''))
+
+        # Aplicar política de saída: hoje primeiro, senão recentes (<= max_age_hours)
+        started = time.monotonic()
+        recent_filtered_news = self.filter_for_output(filtered_news)
+        
+        # If filtered recent news is too few, add some fallback content
+        if len(recent_filtered_news) < 3:
+            logger.info("Adding fallback news due to insufficient recent filtered content")
+            fallback_news = [self.to_article(fb) for fb in self.get_fallback_news()]
+            # Garante resumo nos fallbacks também
+            for fb in fallback_news:
+                fb['summary'] = self.ensure_summary(fb)
+            # Fallback items têm data atual; aplicar política de saída para consistência
+            recent_filtered_news.extend(self.filter_for_output(fallback_news))
+            # Remove duplicates again
+            seen_titles = set()
+            final_news = []
+            for news in recent_filtered_news:
+                if news['title'] not in seen_titles:
+                    seen_titles.add(news['title'])
+                    final_news.append(news)
+            recent_filtered_news = final_news
+        self._record_stage('output', len(filtered_news), len(recent_filtered_news), time.monotonic() - started)
+
+        # Imagens só agora: ranking, filtro e corte já decidiram o que será publicado
+        started = time.monotonic()
+        count_in = len(recent_filtered_news)
+        recent_filtered_news = self.resolve_output_images(recent_filtered_news)
+        self._record_stage('images', count_in, len(recent_filtered_news), time.monotonic() - started)
+        self.update_seen_index()
         
-        # Remover duplicatas com canonicalização de URL e título
-        # Alguns sites (como Revista Galileu) publicam o mesmo artigo em mais de uma listagem
-        # com parâmetros/fragmentos diferentes no URL. Para evitar artigos duplicados no frontend,
-        # normalizamos o URL (sem query/fragment) e, especificamente para Galileu, também o título.
-        from urllib.parse import urlparse, urlunparse
+        logger.info(f"Final filtered articles for Reconciliation: {len(recent_filtered_news)}")
+        if self.stale_feed_items:
+            logger.info(f"Itens antigos descartados já nos feeds: {sum(self.stale_feed_items.values())} "
+                        f"({', '.join(f'{k}: {v}' for k, v in sorted(self.stale_feed_items.items()))})")
+        cache_stats = self.page_cache.stats()
+        logger.info(f"Cache de páginas: {cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['pages']} páginas")
+        logger.info(f"Metadados só pelo <head>: {self.head_fetch_stats['head_only']} páginas; "
+                    f"{self.head_fetch_stats['full_fallback']} precisaram do corpo completo")
+        host_stats = self.session.stats()
+        if host_stats:
+            total_requests = sum(int(st['requests']) for st in host_stats.values())
+            total_bytes = sum(st['bytes'] for st in host_stats.values())
+            logger.info(f"HTTP: {total_requests} requisições a {len(host_stats)} hosts, {total_bytes / 1024 / 1024:.1f} MB")
+            slowest = sorted(host_stats.items(), key=lambda kv: kv[1]['seconds'], reverse=True)[:5]
+            for host, st in slowest:
+                logger.info(f"  • {host}: {int(st['requests'])} req, {st['seconds']:.1f}s, {int(st['errors'])} erros")
+        if self.source_health is not None:
+            self.log_source_health()
+        if self.rate_limiter.throttled:
+            logger.info(f"Hosts que pediram pausa (429/Retry-After): "
+                        f"{', '.join(f'{h}: {n}x' for h, n in sorted(self.rate_limiter.throttled.items()))}")
+        if self.session.disk_cache is not None:
+            disk_stats = self.session.disk_cache.stats()
+            logger.info(f"Cache HTTP em disco: {disk_stats['hits']} respostas 304, {disk_stats['misses']} downloads completos, "
+                        f"{disk_stats['entries']} entradas ({disk_stats['bytes'] / 1024 / 1024:.1f} MB)")
+        return recent_filtered_news
+
+    def _record_stage(self, stage: str, count_in: int, count_out: int, seconds: Optional[float] = None,
+                      **counters: int) -> None:
+        """Soma in/out (artigos) e o tempo da etapa; counters são contagens extras com nome próprio."""
+        st = self.pipeline_stats.setdefault(stage, {'in': 0, 'out': 0})
+        st['in'] += count_in
+        st['out'] += count_out
+        for name, value in counters.items():
+            st[name] = st.get(name, 0) + value
+        if seconds is not None:
+            st['seconds'] = round(st.get('seconds', 0.0) + seconds, 3)
+
+    def _stage_normalize(self, items):
+        """Normaliza uma única vez em Article: as etapas seguintes não reinterpretam datas."""
+        count = 0
+        try:
+            for news in items:
+                count += 1
+                yield self.to_article(news)
+        finally:
+            self._record_stage('normalize', count, count)
+
+    def _stage_dedupe(self, items):
+        """Remover duplicatas com canonicalização de URL e título.
+        Alguns sites (como Revista Galileu) publicam o mesmo artigo em mais de uma listagem
+        com parâmetros/fragmentos diferentes no URL. Para evitar artigos duplicados no frontend,
+        normalizamos o URL (sem query/fragment) e, especificamente para Galileu, também o título."""
 
         def _normalize_url(u: str) -> str:
             try:
@@ -2950,102 +4714,210 @@ class ChristianNewsScraper:
             return t
 
         seen_keys = set()
-        unique_news = []
-        for news in all_news:
-            source = (news.get('source') or '').strip()
-            source_base = source.split(' - ')[0].strip().lower()
-            title_norm = _normalize_title(news.get('title'))
-            url_norm = _normalize_url(news.get('url'))
-
-            # Chave baseada em URL canonicalizado por fonte
-            key_url = (source_base, url_norm)
-            # Para Galileu, também chave baseada em título (mesmo artigo pode sair em mais de uma editoria)
-            is_galileu = source_base.startswith('revista galileu')
-            key_title = (source_base, title_norm)
-
-            if key_url in seen_keys:
-                continue
-            if is_galileu and key_title in seen_keys:
-                continue
+        count_in = count_out = 0
+        try:
+            for news in items:
+                count_in += 1
+                source = (news.get('source') or '').strip()
+                source_base = source.split(' - ')[0].strip().lower()
+                title_norm = _normalize_title(news.get('title'))
+                url_norm = _normalize_url(news.get('url'))
+
+                # Chave baseada em URL canonicalizado por fonte
+                key_url = (source_base, url_norm)
+                # Para Galileu, também chave baseada em título (mesmo artigo pode sair em mais de uma editoria)
+                is_galileu = source_base.startswith('revista galileu')
+                key_title = (source_base, title_norm)
+
+                if key_url in seen_keys:
+                    continue
+                if is_galileu and key_title in seen_keys:
+                    continue
+
+                seen_keys.add(key_url)
+                if is_galileu:
+                    seen_keys.add(key_title)
+                count_out += 1
+                yield news
+        finally:
+            self._record_stage('dedupe', count_in, count_out)
+
+    def _stage_recent(self, items):
+        """Descarta o que a política de saída (hoje ou <= max_age_hours) nunca aceitaria."""
+        count_in = count_out = 0
+        try:
+            for news in items:
+                count_in += 1
+                if self.within_output_window(self.article_datetime(news)):
+                    count_out += 1
+                    yield news
+        finally:
+            self._record_stage('recent', count_in, count_out)
+
+    def _stage_exclude_negative(self, items, mode: str):
+        """Descarta cedo artigos cujo texto da fonte já tem termos negativos, só quando o filtro completo
+        (que roda depois do enriquecimento) também os rejeitaria: nunca no modo OFF nem, no STRICT,
+        para fontes/domínios confiáveis."""
+        count_in = count_out = 0
+        try:
+            for news in items:
+                count_in += 1
+                if mode != 'OFF' and not self.approved_despite_negatives(news, mode):
+                    # Só o texto que sobrevive a ensure_summary: resumo curto será trocado pelo da página
+                    summary = self.clean_text(news.get('summary') or '')
+                    summary = self._truncate_summary(summary) if len(summary) >= self.summary_min_chars else ''
+                    match = self.keyword_matcher.match(f"{news.get('title') or ''} {summary}")
+                    if match.has('negative'):
+                        logger.info(f"❌ Filtered out (negative keywords) article: {(news.get('title') or '')[:50]}...")
+                        continue
+                count_out += 1
+                yield news
+        finally:
+            self._record_stage('negative', count_in, count_out)
+
+    def select_and_enrich(self, candidates: List[Dict], mode: str) -> List[Dict]:
+        """Enriquece (índice de vistos, resumo) e filtra os candidatos em lotes, na ordem do ranking,
+        só até completar max_items: quem o filtro rejeita é reposto pelos próximos candidatos.
+        Imagens ficam para depois da política de saída (resolve_output_images)."""
+        selected: List[Dict] = []
+        enriched: List[Dict] = []
+        content_hashes: Dict[str, str] = {}
+        self.enriched_articles, self.content_hashes = enriched, content_hashes
+        reused = 0
+        position = 0
+        enrich_seconds = filter_seconds = 0.0
+        while len(selected) < self.max_items and position < len(candidates):
+            batch = candidates[position:position + self.max_items - len(selected)]
+            position += len(batch)
+
+            # Artigos já vistos com o mesmo conteúdo reaproveitam o enriquecimento anterior
+            fresh = batch
+            if self.seen_index is not None:
+                fresh = []
+                for item in batch:
+                    content_hash = SeenArticleIndex.content_hash(item)
+                    content_hashes[canonicalize_url(item.get('url') or '')] = content_hash
+                    if not self.seen_index.restore(item, content_hash):
+                        fresh.append(item)
+                reused += len(batch) - len(fresh)
 
-            unique_news.append(news)
-            seen_keys.add(key_url)
-            if is_galileu:
-                seen_keys.add(key_title)
+            # Garantir resumo detalhado
+            started = time.monotonic()
+            fresh_ids = {id(item) for item in fresh}
+            self.enrich_summaries([item for item in batch if id(item) in fresh_ids])
+            enriched.extend(batch)
+            enrich_seconds += time.monotonic() - started
 
-        # Garantir imagens: tentar preencher imagem ausente; depois filtrar sem imagem
-        for item in unique_news:
+            # Apply content filter for Reconciliation brotherhood
+            started = time.monotonic()
+            selected.extend(self.filter_content_for_reconciliation(batch, mode=mode))
+            filter_seconds += time.monotonic() - started
+
+        self._record_stage('enrich', len(enriched), len(enriched), enrich_seconds)
+        self._record_stage('filter', len(enriched), len(selected), filter_seconds)
+        if self.seen_index is not None:
+            logger.info(f"Índice de artigos vistos: {reused} reaproveitados, {len(enriched) - reused} novos ou alterados")
+        return selected[:self.max_items]
+
+    def update_seen_index(self) -> None:
+        """Grava no índice de vistos os artigos enriquecidos nesta execução (já com as imagens resolvidas)."""
+        if self.seen_index is not None and self.enriched_articles:
             try:
-                if not item.get('image_url') and item.get('url'):
-                    item['image_url'] = self.extract_image_from_content(item['url'])
-            except Exception:
-                # Ignorar falhas de extração pontuais
-                pass
-        # Permitir notícias sem imagem válida, mas tentar preencher; manter apenas URLs http/https quando presentes
-        unique_news = [
-            n for n in unique_news
+                self.seen_index.remember(self.enriched_articles, self.content_hashes)
+                pruned = self.seen_index.prune(lambda a: self.is_recent_article(a, max_age_hours=self.max_age_hours))
+                if pruned:
+                    logger.info(f"Índice de artigos vistos: {pruned} registros fora da janela de {self.max_age_hours}h removidos")
+            except Exception as e:
+                logger.warning(f"Falha ao atualizar o índice de artigos vistos: {e}")
+
+    def enrich_images(self, items: List[Dict]) -> None:
+        """Preenche image_url ausente a partir da página do artigo (em paralelo; falhas ficam sem imagem)."""
+        missing = [item for item in items if not item.get('image_url') and item.get('url')]
+        images = self.map_in_source_context(
+            lambda item: self.extract_image_from_content(item['url']), missing, self.image_workers
+        )
+        for item, image_url in zip(missing, images):
+            item['image_url'] = image_url
+
+    def resolve_output_images(self, items: List[Dict]) -> List[Dict]:
+        """Extrai imagens só para os artigos que serão publicados; mantém apenas URLs http/https."""
+        started = time.monotonic()
+        missing = sum(1 for item in items if not item.get('image_url'))
+        self.enrich_images(items)
+        # Permitir notícias sem imagem válida, mas descartar image_url que não seja http/https
+        items = [
+            n for n in items
             if (not n.get('image_url')) or (str(n.get('image_url')).startswith('http'))
         ]
+        logger.info(f"Imagens: {missing} buscadas para os {len(items)} artigos finais em {time.monotonic() - started:.1f}s")
+        return items
 
-        # Ordenar por data (mais recentes primeiro)
-        try:
-            unique_news = sorted(
-                unique_news,
-                key=lambda a: self.parse_article_date(a.get('date')) or datetime.utcnow(),
-                reverse=True
-            )
-        except Exception:
-            # Se parsing falhar, manter ordem atual
-            pass
-
-        # Limitar ao número máximo configurado (padrão 30)
-        unique_news = unique_news[:self.max_items]
-        
-        # Garantir resumo detalhado
-        for item in unique_news:
+    def enrich_summaries(self, items: List[Dict]) -> None:
+        """Garante resumo detalhado (usa a descrição/parágrafos da página quando o feed é curto)."""
+        for item in items:
             try:
                 item['summary'] = self.ensure_summary(item)
             except Exception:
                 # Mantém o que já existe caso falhe
                 item['summary'] = self._truncate_summary(item.get('summary') or '')
-        
-        # Apply content filter for Reconciliation brotherhood
-        mode = os.getenv('NEWS_FILTER_MODE', 'RELAXED').strip().upper()
-        logger.info(f"Applying content filter for Reconciliation brotherhood (mode={mode})...")
-        filtered_news = self.filter_content_for_reconciliation(unique_news, mode=mode)
 
-        # Aplicar política de saída: hoje primeiro, senão recentes (<= max_age_hours)
-        recent_filtered_news = self.filter_for_output(filtered_news)
-        
-        # If filtered recent news is too few, add some fallback content
-        if len(recent_filtered_news) < 3:
-            logger.info("Adding fallback news due to insufficient recent filtered content")
-            fallback_news = self.get_fallback_news()
-            # Garante resumo nos fallbacks também
-            for fb in fallback_news:
-                fb['summary'] = self.ensure_summary(fb)
-            # Fallback items têm data atual; aplicar política de saída para consistência
-            recent_filtered_news.extend(self.filter_for_output(fallback_news))
-            # Remove duplicates again
-            seen_titles = set()
-            final_news = []
-            for news in recent_filtered_news:
-                if news['title'] not in seen_titles:
-                    seen_titles.add(news['title'])
-                    final_news.append(news)
-            recent_filtered_news = final_news
-        
-        logger.info(f"Final filtered articles for Reconciliation: {len(recent_filtered_news)}")
-        return recent_filtered_news
+    def build_run_report(self, started_at: datetime, duration: float, articles_out: int) -> Dict:
+        """Relatório estruturado da execução: etapas, fontes, HTTP e caches."""
+        host_stats = self.session.stats()
+        report = {
+            'started_at': started_at.isoformat(),
+            'duration_seconds': round(duration, 3),
+            'articles_out': articles_out,
+            'stages': self.pipeline_stats,
+            'sources': dict(sorted(self.source_reports.items())),
+            'http': {
+                'requests': sum(int(st['requests']) for st in host_stats.values()),
+                'bytes': sum(int(st['bytes']) for st in host_stats.values()),
+                'errors': sum(int(st['errors']) for st in host_stats.values()),
+                'hosts': {host: {k: round(v, 3) if isinstance(v, float) else v for k, v in st.items()}
+                          for host, st in sorted(host_stats.items())},
+                'throttled': dict(self.rate_limiter.throttled),
+            },
+            'caches': {
+                'page_cache': self.page_cache.stats(),
+                'head_fetch': dict(self.head_fetch_stats),
+                'feed_items_skipped': dict(self.stale_feed_items),
+            },
+        }
+        if self.session.disk_cache is not None:
+            report['caches']['http_disk_cache'] = self.session.disk_cache.stats()
+        if self.seen_index is not None:
+            report['caches']['seen_index'] = self.seen_index.stats()
+        return report
+
+    def write_run_report(self, report: Dict) -> Optional[str]:
+        """Grava o relatório ao lado do christian_news.json (NEWS_RUN_REPORT=false desativa)."""
+        if self.run_report_path.strip().lower() == 'false':
+            return None
+        path = os.path.normpath(self.run_report_path)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+            os.replace(tmp_path, path)
+            logger.info(f"Relatório da execução salvo em {path}")
+            return path
+        except Exception as e:
+            logger.warning(f"Não foi possível gravar o relatório da execução: {e}")
+            return None
 
-    def save_news_to_json(self, news_data: List[Dict], filename: str = 'christian_news.json'):
-        """Save news data to JSON file and Supabase"""
+    def save_news_to_json(self, news_data: List[Dict], filename: str = 'christian_news.json',
+                          output: Optional[NewsOutput] = None):
+        """Save news data to JSON file and Supabase (ambos a partir do mesmo conjunto elegível)"""
         try:
+            # Política de saída já aplicada em scrape_all_sources
+            if output is None:
+                output = self.build_output(news_data)
+
             # Save to Supabase first
             if self.supabase:
-                # Política de saída: hoje (timezone) primeiro; caso vazio, usa recentes
-                eligible_news = self.filter_for_output(news_data)
-                self.save_to_supabase(eligible_news)
+                self.save_to_supabase(output.articles)
             
             # Create data directory if it doesn't exist (src)
             data_dir = os.path.join(os.path.dirname(__file__), '..', 'src', 'data')
@@ -3054,26 +4926,22 @@ class ChristianNewsScraper:
             filepath = os.path.join(data_dir, filename)
             
             # Add metadata
-            output_data = {
-                'last_updated': datetime.now().isoformat(),
-                'total_articles': len(self.filter_for_output(news_data)),
-                'sources': sorted(list(set([article['source'] for article in self.filter_for_output(news_data)]))),
-                'articles': self.filter_for_output(news_data)
-            }
+            output_data = output.payload()
             
-            # Write to src/data
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, ensure_ascii=False, indent=2)
+            # Write to src/data (indentado: o arquivo é versionado e o diff continua legível)
+            data = json.dumps(output_data, ensure_ascii=False, indent=2).encode('utf-8')
+            write_file_atomic(filepath, data)
             logger.info(f"News data saved to {filepath}")
             
-            # Also write to public/data for frontend to fetch in production
+            # Also write to public/data for frontend to fetch in production (compacto, servido a cada visita)
             project_root = os.path.dirname(os.path.dirname(__file__))
-            public_data_dir = os.path.join(project_root, 'public', 'data')
-            os.makedirs(public_data_dir, exist_ok=True)
-            public_filepath = os.path.join(public_data_dir, filename)
-            with open(public_filepath, 'w', encoding='utf-8') as pf:
-                json.dump(output_data, pf, ensure_ascii=False, indent=2)
-            logger.info(f"News data saved to {public_filepath}")
+            public_filepath = os.path.join(project_root, 'public', 'data', filename)
+            if self.public_json_compact:
+                data = json.dumps(output_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            write_file_atomic(public_filepath, data)
+            compressed = write_precompressed(public_filepath, data, self.public_json_precompress)
+            logger.info(f"News data saved to {public_filepath} ({len(data) / 1024:.0f} KB"
+                        + (f", + {', '.join(os.path.basename(p) for p in compressed)}" if compressed else '') + ")")
             
             return filepath
             
@@ -3081,87 +4949,114 @@ class ChristianNewsScraper:
             logger.error(f"Error saving news data: {e}")
             return None
 
-    def save_to_supabase(self, news_data: List[Dict]):
-        """Save news data to Supabase database"""
+    def _supabase_row_changed(self, existing: Dict, row: Dict) -> bool:
+        """Compara os campos gravados; datas pelo instante (o Supabase devolve timestamps em outro formato)."""
+        for name in self.SUPABASE_FIELDS:
+            old, new = existing.get(name), row.get(name)
+            if old == new:
+                continue
+            if name == 'date' and old and new:
+                old_dt, new_dt = parse_date_utc(str(old)), parse_date_utc(str(new))
+                if old_dt is not None and old_dt == new_dt:
+                    continue
+            return True
+        return False
+
+    def save_to_supabase(self, news_data: List[Dict]) -> Dict[str, int]:
+        """Save news data to Supabase database em lotes de NEWS_SUPABASE_BATCH_SIZE: uma consulta
+        in_('url', [...]) por lote e uma escrita por lote (insert dos novos ou, no modo upsert,
+        upsert on_conflict='url' dos novos e alterados). Retorna contagens inserted/updated/skipped."""
+        counts = {'inserted': 0, 'updated': 0, 'skipped': 0}
         try:
             logger.info("Saving news to Supabase...")
             
             # Clear existing data (optional - you might want to keep history)
             # self.supabase.table('news_articles').delete().neq('id', 0).execute()
             
-            # Prepare data for Supabase
-            supabase_data = []
+            # Prepare data for Supabase (uma linha por URL)
+            rows: Dict[str, Dict] = {}
             for article in news_data:
                 # Skip stale articles (>{}h)
-                if not self.is_recent_article(article, max_age_hours=self.max_age_hours):
+                if not self.is_recent_article(article, max_age_hours=self.max_age_hours) or not article.get('url'):
+                    counts['skipped'] += 1
                     continue
-                # Check if article already exists
-                existing = self.supabase.table('news_articles').select('id').eq('url', article['url']).execute()
-                
-                if not existing.data:  # Only insert if doesn't exist
-                    supabase_article = {
-                        'title': article['title'],
-                        'summary': article['summary'],
-                        'url': article['url'],
-                        'source': article['source'],
-                        'date': article['date'],
-                        'category': article['category'],
-                        'image_url': article.get('image_url')
-                    }
-                    supabase_data.append(supabase_article)
-            
-            if supabase_data:
-                # Insert new articles
-                result = self.supabase.table('news_articles').insert(supabase_data).execute()
-                logger.info(f"Successfully saved {len(supabase_data)} new recent articles to Supabase")
+                if article['url'] in rows:
+                    counts['skipped'] += 1
+                    continue
+                rows[article['url']] = {name: article.get(name) for name in self.SUPABASE_FIELDS}
+
+            upsert = self.supabase_write_mode == 'upsert'
+            select_fields = ','.join(self.SUPABASE_FIELDS) if upsert else 'url'
+            batch = list(rows.values())
+            for start in range(0, len(batch), self.supabase_batch_size):
+                chunk = batch[start:start + self.supabase_batch_size]
+                existing = self.supabase.table('news_articles').select(select_fields).in_(
+                    'url', [row['url'] for row in chunk]
+                ).execute()
+                existing_rows = {row.get('url'): row for row in (existing.data or [])}
+                new_rows = [row for row in chunk if row['url'] not in existing_rows]
+                changed_rows = []
+                if upsert:
+                    changed_rows = [
+                        row for row in chunk
+                        if row['url'] in existing_rows and self._supabase_row_changed(existing_rows[row['url']], row)
+                    ]
+                to_write = new_rows + changed_rows
+                if to_write:
+                    if upsert:
+                        self.supabase.table('news_articles').upsert(to_write, on_conflict='url').execute()
+                    else:
+                        self.supabase.table('news_articles').insert(to_write).execute()
+                counts['inserted'] += len(new_rows)
+                counts['updated'] += len(changed_rows)
+                counts['skipped'] += len(chunk) - len(to_write)
+
+            if counts['inserted'] or counts['updated']:
+                logger.info(f"Supabase: {counts['inserted']} inseridos, {counts['updated']} atualizados, "
+                            f"{counts['skipped']} ignorados (já existentes ou fora da janela)")
             else:
-                logger.info("No new recent articles to save to Supabase")
+                logger.info(f"No new recent articles to save to Supabase ({counts['skipped']} ignorados)")
                 
         except Exception as e:
             logger.error(f"Error saving to Supabase: {e}")
             # Continue execution even if Supabase fails
+        return counts
 
-def main():
-    """Main function to run the news scraper"""
-    scraper = ChristianNewsScraper()
-    
-    # Permite rodar somente limpeza via argumento CLI
-    if len(sys.argv) > 1 and sys.argv[1].lower() == 'cleanup':
-        try:
-            scraper.cleanup_old_supabase_records(max_age_hours=scraper.max_age_hours)
-            print(f"✅ Limpeza executada: removidos registros com mais de {scraper.max_age_hours}h")
-        except Exception as e:
-            logger.error(f"Erro na limpeza: {e}")
-            print(f"❌ Erro na limpeza: {e}")
-        return
 
+def run_scraper(scraper: ChristianNewsScraper) -> Optional[str]:
+    """Executa uma coleta completa (scrape, JSON/Supabase, Discord); retorna o caminho do JSON salvo.
+    Ao final grava o relatório da execução (news_run_report.json)."""
+    started_at = datetime.now(timezone.utc)
+    started = time.monotonic()
+    articles_out = 0
     try:
         # Scrape all news
         news_data = scraper.scrape_all_sources()
         
         if news_data:
+            # Conjunto elegível calculado uma vez: JSON, Supabase, resumo e Discord usam o mesmo
+            output = scraper.build_output(news_data)
+            articles_out = len(output.articles)
             # Save to JSON file
-            filepath = scraper.save_news_to_json(news_data)
+            stage_started = time.monotonic()
+            filepath = scraper.save_news_to_json(news_data, output=output)
+            scraper._record_stage('save', len(news_data), articles_out if filepath else 0,
+                                  time.monotonic() - stage_started)
             
             if filepath:
                 print(f"✅ Successfully scraped {len(news_data)} articles")
                 print(f"📁 Data saved to: {filepath}")
                 
                 # Print summary
-                sources = {}
-                for article in news_data:
-                    source = article['source']
-                    sources[source] = sources.get(source, 0) + 1
-                
                 print("\n📊 Articles by source:")
-                for source, count in sources.items():
+                for source, count in output.source_counts.items():
                     print(f"  • {source}: {count} articles")
 
                 # Envio opcional ao Discord, se habilitado via ambiente
                 try:
                     notify_flag = os.getenv('NEWS_DISCORD_NOTIFY', 'false').strip().lower() == 'true'
                     if notify_flag and send_news_to_discord is not None:
-                        recent_items = scraper.filter_recent_articles(news_data, max_age_hours=scraper.max_age_hours)
+                        recent_items = output.articles
                         # Limita quantidade para evitar excesso no canal
                         top_items = recent_items[:5]
                         if top_items:
@@ -3175,9 +5070,12 @@ def main():
                                 'date': datetime.now().strftime('%Y-%m-%d %H:%M'),
                             }
                             payload_items = [summary_item] + top_items
-                            result = send_news_to_discord(payload_items)
+                            stage_started = time.monotonic()
+                            result = send_news_to_discord(payload_items, rate_limiter=scraper.rate_limiter)
                             sent = result.get('sent', 0)
                             failed = result.get('failed', 0)
+                            scraper._record_stage('discord', len(payload_items), sent + failed,
+                                                  time.monotonic() - stage_started)
                             print(f"🔔 Discord notificado: {sent} lote(s), falhas: {failed}")
                         else:
                             print("ℹ️ Nenhum item recente para enviar ao Discord.")
@@ -3186,6 +5084,7 @@ def main():
                 except Exception as de:
                     logger.error(f"Erro ao enviar notificação ao Discord: {de}")
                     print(f"❌ Erro ao notificar Discord: {de}")
+                return filepath
             else:
                 print("❌ Failed to save news data")
         else:
@@ -3194,6 +5093,41 @@ def main():
     except Exception as e:
         logger.error(f"Error in main execution: {e}")
         print(f"❌ Error: {e}")
+    finally:
+        try:
+            scraper.write_run_report(scraper.build_run_report(started_at, time.monotonic() - started, articles_out))
+        except Exception as e:
+            logger.warning(f"Falha ao montar o relatório da execução: {e}")
+    return None
+
+
+def main():
+    """Main function to run the news scraper"""
+    scraper = ChristianNewsScraper()
+    
+    # Permite rodar somente limpeza via argumento CLI
+    if len(sys.argv) > 1 and sys.argv[1].lower() == 'cleanup':
+        try:
+            scraper.cleanup_old_supabase_records(max_age_hours=scraper.max_age_hours)
+            print(f"✅ Limpeza executada: removidos registros com mais de {scraper.max_age_hours}h")
+        except Exception as e:
+            logger.error(f"Erro na limpeza: {e}")
+            print(f"❌ Erro na limpeza: {e}")
+        return
+
+    # Uma coleta por vez: outra em andamento (daemon, CI, execução manual) faz esta ser pulada
+    if run_lock_held_by_parent():
+        run_scraper(scraper)
+        return
+    lock = RunLock(default_run_lock_path())
+    if not lock.acquire():
+        print(f"⏭️ Outra coleta já está em andamento ({lock.holder()}); pulando esta execução")
+        return
+    try:
+        run_scraper(scraper)
+    finally:
+        lock.release()
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
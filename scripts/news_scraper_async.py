@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Variante assíncrona do News Scraper (asyncio + httpx)
+
+Mesmo pipeline e mesma saída (christian_news.json, Supabase, Discord) do news_scraper.py,
+mas todo o I/O de rede roda como corrotinas em um único event loop, limitado por um
+semáforo global e um semáforo por host:
+- os scrapers de cada fonte (parsing síncrono) rodam em threads e delegam cada
+  requisição ao loop;
+- o enriquecimento (imagem e resumo) baixa os <head> dos artigos concorrentemente,
+  antes de extrair os metadados a partir do cache de páginas.
+
+Uso:
+    python news_scraper_async.py
+
+Config (env): NEWS_ASYNC_CONCURRENCY (padrão 20), NEWS_ASYNC_PER_HOST (padrão 4);
+as demais variáveis NEWS_* valem como no modo síncrono.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import concurrent.futures
+from datetime import timedelta
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:  # dependência opcional: só o modo assíncrono precisa dela
+    httpx = None
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(script_dir)
+
+from news_scraper import (  # noqa: E402
+    CachedPage,
+    ChristianNewsScraper,
+    HostRateLimiter,
+    RunLock,
+    SourceDeadlineExceeded,
+    _source_context,
+    count_source_request,
+    default_run_lock_path,
+    run_lock_held_by_parent,
+    run_scraper,
+)
+
+logger = logging.getLogger(__name__)
+
+# Cabeçalhos que não valem mais depois que o httpx descomprime o corpo
+_DROP_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+def _to_requests_response(url: str, status_code: int, headers, content: bytes,
+                          elapsed: float) -> requests.Response:
+    """Adapta a resposta do httpx para requests.Response, que é o que os scrapers consomem."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(
+        {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS}
+    )
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.reason = httpx.codes.get_reason_phrase(status_code) if httpx else ''
+    response.elapsed = timedelta(seconds=elapsed)
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+class AsyncChristianNewsScraper(ChristianNewsScraper):
+    """ChristianNewsScraper cujo I/O de rede roda no event loop (httpx.AsyncClient).
+
+    fetch() continua síncrono para os scrapers (que rodam em threads): cada chamada é
+    submetida ao loop e aguarda o resultado respeitando o prazo da fonte."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, client, concurrency: int = 20, per_host: int = 4):
+        super().__init__()
+        self.loop = loop
+        self.client = client
+        self.per_host = max(1, per_host)
+        self._global_limit = asyncio.Semaphore(max(1, concurrency))
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        # Só é chamado de dentro do loop: dispensa lock
+        host = (urlparse(url).hostname or '').lower()
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        return self._host_limits[host]
+
+    async def fetch_async(self, url: str, headers: Optional[Dict[str, str]] = None,
+                          timeout: Optional[float] = None, stream: bool = False) -> requests.Response:
+        """GET assíncrono com os mesmos cabeçalhos, cache em disco e estatísticas da sessão síncrona.
+        Com stream=True lê só até o fim do <head> (mesma regra de _load_page_head)."""
+        request_headers = dict(self.session.headers)
+        request_headers.update(headers or {})
+        disk_cache = self.session.disk_cache
+        cached = disk_cache.lookup(url) if disk_cache is not None else None
+        if cached:
+            request_headers.update(disk_cache.conditional_headers(cached))
+        timeout = timeout or self.http_timeout
+
+        # Mesmo token bucket por host do modo síncrono; a espera não ocupa vaga nos semáforos
+        delay = self.rate_limiter.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        async with self._global_limit, self._host_limit(url):
+            started = time.monotonic()
+            try:
+                if stream:
+                    async with self.client.stream('GET', url, headers=request_headers, timeout=timeout) as resp:
+                        buf = bytearray()
+                        if resp.status_code == 200:
+                            async for chunk in resp.aiter_bytes():
+                                start = len(buf)
+                                buf.extend(chunk)
+                                if self.head_boundary_reached(buf, start):
+                                    break
+                        status_code, response_headers, content = resp.status_code, resp.headers, bytes(buf)
+                        final_url = str(resp.url)
+                else:
+                    resp = await self.client.get(url, headers=request_headers, timeout=timeout)
+                    status_code, response_headers, content = resp.status_code, resp.headers, resp.content
+                    final_url = str(resp.url)
+            except Exception:
+                self.session.record_request(url, time.monotonic() - started, 0, True)
+                raise
+            elapsed = time.monotonic() - started
+
+        # Bytes de streaming são contabilizados por quem consome o corpo (add_bytes), como na sessão
+        self.session.record_request(url, elapsed, 0 if stream else len(content), status_code >= 400)
+        response = _to_requests_response(final_url, status_code, response_headers, content, elapsed)
+        if HostRateLimiter.is_throttle_response(response):
+            self.rate_limiter.penalize(url, response.headers.get('Retry-After'))
+        if disk_cache is None:
+            return response
+        if status_code == 304 and cached:
+            disk_cache.revalidated(url, response)
+            response.status_code = 200
+            response._content = disk_cache.body(cached)
+            if cached.get('content_type'):
+                response.headers['Content-Type'] = cached['content_type']
+            response.from_cache = True
+        elif status_code == 200 and not stream:
+            # Prefixos de <head> não vão para o cache em disco (não são o documento inteiro)
+            disk_cache.store(url, response)
+        return response
+
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None,
+              timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """Ponte síncrona para fetch_async: chamada pelas threads dos scrapers, nunca pelo loop."""
+        timeout = timeout or self.http_timeout
+        wait_for = None
+        deadline = getattr(_source_context, 'deadline', None)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise SourceDeadlineExceeded(f"Prazo da fonte esgotado antes de {url}")
+            timeout = min(timeout, remaining)
+            wait_for = remaining
+        future = asyncio.run_coroutine_threadsafe(
+            self.fetch_async(url, headers=headers, timeout=timeout, stream=bool(kwargs.get('stream'))),
+            self.loop,
+        )
+        try:
+            # Inclui a espera pelos semáforos: não passa do prazo da fonte
+            response = future.result(timeout=wait_for)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            count_source_request(True)
+            raise SourceDeadlineExceeded(f"Prazo da fonte esgotado aguardando {url}")
+        except Exception:
+            count_source_request(True)
+            raise
+        # Contado aqui, na thread da fonte (circuit breaker e relatório por fonte)
+        from_cache = getattr(response, 'from_cache', False)
+        count_source_request(response.status_code >= 400, response.elapsed.total_seconds(),
+                             0 if from_cache else len(response.content or b''), cached=from_cache)
+        return response
+
+    async def _prefetch_page(self, url: str) -> None:
+        """Baixa o <head> (e, se faltar og:image/descrição, o corpo) e deixa no page_cache."""
+        if self.page_cache.peek(url) is not None or self.page_cache.peek(url, variant='head:') is not None:
+            return
+        try:
+            if self.head_only_fetch:
+                resp = await self.fetch_async(url, stream=True)
+                if resp.status_code != 200:
+                    self.page_cache.put(url, CachedPage(url, resp.status_code), variant='head:')
+                    return
+                partial = not getattr(resp, 'from_cache', False) and self.head_boundary_reached(bytearray(resp.content), 0)
+                self.session.add_bytes(url, len(resp.content))
+                head = CachedPage(url, 200, resp.content, partial=partial)
+                self.page_cache.put(url, head, variant='head:')
+                if not partial:
+                    self.page_cache.put(url, head)
+                    return
+                # Parse fora do loop: é CPU e não deve segurar as demais corrotinas
+                metadata = await asyncio.to_thread(self._page_metadata, head, url)
+                complete = self._metadata_is_complete(metadata)
+                with self._head_stats_lock:
+                    self.head_fetch_stats['head_only' if complete else 'full_fallback'] += 1
+                if complete:
+                    return
+            resp = await self.fetch_async(url)
+            self.page_cache.put(url, CachedPage(url, resp.status_code, resp.content if resp.status_code == 200 else b''))
+        except Exception as e:
+            logger.debug(f"Falha ao pré-carregar {url}: {e}")
+
+    def _prefetch_pages(self, urls: List[str]) -> None:
+        urls = list(dict.fromkeys(u for u in urls if u))
+        if not urls:
+            return
+        started = time.monotonic()
+
+        async def _gather():
+            await asyncio.gather(*(self._prefetch_page(u) for u in urls))
+
+        asyncio.run_coroutine_threadsafe(_gather(), self.loop).result()
+        logger.info(f"⚡ {len(urls)} páginas de artigos pré-carregadas em {time.monotonic() - started:.1f}s")
+
+    def enrich_images(self, items: List[Dict]) -> None:
+        self._prefetch_pages([i['url'] for i in items if not i.get('image_url') and i.get('url')])
+        super().enrich_images(items)
+
+    def enrich_summaries(self, items: List[Dict]) -> None:
+        self._prefetch_pages([
+            i['url'] for i in items
+            if i.get('url') and len(self.clean_text(i.get('summary') or '')) < self.summary_min_chars
+        ])
+        super().enrich_summaries(items)
+
+
+async def main_async() -> Optional[str]:
+    """Entrada assíncrona: abre o cliente httpx e roda o pipeline completo com I/O no loop."""
+    if httpx is None:
+        print("❌ Modo assíncrono requer o pacote httpx (pip install httpx)")
+        return None
+    try:
+        concurrency = int(os.getenv('NEWS_ASYNC_CONCURRENCY', '20'))
+    except Exception:
+        concurrency = 20
+    try:
+        per_host = int(os.getenv('NEWS_ASYNC_PER_HOST', '4'))
+    except Exception:
+        per_host = 4
+    try:
+        retries = int(os.getenv('NEWS_HTTP_RETRIES', '2'))
+    except Exception:
+        retries = 2
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    transport = httpx.AsyncHTTPTransport(retries=retries, limits=limits)
+    async with httpx.AsyncClient(transport=transport, follow_redirects=True) as client:
+        scraper = AsyncChristianNewsScraper(asyncio.get_running_loop(), client, concurrency, per_host)
+        logger.info(f"Modo assíncrono: até {concurrency} requisições simultâneas, {per_host} por host")
+        # O pipeline síncrono roda numa thread; suas requisições voltam para este loop
+        return await asyncio.to_thread(run_scraper, scraper)
+
+
+def main():
+    if run_lock_held_by_parent():
+        asyncio.run(main_async())
+        return
+    lock = RunLock(default_run_lock_path())
+    if not lock.acquire():
+        print(f"⏭️ Outra coleta já está em andamento ({lock.holder()}); pulando esta execução")
+        return
+    try:
+        asyncio.run(main_async())
+    finally:
+        lock.release()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Testes do news_scheduler.py com relógio falso: python -m pytest scripts/test_news_scheduler.py"""
+
+import datetime
+import subprocess
+import types
+
+import pytest
+import schedule
+
+import news_scheduler
+from news_scraper import RunLock
+
+
+class FakeClock:
+    def __init__(self, start):
+        self.now = start
+
+    def time(self):
+        return self.now.timestamp()
+
+    def advance(self, **delta):
+        self.now += datetime.timedelta(**delta)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock(datetime.datetime(2026, 10, 17, 5, 20))
+
+    class FakeDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock.now
+
+    # O schedule lê datetime.datetime.now(); o scheduler, time.time()
+    monkeypatch.setattr(schedule, 'datetime', types.SimpleNamespace(
+        datetime=FakeDatetime, time=datetime.time, timedelta=datetime.timedelta))
+    monkeypatch.setattr(news_scheduler, 'time', types.SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def scheduler(tmp_path, monkeypatch):
+    monkeypatch.setenv('NEWS_RUN_LOCK', str(tmp_path / 'run.lock'))
+    return news_scheduler.NewsScheduler()
+
+
+def test_scheduled_jobs_due_together_run_one_scrape(scheduler, clock, monkeypatch):
+    runs = []
+    monkeypatch.setattr(scheduler, '_run_news_scraper', lambda lock_held=False: runs.append(clock.now))
+    jobs = schedule.Scheduler()
+    # Daemon iniciado fora da hora cheia: o job horário ainda assim roda às :00
+    scheduler.register_jobs(jobs)
+    while clock.now < datetime.datetime(2026, 10, 17, 7, 30):
+        clock.advance(minutes=1)
+        jobs.run_pending()
+
+    assert runs == [datetime.datetime(2026, 10, 17, 6, 0), datetime.datetime(2026, 10, 17, 7, 0)]
+
+
+def test_run_inside_coalesce_window_is_skipped(scheduler, clock, monkeypatch):
+    runs = []
+    monkeypatch.setattr(scheduler, '_run_news_scraper', lambda lock_held=False: runs.append(clock.now))
+    scheduler.scheduled_scrape('hourly')
+    clock.advance(minutes=scheduler.coalesce_window / 60 - 1)
+    scheduler.scheduled_scrape('06:00')
+    clock.advance(minutes=2)
+    scheduler.scheduled_scrape('hourly')
+    assert len(runs) == 2
+
+
+def test_subprocess_run_keeps_the_lock(scheduler, monkeypatch):
+    scheduler.mode = 'subprocess'
+    monkeypatch.setattr(scheduler, '_after_scrape', lambda: None)
+    seen = {}
+
+    def fake_run(args, env=None, **kwargs):
+        # Outro processo não consegue pegar a trava enquanto o filho roda
+        other = RunLock(news_scheduler.os.environ['NEWS_RUN_LOCK'])
+        seen['other_acquired'] = other.acquire()
+        seen['env'] = env
+        return subprocess.CompletedProcess(args, 0, '', '')
+
+    monkeypatch.setattr(news_scheduler.subprocess, 'run', fake_run)
+    scheduler.run_news_scraper()
+
+    assert seen['other_acquired'] is False
+    assert seen['env']['NEWS_RUN_LOCK_HELD'] == '1'
+    after = RunLock(news_scheduler.os.environ['NEWS_RUN_LOCK'])
+    assert after.acquire()
+    after.release()
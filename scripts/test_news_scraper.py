@@ -0,0 +1,278 @@
+"""Testes do pipeline do news_scraper.py (sem rede): python -m pytest scripts/test_news_scraper.py"""
+
+import re
+import unicodedata
+
+import pytest
+
+import news_scraper
+from news_scraper import ChristianNewsScraper
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    # Sem Supabase, Discord nem estado entre execuções: caches e relatórios ficam no tmp_path
+    monkeypatch.delenv('VITE_SUPABASE_URL', raising=False)
+    monkeypatch.delenv('SUPABASE_SERVICE_ROLE_KEY', raising=False)
+    monkeypatch.setenv('NEWS_HTTP_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setenv('NEWS_RUN_REPORT', str(tmp_path / 'report.json'))
+    for flag in ('NEWS_HTTP_CACHE', 'NEWS_SEEN_INDEX', 'NEWS_SOURCE_BREAKER', 'NEWS_ADAPTIVE_CADENCE',
+                 'NEWS_DISCORD_NOTIFY'):
+        monkeypatch.setenv(flag, 'false')
+    return ChristianNewsScraper()
+
+
+def _article(title, source='Gospel Prime', url='https://exemplo.org/noticia', summary=None):
+    return {
+        'title': title,
+        'summary': summary if summary is not None else f"{title}. " + 'Texto de apoio da matéria. ' * 8,
+        'url': url,
+        'source': source,
+        'date': '2026-10-17T10:00:00Z',
+        'category': 'Notícias Cristãs',
+        'image_url': None,
+    }
+
+
+def _titles(articles):
+    return [a['title'] for a in articles]
+
+
+@pytest.mark.parametrize('mode', ['STRICT', 'RELAXED', 'OFF'])
+def test_negative_stage_keeps_filter_output(scraper, mode):
+    articles = [
+        _article('Semana da moda reúne cristãos perseguidos', source='Portas Abertas',
+                 url='https://www.portasabertas.org.br/noticias/moda'),
+        _article('Coluna de moda em portal confiável', source='Outro Portal', url='https://www.terra.com.br/moda'),
+        _article('Igreja local celebra moda gospel', source='Blog Qualquer', url='https://blog.exemplo/moda'),
+        _article('Igrejas se unem em oração', source='Blog Qualquer', url='https://blog.exemplo/oracao'),
+        _article('Celebridades e moda no fim de semana', source='Google News - Temas',
+                 url='https://www.gospelprime.com.br/famosos'),
+        _article('Estudo sobre a graça', source='Blog Qualquer', url='https://blog.exemplo/graca',
+                 summary='Curto e com moda'),
+    ]
+    direct = scraper.filter_content_for_reconciliation([dict(a) for a in articles], mode=mode)
+    staged = scraper.filter_content_for_reconciliation(
+        list(scraper._stage_exclude_negative([dict(a) for a in articles], mode)), mode=mode)
+    assert _titles(staged) == _titles(direct)
+
+
+def _frontend_normalize(text):
+    return ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c)).lower()
+
+
+def _frontend_relevance(scraper, text):
+    """Mesma regra de calculateRelevanceScore em src/api/newsApi.ts: um regex por termo, sem acentos,
+    ancorado no início de palavra e sem fronteira à direita."""
+    text = _frontend_normalize(text)
+
+    def found(keyword):
+        parts = (re.escape(p) for p in _frontend_normalize(keyword).split())
+        return re.search(r'(?<![^\W])' + r'\s+'.join(parts), text) is not None
+
+    locations = [k for k in scraper.RELEVANCE_LOCATIONS if found(k)]
+    topics = [k for k in scraper.RELEVANCE_TOPICS if found(k)]
+    return (len(locations) * scraper.RELEVANCE_WEIGHTS['location'] + len(topics) * scraper.RELEVANCE_WEIGHTS['topic'],
+            sorted(locations + topics))
+
+
+def _substring_relevance(scraper, text):
+    """Regra anterior do frontend (text.includes), mantida só para mostrar onde ela divergia."""
+    text = text.lower()
+    return sorted(k for k in scraper.RELEVANCE_LOCATIONS + scraper.RELEVANCE_TOPICS if k in text)
+
+
+@pytest.mark.parametrize('text', [
+    'Descobertas arqueológicas no Egito',
+    'Novas escavações revelam artefatos romanos',
+    'Exposição sobre o Império Romano chega ao museu',
+    'Ruínas de Jerusalém antiga e da Galileia',
+    'Descoberta de fósseis reacende debate sobre criacionismo',
+    'Sítios arqueológicos da Pérsia e da Babilônia',
+])
+def test_relevance_matches_frontend_rule(scraper, text):
+    score, detected, _ = scraper.score_relevance(scraper.keyword_matcher.match(text))
+    expected_score, expected_detected = _frontend_relevance(scraper, text)
+    assert (score, sorted(detected)) == (expected_score, expected_detected)
+    assert score > 0
+
+
+@pytest.mark.parametrize('text, expected', [
+    # 'roma' dentro de 'aroma'; 'sitio' e 'Jerusalem' sem acento
+    ('Aroma do café no sitio histórico de Jerusalem', ['jerusalém', 'sítio']),
+    ('Ruinas da Galiléia e da SIRIA', ['galileia', 'ruínas', 'síria']),
+])
+def test_relevance_where_substring_rule_disagreed(scraper, text, expected):
+    _, detected, _ = scraper.score_relevance(scraper.keyword_matcher.match(text))
+    assert sorted(detected) == _frontend_relevance(scraper, text)[1] == expected
+    assert _substring_relevance(scraper, text) != expected
+
+
+@pytest.mark.parametrize('text, group', [
+    ('Igrejas se unem em oração', 'positive'),
+    ('Profecias sobre o fim dos tempos', 'positive'),
+    ('Celebridades no tapete vermelho', 'negative'),
+])
+def test_keyword_groups_match_inflections(scraper, text, group):
+    assert scraper.keyword_matcher.match(text).has(group)
+
+
+def test_keywords_do_not_match_mid_word(scraper):
+    assert not scraper.keyword_matcher.match('Um líder capaz e a acomodação dos fiéis').has('negative')
+
+
+def test_late_source_completion_is_not_recorded_twice(scraper, tmp_path, monkeypatch):
+    real_wait = news_scraper.wait
+    monkeypatch.setattr(news_scraper, 'wait', lambda futures, timeout=None: real_wait(futures, timeout=0.2))
+    scraper.source_health = news_scraper.SourceHealthTracker(str(tmp_path / 'health.json'))
+    release = news_scraper.threading.Event()
+    finished = news_scraper.threading.Event()
+
+    def slow_source():
+        release.wait(5)
+        return [_article('Artigo tardio')]
+
+    def fast_source():
+        return [_article('Artigo em dia')]
+
+    run = scraper._run_source_with_deadline
+
+    def tracked(*args, **kwargs):
+        try:
+            return run(*args, **kwargs)
+        finally:
+            if args[0] == 'Lenta':
+                finished.set()
+
+    monkeypatch.setattr(scraper, '_run_source_with_deadline', tracked)
+    articles = scraper.run_sources([('Lenta', slow_source), ('Rápida', fast_source)])
+    release.set()
+    assert finished.wait(5)
+
+    assert _titles(articles) == ['Artigo em dia']
+    assert scraper.source_reports['Lenta']['status'] == 'timeout'
+    assert scraper.source_health.report()['Lenta']['failures'] == 1
+
+
+class FakeSupabase:
+    """Cliente mínimo da tabela news_articles: registra as chamadas e guarda as linhas por URL."""
+
+    def __init__(self, date_format=None):
+        self.rows = {}
+        self.calls = []
+        # Como o Postgres devolve timestamptz: mesmo instante, outro formato
+        self.date_format = date_format
+
+    def table(self, name):
+        assert name == 'news_articles'
+        return FakeQuery(self)
+
+
+class FakeQuery:
+    def __init__(self, db):
+        self.db = db
+        self.op = None
+
+    def select(self, fields):
+        self.op, self.fields = 'select', fields.split(',')
+        return self
+
+    def in_(self, column, values):
+        self.urls = values
+        return self
+
+    def insert(self, rows):
+        self.op, self.payload = 'insert', rows
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self.op, self.payload = 'upsert', rows
+        return self
+
+    def execute(self):
+        self.db.calls.append(self.op)
+        data = []
+        if self.op == 'select':
+            for url in self.urls:
+                if url in self.db.rows:
+                    row = {f: self.db.rows[url].get(f) for f in self.fields}
+                    if 'date' in row and self.db.date_format:
+                        row['date'] = self.db.date_format(row['date'])
+                    data.append(row)
+        else:
+            for row in self.payload:
+                assert self.op == 'upsert' or row['url'] not in self.db.rows
+                self.db.rows[row['url']] = dict(row)
+        return type('Result', (), {'data': data})()
+
+
+def _recent_articles(count):
+    now = news_scraper.datetime.now(news_scraper.timezone.utc).replace(microsecond=0)
+    return [
+        dict(_article(f'Notícia {i}', url=f'https://exemplo.org/noticia-{i}'),
+             date=(now - news_scraper.timedelta(minutes=i)).strftime('%Y-%m-%dT%H:%M:%SZ'))
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize('mode', ['lookup', 'upsert'])
+def test_save_to_supabase_batches_and_skips_unchanged(scraper, mode):
+    scraper.supabase_batch_size = 50
+    scraper.supabase_write_mode = mode
+    scraper.supabase = db = FakeSupabase(date_format=lambda d: d.replace('Z', '+00:00'))
+    articles = _recent_articles(120)
+
+    assert scraper.save_to_supabase(articles) == {'inserted': 120, 'updated': 0, 'skipped': 0}
+    write = 'upsert' if mode == 'upsert' else 'insert'
+    assert db.calls == ['select', write] * 3
+
+    db.calls.clear()
+    assert scraper.save_to_supabase(articles) == {'inserted': 0, 'updated': 0, 'skipped': 120}
+    assert db.calls == ['select'] * 3
+
+
+def test_save_to_supabase_upserts_only_changed_rows(scraper):
+    scraper.supabase_write_mode = 'upsert'
+    scraper.supabase = db = FakeSupabase(date_format=lambda d: d.replace('Z', '+00:00'))
+    articles = _recent_articles(10)
+    scraper.save_to_supabase(articles)
+
+    db.calls.clear()
+    articles[3]['summary'] = 'Resumo revisado pela fonte.'
+    articles.append(_recent_articles(11)[10])
+    assert scraper.save_to_supabase(articles) == {'inserted': 1, 'updated': 1, 'skipped': 9}
+    assert db.calls == ['select', 'upsert']
+    assert db.rows[articles[3]['url']]['summary'] == 'Resumo revisado pela fonte.'
+
+
+def test_output_policy_is_applied_once(scraper, monkeypatch):
+    articles = [dict(a, image_url='https://exemplo.org/imagem.jpg', title=f'Igreja celebra culto {i}')
+                for i, a in enumerate(_recent_articles(6))]
+    monkeypatch.setattr(scraper, 'run_sources', lambda scrapers: [dict(a) for a in articles])
+    calls = []
+    filter_for_output = scraper.filter_for_output
+    monkeypatch.setattr(scraper, 'filter_for_output', lambda items: calls.append(len(items)) or filter_for_output(items))
+
+    output = scraper.build_output(scraper.scrape_all_sources())
+
+    assert calls == [6]
+    assert len(output.articles) == 6
+
+
+def test_date_cache_is_cleared_between_runs(scraper, monkeypatch):
+    monkeypatch.setattr(scraper, 'run_sources', lambda scrapers: [])
+    monkeypatch.setattr(scraper, 'get_fallback_news', lambda: [])
+    news_scraper.parse_date_utc('17 de outubro')
+    assert news_scraper.parse_date_utc.cache_info().currsize > 0
+    scraper.scrape_all_sources()
+    assert news_scraper.parse_date_utc.cache_info().currsize == 0
+
+
+def test_fetch_stage_counts_articles_on_both_sides(scraper, monkeypatch):
+    articles = _recent_articles(4)
+    monkeypatch.setattr(scraper, 'run_sources', lambda scrapers: [dict(a) for a in articles])
+    monkeypatch.setattr(scraper, 'resolve_output_images', lambda items: items)
+    scraper.scrape_all_sources()
+    fetch = scraper.pipeline_stats['fetch']
+    assert (fetch['in'], fetch['out']) == (4, 4)
+    assert fetch['sources'] > 0
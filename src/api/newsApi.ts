@@ -37,6 +37,7 @@ export interface NewsData {
   last_updated: string;
   total_articles: number;
   sources: string[];
+  categories?: Record<string, number>;
   articles: NewsItem[];
 }
 
@@ -72,6 +73,24 @@ class NewsAPI {
     weights: { location: 3, topic: 2, general: 1 }
   };
 
+  // Mesma regra do KeywordMatcher do scraper (scripts/news_scraper.py): sem diferenciar maiúsculas
+  // nem acentos, e o termo precisa começar uma palavra, podendo ser prefixo dela ('roma' → 'romano')
+  private static normalizeText(text: string): string {
+    return (text || '').normalize('NFKD').replace(/[\u0300-\u036f]/g, '').toLowerCase();
+  }
+
+  private readonly keywordPatterns = new Map<string, RegExp>(
+    [...this.archaeologyKeywords.locations, ...this.archaeologyKeywords.topics].map(keyword => {
+      const parts = NewsAPI.normalizeText(keyword).split(/\s+/)
+        .map(part => part.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+      return [keyword, new RegExp(`(?<![\\p{L}\\p{N}_])${parts.join('\\s+')}`, 'u')];
+    })
+  );
+
+  private matchesKeyword(normalizedText: string, keyword: string): boolean {
+    return this.keywordPatterns.get(keyword)?.test(normalizedText) ?? false;
+  }
+
   // Persistência local para política de retenção de 12h e blacklist permanente
   private readonly BLACKLIST_KEY = 'newsBlacklist';
   private readonly FIRST_SEEN_KEY = 'newsFirstSeen';
@@ -179,14 +198,18 @@ class NewsAPI {
 
   // Sistema de scoring e categorização automática
   private calculateRelevanceScore(item: NewsItem): NewsItem {
-    const text = `${item.title} ${item.summary}`.toLowerCase();
+    // Pontuação já calculada pelo scraper (mesmos termos, pesos e regra de casamento): reaproveita
+    if (typeof item.relevanceScore === 'number' && Array.isArray(item.detectedKeywords)) {
+      return item;
+    }
+    const text = NewsAPI.normalizeText(`${item.title} ${item.summary}`);
     let score = 0;
     const detectedKeywords: string[] = [];
     const autoTags: string[] = [];
 
     // Detecta palavras-chave de localizações arqueológicas
     this.archaeologyKeywords.locations.forEach(keyword => {
-      if (text.includes(keyword)) {
+      if (this.matchesKeyword(text, keyword)) {
         score += this.archaeologyKeywords.weights.location;
         detectedKeywords.push(keyword);
         
@@ -203,7 +226,7 @@ class NewsAPI {
 
     // Detecta palavras-chave de tópicos
     this.archaeologyKeywords.topics.forEach(keyword => {
-      if (text.includes(keyword)) {
+      if (this.matchesKeyword(text, keyword)) {
         score += this.archaeologyKeywords.weights.topic;
         detectedKeywords.push(keyword);
         